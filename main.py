@@ -1,19 +1,37 @@
 import customtkinter as ctk
 import logging
+import os
 from src.ui.login_window import LoginWindow
-from src.ui.main_window import MainWindow 
 from src.services.auth_service import AuthService
-from src.database.supabase_client import get_supabase_client
-from config import BACKGROUND_PRIMARY, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT, START_MAXIMIZED, TRANSPARENT_BG
+from src.database.supabase_client import get_supabase_client, load_supabase_config, use_fake_supabase
+from src.database.query_executor import QueryExecutor
+from src.database.local_cache import LocalCache
+from src.database.delta_sync import DeltaSync
+from src.ui.asset_cache import preload_assets
+from config import BACKGROUND_PRIMARY, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT, START_MAXIMIZED, TRANSPARENT_BG, FONT_SIZE_NORMAL
+from src.ui.styles import get_font
+from src.ui import theme
+from src.database import query_profiler
+from src.services.system_metrics import MainLoopMonitor
+from src.services.stall_watchdog import StallWatchdog
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class App(ctk.CTk):
     def __init__(self, supabase_client, auth_service):
         super().__init__()
+        # La paleta guardada se aplica antes de construir cualquier widget
+        theme.set_theme(theme.load_preference(), persist=False)
+        theme.install(self)
         self.supabase_client = supabase_client
         self.auth_service = auth_service
         self.current_frame = None
+        # Todas las consultas de las páginas pasan por este executor
+        self.query_executor = QueryExecutor(self)
+        self.local_cache = LocalCache()
+        self.delta_sync = DeltaSync(supabase_client, self.local_cache)
+        # El scheduler de AuthService corre en su propio hilo: el aviso vuelve a Tk por el executor
+        self.auth_service.on_session_lost = lambda: self.query_executor.call_soon(self._on_session_refreshed, None)
 
         # === CONFIGURACIÓN DE VENTANA MEJORADA ===
         self.title("BuildMate - Administrador de Proyectos de Construcción")
@@ -34,13 +52,22 @@ class App(ctk.CTk):
             self.geometry(f"{WINDOW_MIN_WIDTH}x{WINDOW_MIN_HEIGHT}")
             self.center_window()
         
-       
-        ctk.set_appearance_mode("light")
-        
         # === CONFIGURACIÓN DE EVENTOS ===
         # Cambiar Escape para minimizar en lugar de cerrar (mejor UX)
         self.bind("<Escape>", self.minimize_window)
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
+        # Cada clic marca las consultas que dispara (ver query_profiler.py)
+        self.bind_all("<Button-1>", self._tag_user_action, add="+")
+        self.bind_all("<ButtonRelease-1>", self._end_user_action, add="+")
+        self.bind_all("<Control-Shift-D>", self.open_query_profiler, add="+")
+        self._query_profiler_window = None
+        # Cuenta los bloqueos del loop de Tk (se muestran en Configuración) y
+        # registra en ~/.proyecto_manager/stalls.log la pila que los causó
+        stall_threshold_ms = float(os.environ.get("STALL_THRESHOLD_MS", 100))
+        self.loop_monitor = MainLoopMonitor(self, stall_threshold_ms=stall_threshold_ms)
+        self.loop_monitor.start()
+        self.stall_watchdog = StallWatchdog(self.loop_monitor, threshold_ms=stall_threshold_ms)
+        self.stall_watchdog.start()
         
         # === CONFIGURACIÓN DE ICONO ===
         try:
@@ -69,18 +96,59 @@ class App(ctk.CTk):
         self.geometry(f"{window_width}x{window_height}+{x}+{y}")
 
     def check_session(self):
-        """Verifica si hay una sesión activa guardada"""
+        """
+        Verifica si hay una sesión guardada. Si su access token sigue vigente
+        se muestra la ventana principal de inmediato y la sesión se refresca en
+        segundo plano; el login aparece sólo si el refresco falla.
+        """
         try:
-            session = self.auth_service.load_session()
-            if session:
-                logging.info("Sesión activa encontrada, iniciando aplicación principal")
+            if self.auth_service.load_cached_session():
+                logging.info("Sesión vigente en cache, iniciando aplicación principal")
                 self.show_main_window()
+            elif self.auth_service.has_saved_session():
+                logging.info("Sesión guardada vencida, refrescando en segundo plano")
+                self._show_restoring_session()
             else:
                 logging.info("No hay sesión activa, mostrando login")
                 self.show_login_window()
+                return
         except Exception as e:
             logging.error(f"Error al cargar la sesión: {e}")
             self.show_login_window()
+            return
+
+        self.query_executor.submit(
+            self.auth_service.refresh_stored_session,
+            on_success=self._on_session_refreshed,
+            on_error=self._on_session_refresh_error
+        )
+
+    def _show_restoring_session(self):
+        """Indicador liviano mientras se refresca una sesión vencida."""
+        self._cleanup_current_frame()
+        self.current_frame = ctk.CTkLabel(
+            self, text="⏳ Restaurando sesión...", font=get_font(size=FONT_SIZE_NORMAL)
+        )
+        self.current_frame.place(relx=0.5, rely=0.5, anchor="center")
+
+    def _on_session_refreshed(self, session):
+        if not session:
+            logging.info("La sesión guardada ya no es válida, mostrando login")
+            was_restoring = isinstance(self.current_frame, ctk.CTkLabel)
+            self.show_login_window()
+            if not was_restoring:
+                import tkinter.messagebox as msgbox
+                msgbox.showinfo("Sesión Expirada", "Tu sesión expiró. Vuelve a iniciar sesión.")
+        elif isinstance(self.current_frame, ctk.CTkLabel):
+            self.show_main_window()
+
+    def _on_session_refresh_error(self, error):
+        # Falla de red: con un token vigente se sigue trabajando con lo cacheado
+        if self.auth_service.current_session:
+            logging.warning(f"No se pudo refrescar la sesión, se reintentará más tarde: {error}")
+        else:
+            logging.error(f"No se pudo restaurar la sesión: {error}")
+            self.show_login_window()
 
     def _cleanup_current_frame(self):
         """Limpia el frame actual antes de mostrar uno nuevo"""
@@ -113,12 +181,31 @@ class App(ctk.CTk):
         
         logging.info("Mostrando ventana principal")
         
+        # Se importa aquí: la ventana principal y sus páginas no hacen falta para el login
+        from src.ui.main_window import MainWindow
+
         # Crear la ventana principal
         self.current_frame = MainWindow(self)
         self.current_frame.pack(fill="both", expand=True)
         
         logging.info("Ventana principal configurada correctamente")
         
+    def _tag_user_action(self, event):
+        query_profiler.set_action(query_profiler.action_from_widget(event.widget))
+
+    def _end_user_action(self, event):
+        # Los botones ejecutan su comando al soltar el clic; terminado el evento,
+        # lo que se consulte después (sincronización, refresco de sesión,
+        # cargas con after) se atribuye a "fondo" y no al último clic
+        self.after_idle(query_profiler.set_action, "fondo")
+
+    def open_query_profiler(self, event=None):
+        """Abre (o trae al frente) el panel de consultas por acción"""
+        from src.ui.windows.query_profiler_window import QueryProfilerWindow
+        if self._query_profiler_window is None or not self._query_profiler_window.winfo_exists():
+            self._query_profiler_window = QueryProfilerWindow(self)
+        self._query_profiler_window.lift()
+        
     def minimize_window(self, event=None):
         """Minimiza la ventana (mejor UX que cerrar con Escape)"""
         self.iconify()
@@ -130,7 +217,7 @@ class App(ctk.CTk):
             import tkinter.messagebox as msgbox
             
             # Solo mostrar confirmación si hay sesión activa
-            if hasattr(self, 'current_frame') and isinstance(self.current_frame, MainWindow):
+            if self.current_frame is not None and not isinstance(self.current_frame, (LoginWindow, ctk.CTkLabel)):
                 result = msgbox.askyesno(
                     "Cerrar Aplicación", 
                     "¿Estás seguro que deseas cerrar BuildMate?",
@@ -153,13 +240,24 @@ class App(ctk.CTk):
         except Exception as e:
             logging.error(f"Error al cerrar aplicación: {e}")
         finally:
+            # QUERY_PROFILE_FILE=ruta.json guarda el perfil de consultas de la sesión
+            profile_path = os.environ.get("QUERY_PROFILE_FILE")
+            if profile_path:
+                try:
+                    query_profiler.profiler.dump(profile_path)
+                except Exception as e:
+                    logging.error(f"No se pudo guardar el perfil de consultas: {e}")
+            self.auth_service.stop_refresh_scheduler()
+            self.stall_watchdog.stop()
+            self.loop_monitor.stop()
+            self.query_executor.shutdown()
+            self.local_cache.close()
             self.quit()
             self.destroy()
 
 def configure_app_theme():
     """Configura el tema global de la aplicación"""
-    # Configurar tema claro para trabajar mejor con los nuevos colores
-    ctk.set_appearance_mode("light")
+    # El modo claro/oscuro lo fija theme.set_theme según la preferencia guardada
     ctk.set_default_color_theme("blue")
     
     # Configuración para pantallas de alta resolución (Windows)
@@ -174,10 +272,15 @@ def main():
     
     # Configurar tema antes de crear ventanas
     configure_app_theme()
+    # Decodificar logo e íconos en segundo plano mientras se crean los servicios
+    preload_assets()
     
     try:
         # Inicializar servicios
         logging.info("Inicializando servicios...")
+        # Sólo se validan las credenciales; el cliente se crea en la primera consulta
+        if not use_fake_supabase():
+            load_supabase_config()
         supabase_client = get_supabase_client()
         auth_service = AuthService(supabase_client)
         logging.info("Servicios inicializados correctamente")
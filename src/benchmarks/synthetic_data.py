@@ -0,0 +1,106 @@
+# src/benchmarks/synthetic_data.py
+
+import argparse
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+# Tamaños por defecto: un usuario grande con un proyecto de detalle muy cargado
+DEFAULT_SCALE = {
+    'projects': 5000,
+    'master_areas': 60,
+    'areas_per_project': 4,
+    'detail_areas': 300,      # áreas del proyecto 1, el que abre el benchmark de detalle
+    'doors_per_area': 1,
+    'windows_per_area': 2,
+}
+
+_AREA_NAMES = [
+    "Cocina", "Baño", "Dormitorio", "Living", "Comedor", "Lavadero", "Garage",
+    "Estudio", "Quincho", "Galería", "Hall", "Pasillo", "Vestidor", "Depósito",
+]
+_STREETS = ["San Martín", "Belgrano", "Rivadavia", "Mitre", "Sarmiento", "Moreno", "Urquiza"]
+
+
+def generate_dataset(seed=0, **scale):
+    """
+    Genera {tabla: [filas]} con la forma de las tablas de Supabase, lista para
+    FakeDatabase.load o para volcar a un JSON (SUPABASE_FAKE_DATA). Con la
+    misma semilla y escala el resultado es siempre el mismo.
+    """
+    scale = dict(DEFAULT_SCALE, **scale)
+    rng = random.Random(seed)
+    start = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+    areas_maestro = [
+        {'id_area_maestro': i + 1, 'nombre_area': f"{_AREA_NAMES[i % len(_AREA_NAMES)]} {i // len(_AREA_NAMES) + 1}"}
+        for i in range(scale['master_areas'])
+    ]
+
+    proyectos = []
+    for i in range(scale['projects']):
+        created = (start + timedelta(minutes=rng.randrange(3 * 365 * 24 * 60))).isoformat()
+        proyectos.append({
+            'id_proyecto': i + 1,
+            'nombre_proyecto': f"Proyecto {i + 1:05d}",
+            'direccion_proyecto': f"{rng.choice(_STREETS)} {rng.randint(1, 4000)}",
+            'fecha_creacion': created,
+            'updated_at': created,
+            'deleted_at': None,
+        })
+
+    proyectos_areas, puertas, ventanas = [], [], []
+    for proyecto in proyectos:
+        count = scale['detail_areas'] if proyecto['id_proyecto'] == 1 else scale['areas_per_project']
+        for _ in range(count):
+            area_id = len(proyectos_areas) + 1
+            proyectos_areas.append({
+                'id_proyectos_areas': area_id,
+                'proyecto_id': proyecto['id_proyecto'],
+                'area_maestro_id': rng.randint(1, scale['master_areas']) if scale['master_areas'] else None,
+                'ancho': round(rng.uniform(2, 8), 2),
+                'largo': round(rng.uniform(2, 10), 2),
+                'alto': round(rng.uniform(2.4, 3.2), 2),
+            })
+            for _ in range(scale['doors_per_area']):
+                puertas.append({
+                    'id_puertas': len(puertas) + 1, 'proyectos_areas_id': area_id,
+                    'ancho': rng.choice([0.7, 0.8, 0.9]), 'alto': 2.05,
+                })
+            for _ in range(scale['windows_per_area']):
+                ventanas.append({
+                    'id_ventanas': len(ventanas) + 1, 'proyectos_areas_id': area_id,
+                    'ancho': round(rng.uniform(0.6, 2.0), 2), 'alto': round(rng.uniform(0.6, 1.5), 2),
+                })
+
+    return {
+        'areas_maestro': areas_maestro,
+        'proyectos': proyectos,
+        'proyectos_areas': proyectos_areas,
+        'puertas': puertas,
+        'ventanas': ventanas,
+    }
+
+
+def add_scale_arguments(parser):
+    """Agrega un argumento por cada tamaño de DEFAULT_SCALE (p. ej. --detail-areas)."""
+    for key, value in DEFAULT_SCALE.items():
+        parser.add_argument(f"--{key.replace('_', '-')}", type=int, default=value)
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def scale_from_args(args):
+    return {key: getattr(args, key) for key in DEFAULT_SCALE}
+
+
+if __name__ == "__main__":
+    # python -m src.benchmarks.synthetic_data --projects 5000 -o datos.json
+    parser = argparse.ArgumentParser(description="Genera un dataset sintético para el cliente falso de Supabase")
+    add_scale_arguments(parser)
+    parser.add_argument("-o", "--output", default="synthetic_data.json")
+    args = parser.parse_args()
+
+    data = generate_dataset(seed=args.seed, **scale_from_args(args))
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    print(", ".join(f"{table}: {len(rows)}" for table, rows in data.items()))
@@ -0,0 +1,241 @@
+# src/benchmarks/ui_benchmark.py
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.benchmarks.synthetic_data import add_scale_arguments, generate_dataset, scale_from_args
+from src.services.system_metrics import count_widgets
+from src.ui.styles import get_style_stats
+
+# Método de cada página que marca que los datos ya están en pantalla
+READY_HOOKS = {
+    "proyectos": "_on_page_loaded",
+    "areas": "_render_master_areas",
+    "detalle_proyecto": "_render_project_areas",
+}
+
+WINDOW_SIZE = "1280x800"
+
+
+class _BenchmarkApp:
+    """Lo mínimo de `App` que las páginas leen de `master_app`."""
+
+    def __init__(self, root, supabase_client, cache_path):
+        from src.database.delta_sync import DeltaSync
+        from src.database.local_cache import LocalCache
+        from src.database.query_executor import QueryExecutor
+
+        self.supabase_client = supabase_client
+        self.query_executor = QueryExecutor(root)
+        self.local_cache = LocalCache(db_path=cache_path)
+        self.delta_sync = DeltaSync(supabase_client, self.local_cache)
+
+    def shutdown(self):
+        self.query_executor.shutdown()
+        self.local_cache.close()
+
+
+def _with_ready_hook(page_class, method_name, on_ready):
+    """Subclase de la página que avisa la primera vez que pinta datos."""
+    original = getattr(page_class, method_name)
+
+    def hooked(self, *args, **kwargs):
+        result = original(self, *args, **kwargs)
+        on_ready()
+        return result
+
+    return type(page_class.__name__, (page_class,), {method_name: hooked})
+
+
+def _page_kwargs(page_name, dataset):
+    if page_name == "proyectos":
+        return {'on_create_new': lambda: None, 'on_view_details': lambda proyecto: None}
+    if page_name == "detalle_proyecto":
+        return {'proyecto': dataset['proyectos'][0], 'on_back': lambda: None}
+    return {}
+
+
+def peak_rss_mb():
+    """Pico de memoria residente del proceso, o None si la plataforma no lo expone."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux lo informa en KB y macOS en bytes
+        return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return round(getattr(info, "peak_wset", info.rss) / (1024 * 1024), 1)
+    except ImportError:
+        return None
+
+
+def _measure_theme_switch(root):
+    """Cambia a oscuro y vuelve a claro con la página dibujada; ms de cada cambio hasta pintar."""
+    from src.ui import theme
+
+    timings = {}
+    for mode in ("dark", "light"):
+        start = time.perf_counter()
+        theme.set_theme(mode, root, persist=False)
+        root.update_idletasks()
+        timings[mode] = round((time.perf_counter() - start) * 1000, 1)
+    return timings
+
+
+def run_page(page_name, scale, seed=0, latency_ms=0, timeout_s=60):
+    """
+    Construye una página sobre el cliente falso cargado con datos sintéticos y
+    mide (en este proceso, con cache local vacío):
+      - build_ms: construir la página hasta el primer `update_idletasks`
+      - first_paint_ms: hasta que los datos están dibujados
+      - widget_count: widgets de Tk vivos en la ventana
+      - theme_switch_ms: cambio a tema oscuro y de vuelta a claro (objetivo < 100 ms)
+      - fonts_created / font_requests: fuentes de Tk creadas frente a pedidas (styles.py)
+      - peak_rss_mb: pico de memoria (incluye las tablas en memoria del backend;
+        baseline_peak_rss_mb es el pico antes de construir la página)
+    """
+    import customtkinter as ctk
+    from src.database.fake_supabase import FakeSupabaseClient
+    from src.ui import theme
+    from src.ui.main_window import load_page_class
+
+    dataset = generate_dataset(seed=seed, **scale)
+    client = FakeSupabaseClient(latency_ms=latency_ms)
+    client.database.load(dataset)
+
+    # Las páginas se miden en tema claro, como arranca la app por defecto
+    theme.set_theme("light", persist=False)
+    root = ctk.CTk()
+    root.geometry(WINDOW_SIZE)
+    root.update()
+    page_class = load_page_class(page_name)
+    baseline_rss = peak_rss_mb()
+
+    ready_at = []
+    page_class = _with_ready_hook(page_class, READY_HOOKS[page_name], lambda: ready_at or ready_at.append(time.perf_counter()))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = _BenchmarkApp(root, client, Path(tmp) / "cache.db")
+        start = time.perf_counter()
+        page = page_class(root, app, **_page_kwargs(page_name, dataset))
+        page.pack(fill="both", expand=True)
+        root.update_idletasks()
+        build_s = time.perf_counter() - start
+
+        while not ready_at and time.perf_counter() - start < timeout_s:
+            root.update()
+            time.sleep(0.001)
+        root.update_idletasks()
+        root.update()
+        first_paint_s = time.perf_counter() - start if ready_at else None
+        theme_switch_ms = _measure_theme_switch(root)
+
+        result = {
+            'build_ms': round(build_s * 1000, 1),
+            'first_paint_ms': round(first_paint_s * 1000, 1) if first_paint_s is not None else None,
+            'widget_count': count_widgets(root),
+            'theme_switch_ms': theme_switch_ms,
+            **get_style_stats(),
+            'baseline_peak_rss_mb': baseline_rss,
+            'peak_rss_mb': peak_rss_mb(),
+        }
+        app.shutdown()
+    root.destroy()
+    return result
+
+
+def start_virtual_display():
+    """
+    Arranca un Xvfb propio si no hay DISPLAY (Linux). Devuelve el proceso
+    para cerrarlo al final, o None si ya hay una pantalla disponible.
+    """
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        return None
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        raise RuntimeError("No hay DISPLAY ni Xvfb instalado: instala xvfb para correr el benchmark sin pantalla")
+
+    display = 90 + os.getpid() % 100
+    process = subprocess.Popen(
+        [xvfb, f":{display}", "-screen", "0", "1600x1000x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    socket_path = Path(f"/tmp/.X11-unix/X{display}")
+    deadline = time.monotonic() + 5
+    while not socket_path.exists():
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            raise RuntimeError(f"Xvfb no pudo iniciar la pantalla :{display}")
+        time.sleep(0.05)
+    os.environ["DISPLAY"] = f":{display}"
+    return process
+
+
+def run_suite(pages, scale, seed=0, latency_ms=0):
+    """Corre cada página en un proceso aparte (para que el pico de RSS sea sólo suyo)."""
+    display = start_virtual_display()
+    try:
+        results = {}
+        for page_name in pages:
+            command = [
+                sys.executable, "-m", "src.benchmarks.ui_benchmark", "--child", page_name,
+                "--seed", str(seed), "--latency-ms", str(latency_ms),
+            ]
+            for key, value in scale.items():
+                command += [f"--{key.replace('_', '-')}", str(value)]
+            completed = subprocess.run(command, capture_output=True, text=True)
+            if completed.returncode != 0:
+                results[page_name] = {'error': completed.stderr.strip().splitlines()[-1:] or "falló"}
+                continue
+            results[page_name] = json.loads(completed.stdout.strip().splitlines()[-1])
+    finally:
+        if display is not None:
+            display.terminate()
+
+    return {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'latency_ms': latency_ms,
+        'scale': scale,
+        'pages': results,
+    }
+
+
+def main(argv=None):
+    # python -m src.benchmarks.ui_benchmark --projects 5000 --detail-areas 300 -o reporte.json
+    parser = argparse.ArgumentParser(description="Benchmark de páginas con datos sintéticos")
+    add_scale_arguments(parser)
+    parser.add_argument("--pages", nargs="+", default=list(READY_HOOKS), choices=list(READY_HOOKS))
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("-o", "--output", help="archivo JSON del reporte (por defecto, stdout)")
+    parser.add_argument("--child", choices=list(READY_HOOKS), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    scale = scale_from_args(args)
+
+    if args.child:
+        print(json.dumps(run_page(args.child, scale, args.seed, args.latency_ms)))
+        return
+
+    report = json.dumps(run_suite(args.pages, scale, args.seed, args.latency_ms), indent=2)
+    if args.output:
+        Path(args.output).write_text(report, encoding="utf-8")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
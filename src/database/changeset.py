@@ -0,0 +1,102 @@
+# src/database/changeset.py
+
+import logging
+
+
+class ChangeSet:
+    """
+    Cambios pendientes de una tabla: filas a insertar/actualizar y claves a
+    eliminar. Cada cambio puede llevar una referencia (`ref`) del llamador,
+    por ejemplo la fila de la UI, para poder reportar errores por fila.
+    """
+
+    def __init__(self, table_name, pk_name):
+        self.table_name = table_name
+        self.pk_name = pk_name
+        self.upserts = []   # [(fila, ref)]
+        self.deletes = []   # [(pk, ref)]
+
+    def add_upsert(self, row, ref=None):
+        self.upserts.append((row, ref))
+
+    def add_delete(self, pk_value, ref=None):
+        self.deletes.append((pk_value, ref))
+
+    def is_empty(self):
+        return not self.upserts and not self.deletes
+
+
+class ChangeSetResult:
+    """Resultado de aplicar un ChangeSet."""
+
+    def __init__(self, changeset):
+        self.changeset = changeset
+        self.saved = []     # [(ref, fila devuelta por el servidor)]
+        self.deleted = []   # [ref]
+        self.errors = []    # [(ref, mensaje)]
+
+    @property
+    def ok(self):
+        return not self.errors
+
+
+def apply_changeset(supabase_client, changeset):
+    """
+    Aplica un ChangeSet con a lo sumo dos requests: un `delete ... in (...)`
+    y un `upsert` masivo (las filas sin clave primaria toman el default de la
+    columna). Si una operación masiva falla, se reintenta fila por fila sólo
+    para identificar cuáles fallaron. Pensado para correr en el QueryExecutor.
+    """
+    result = ChangeSetResult(changeset)
+    table = changeset.table_name
+    pk_name = changeset.pk_name
+
+    if changeset.deletes:
+        ids = [pk for pk, _ in changeset.deletes]
+        try:
+            supabase_client.table(table).delete().in_(pk_name, ids).execute()
+            result.deleted.extend(ref for _, ref in changeset.deletes)
+        except Exception as e:
+            logging.warning(f"Falló el borrado masivo en '{table}', reintentando por fila: {e}")
+            for pk, ref in changeset.deletes:
+                try:
+                    supabase_client.table(table).delete().eq(pk_name, pk).execute()
+                    result.deleted.append(ref)
+                except Exception as row_error:
+                    result.errors.append((ref, str(row_error)))
+
+    if changeset.upserts:
+        rows = [row for row, _ in changeset.upserts]
+        try:
+            saved_rows = supabase_client.table(table).upsert(rows, default_to_null=False).execute().data
+            result.saved.extend(_match_saved_rows(pk_name, changeset.upserts, saved_rows))
+        except Exception as e:
+            logging.warning(f"Falló el upsert masivo en '{table}', reintentando por fila: {e}")
+            for row, ref in changeset.upserts:
+                try:
+                    saved_rows = supabase_client.table(table).upsert(row, default_to_null=False).execute().data
+                    result.saved.append((ref, saved_rows[0] if saved_rows else row))
+                except Exception as row_error:
+                    result.errors.append((ref, str(row_error)))
+
+    return result
+
+
+def _match_saved_rows(pk_name, upserts, saved_rows):
+    """
+    Empareja cada fila enviada con la devuelta por el servidor sin depender
+    del orden de la respuesta: las actualizaciones por clave primaria y las
+    inserciones (sin clave) con las filas de claves nuevas, en orden. Si no
+    hay fila devuelta para un cambio se reporta la fila enviada.
+    """
+    by_pk = {str(saved[pk_name]): saved for saved in saved_rows if saved.get(pk_name) is not None}
+    sent_pks = {str(row[pk_name]) for row, _ in upserts if row.get(pk_name) is not None}
+    inserted = iter([saved for saved in saved_rows if str(saved.get(pk_name)) not in sent_pks])
+
+    matched = []
+    for row, ref in upserts:
+        if row.get(pk_name) is not None:
+            matched.append((ref, by_pk.get(str(row[pk_name]), row)))
+        else:
+            matched.append((ref, next(inserted, row)))
+    return matched
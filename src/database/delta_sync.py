@@ -0,0 +1,164 @@
+# src/database/delta_sync.py
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+# Configuración de sincronización por tabla. Cada tabla necesita en Supabase
+# (ver supabase/migrations/20251001000000_proyectos_delta_sync.sql):
+#   - una columna `updated_at timestamptz` mantenida por un trigger en cada
+#     INSERT/UPDATE, y
+#   - una columna `deleted_at timestamptz` (tombstone) en lugar de borrar
+#     físicamente, para que las bajas también viajen en el delta.
+# Si la base todavía no tiene esas columnas se trae la tabla completa.
+SYNC_TABLES = {
+    "proyectos": {"pk": "id_proyecto", "updated_field": "updated_at", "tombstone_field": "deleted_at"},
+}
+
+# Marca de agua de una tabla sincronizada que todavía no tenía filas
+EPOCH_WATERMARK = "1970-01-01T00:00:00+00:00"
+
+# `updated_at` es el momento de la escritura, no del commit: una transacción
+# que confirma después de una sincronización puede traer filas con un
+# `updated_at` anterior a la marca de agua. Cada delta vuelve a pedir esta
+# ventana hacia atrás (debe cubrir la transacción más larga sobre la tabla);
+# la fusión es idempotente.
+SYNC_OVERLAP_SECONDS = 60
+
+
+def is_missing_column_error(error, column):
+    """Indica si `error` es el de PostgREST por filtrar u ordenar por una columna inexistente."""
+    message = str(getattr(error, "message", None) or error)
+    return column in message and (getattr(error, "code", None) == "42703" or "does not exist" in message)
+
+
+def _watermark_key(watermark):
+    try:
+        moment = datetime.fromisoformat(watermark)
+    except ValueError:
+        return datetime.fromtimestamp(0, timezone.utc)
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def _shift_watermark(watermark, seconds):
+    """Corre una marca de agua ISO 8601 `seconds` segundos; si no se puede leer la deja igual."""
+    try:
+        return (datetime.fromisoformat(watermark) + timedelta(seconds=seconds)).isoformat()
+    except ValueError:
+        return watermark
+
+
+class DeltaSync:
+    """
+    Sincronización incremental: guarda por tabla la marca de agua del último
+    `updated_at` recibido y en cada visita sólo pide las filas modificadas
+    desde entonces, fusionándolas con el conjunto guardado en LocalCache.
+    """
+
+    def __init__(self, supabase_client, local_cache):
+        self.supabase_client = supabase_client
+        self.local_cache = local_cache
+        # Se incrementa con cada escritura propia, para que las vistas en cache
+        # sepan que tienen que volver a leer el conjunto local
+        self._local_versions = {}
+        # Tablas cuya base no tiene las columnas del delta en esta sesión, y
+        # columnas (tabla, columna) que la base rechazó por inexistentes
+        self._full_fetch_tables = set()
+        self._missing_columns = set()
+
+    def has_local(self, table_name):
+        """Indica si la tabla ya se sincronizó al menos una vez."""
+        return self.local_cache.get_watermark(table_name) is not None
+
+    def local_page(self, table_name, keyset, cursor=None, limit=30):
+        """Página del conjunto sincronizado localmente (keyset descendente), sin tocar la red."""
+        return self.local_cache.get_synced_page(table_name, keyset, cursor=cursor, limit=limit)
+
+    def local_count(self, table_name):
+        return self.local_cache.count_synced_rows(table_name)
+
+    def local_version(self, table_name):
+        return self._local_versions.get(table_name, 0)
+
+    def column_missing(self, table_name, column):
+        return (table_name, column) in self._missing_columns
+
+    def mark_column_missing(self, table_name, column):
+        self._missing_columns.add((table_name, column))
+
+    def reset_schema_checks(self):
+        """Vuelve a probar las columnas del delta (por ejemplo, tras aplicar la migración)."""
+        self._full_fetch_tables.clear()
+        self._missing_columns.clear()
+
+    def sync(self, table_name):
+        """
+        Trae las filas cambiadas desde la última sincronización, las fusiona y
+        devuelve cuántas filas cambiaron. Pensado para correr en el QueryExecutor.
+        Si faltan las columnas del delta, trae la tabla completa.
+        """
+        config = SYNC_TABLES[table_name]
+        if table_name not in self._full_fetch_tables:
+            try:
+                return self._sync_delta(table_name, config)
+            except Exception as e:
+                missing = next(
+                    (f for f in (config["updated_field"], config["tombstone_field"]) if is_missing_column_error(e, f)),
+                    None
+                )
+                if missing is None:
+                    raise
+                self.mark_column_missing(table_name, missing)
+                logging.warning(
+                    f"La tabla '{table_name}' no tiene la columna '{missing}' (falta aplicar la migración "
+                    f"de supabase/migrations): se sincroniza completa"
+                )
+                self._full_fetch_tables.add(table_name)
+        return self._sync_full(table_name, config)
+
+    def _sync_delta(self, table_name, config):
+        updated_field = config["updated_field"]
+        watermark = self.local_cache.get_watermark(table_name)
+
+        query = self.supabase_client.table(table_name).select("*")
+        if watermark:
+            query = query.gte(updated_field, _shift_watermark(watermark, -SYNC_OVERLAP_SECONDS))
+        else:
+            # Primera sincronización: no hace falta traer las filas ya borradas
+            query = query.is_(config["tombstone_field"], "null")
+        changed = query.order(updated_field).execute().data
+
+        # Una primera sincronización sin filas también cuenta como hecha: la
+        # marca de época hace que la próxima pida todo lo escrito desde entonces
+        # Las filas de la ventana de solapamiento pueden ser anteriores a la
+        # marca actual: la marca nunca retrocede
+        new_watermark = max(
+            [r[updated_field] for r in changed if r.get(updated_field)] + [watermark or EPOCH_WATERMARK],
+            key=_watermark_key
+        )
+        changed_count = self.local_cache.merge_rows(
+            table_name, config["pk"], changed,
+            watermark=new_watermark, tombstone_field=config["tombstone_field"]
+        )
+        logging.info(f"Sincronización de '{table_name}': {changed_count} filas cambiadas desde {watermark or 'el inicio'}")
+
+        return changed_count
+
+    def _sync_full(self, table_name, config):
+        """Trae la tabla completa y reemplaza el conjunto local (sin columnas de delta)."""
+        rows = self.supabase_client.table(table_name).select("*").execute().data
+        # La marca de agua deja la tabla como sincronizada; si más adelante se
+        # aplica la migración, el delta parte desde este momento
+        changed_count = self.local_cache.replace_rows(
+            table_name, config["pk"], rows, watermark=datetime.now(timezone.utc).isoformat()
+        )
+        logging.info(f"Sincronización completa de '{table_name}': {changed_count} filas cambiadas")
+        return changed_count
+
+    def apply_local_write(self, table_name, rows):
+        """
+        Refleja una escritura propia en el conjunto local sin mover la marca de
+        agua, para no saltear cambios remotos anteriores todavía no recibidos.
+        """
+        config = SYNC_TABLES[table_name]
+        self.local_cache.merge_rows(table_name, config["pk"], rows, tombstone_field=config["tombstone_field"])
+        self._local_versions[table_name] = self.local_version(table_name) + 1
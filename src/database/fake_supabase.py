@@ -0,0 +1,549 @@
+# src/database/fake_supabase.py
+
+import base64
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+# Esquema mínimo de las tablas que usa la app: clave primaria, columnas con
+# índice (búsquedas por igualdad) y claves foráneas para los selects anidados.
+FAKE_SCHEMA = {
+    "proyectos": {
+        "pk": "id_proyecto",
+        "indexes": [],
+        "references": {},
+        "timestamps": ("fecha_creacion", "updated_at"),
+    },
+    "areas_maestro": {
+        "pk": "id_area_maestro",
+        "indexes": [],
+        "references": {},
+    },
+    "proyectos_areas": {
+        "pk": "id_proyectos_areas",
+        "indexes": ["proyecto_id", "area_maestro_id"],
+        "references": {"proyecto_id": "proyectos", "area_maestro_id": "areas_maestro"},
+    },
+    "puertas": {
+        "pk": "id_puertas",
+        "indexes": ["proyectos_areas_id"],
+        "references": {"proyectos_areas_id": "proyectos_areas"},
+    },
+    "ventanas": {
+        "pk": "id_ventanas",
+        "indexes": ["proyectos_areas_id"],
+        "references": {"proyectos_areas_id": "proyectos_areas"},
+    },
+}
+
+
+class FakeAPIError(Exception):
+    """Error con la forma de los de postgrest/gotrue (`status`, `message`)."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+def _now_iso():
+    return datetime.now(timezone.utc).isoformat()
+
+
+# --- Tablas en memoria ---
+
+class _Table:
+    """Filas por clave primaria más índices hash sobre las columnas declaradas."""
+
+    def __init__(self, name, schema):
+        self.name = name
+        self.pk = schema.get("pk", "id")
+        self.references = schema.get("references", {})
+        self.timestamps = schema.get("timestamps", ())
+        self.rows = {}
+        self.indexes = {column: {} for column in schema.get("indexes", [])}
+        self._next_id = 1
+
+    def lookup(self, column, value):
+        """Claves primarias con `column = value`, o None si la columna no tiene índice."""
+        if column == self.pk:
+            key = _coerce_key(value, self.rows)
+            return [key] if key in self.rows else []
+        index = self.indexes.get(column)
+        if index is None:
+            return None
+        return list(index.get(_coerce_key(value, index), ()))
+
+    def insert(self, row):
+        row = dict(row)
+        if row.get(self.pk) is None:
+            row[self.pk] = self._next_id
+        if isinstance(row[self.pk], int):
+            self._next_id = max(self._next_id, row[self.pk] + 1)
+        if row[self.pk] in self.rows:
+            raise FakeAPIError(f'duplicate key value violates unique constraint "{self.name}_pkey"', status=409)
+        now = _now_iso()
+        for column in self.timestamps:
+            row.setdefault(column, now)
+        self.rows[row[self.pk]] = row
+        self._index(row)
+        return row
+
+    def update(self, key, values):
+        row = self.rows[key]
+        self._unindex(row)
+        row.update(values)
+        if "updated_at" in self.timestamps:
+            row["updated_at"] = _now_iso()
+        self._index(row)
+        return row
+
+    def delete(self, key):
+        row = self.rows.pop(key)
+        self._unindex(row)
+        return row
+
+    def _index(self, row):
+        for column, index in self.indexes.items():
+            index.setdefault(row.get(column), set()).add(row[self.pk])
+
+    def _unindex(self, row):
+        for column, index in self.indexes.items():
+            keys = index.get(row.get(column))
+            if keys:
+                keys.discard(row[self.pk])
+
+
+def _coerce_key(value, mapping):
+    """Los filtros de PostgREST viajan como texto: '12' encuentra la clave 12."""
+    if value in mapping:
+        return value
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return value
+    return number if number in mapping else value
+
+
+# --- Filtros ---
+
+def _coerce(filter_value, row_value):
+    if isinstance(filter_value, str):
+        if len(filter_value) >= 2 and filter_value[0] == filter_value[-1] == '"':
+            filter_value = filter_value[1:-1]
+        if isinstance(row_value, bool):
+            return filter_value.lower() == "true"
+        if isinstance(row_value, (int, float)):
+            try:
+                return float(filter_value)
+            except ValueError:
+                return filter_value
+    return filter_value
+
+
+def _matches(row, column, op, value):
+    row_value = row.get(column)
+    if op == "is":
+        expected = None if str(value).lower() == "null" else str(value).lower() == "true"
+        return row_value is expected
+    if op == "in":
+        return any(row_value == _coerce(item, row_value) for item in value)
+    if op == "or":
+        return any(_matches_condition(row, condition) for condition in value)
+    if op == "and":
+        return all(_matches_condition(row, condition) for condition in value)
+    if row_value is None:
+        return False
+    value = _coerce(value, row_value)
+    try:
+        if op == "eq":
+            return row_value == value
+        if op == "neq":
+            return row_value != value
+        if op == "gt":
+            return row_value > value
+        if op == "gte":
+            return row_value >= value
+        if op == "lt":
+            return row_value < value
+        if op == "lte":
+            return row_value <= value
+    except TypeError:
+        return False
+    raise FakeAPIError(f"Operador no soportado: {op}")
+
+
+def _matches_condition(row, condition):
+    column, op, value = condition
+    return _matches(row, column, op, value)
+
+
+def _split_top_level(text):
+    """Divide por comas que no estén entre paréntesis ni comillas."""
+    parts, depth, quoted, current = [], 0, False, []
+    for char in text:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char == "(":
+            depth += 1
+        elif not quoted and char == ")":
+            depth -= 1
+        elif not quoted and depth == 0 and char == ",":
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    if current:
+        parts.append("".join(current).strip())
+    return [part for part in parts if part]
+
+
+def parse_or_filter(text):
+    """Convierte la sintaxis de `or_` (p. ej. 'a.lt.1,and(a.eq.1,b.lt.2)') en condiciones."""
+    conditions = []
+    for part in _split_top_level(text):
+        for group in ("and", "or"):
+            if part.startswith(f"{group}(") and part.endswith(")"):
+                conditions.append((None, group, parse_or_filter(part[len(group) + 1:-1])))
+                break
+        else:
+            column, op, value = part.split(".", 2)
+            conditions.append((column, op, value))
+    return conditions
+
+
+# --- Selects anidados ---
+
+def parse_select(columns):
+    """'*, areas_maestro(nombre_area)' -> (['*'], {'areas_maestro': (['nombre_area'], {})})"""
+    fields, embeds = [], {}
+    for part in _split_top_level(columns or "*"):
+        if "(" in part:
+            name, inner = part.split("(", 1)
+            embeds[name.strip()] = parse_select(inner[:-1])
+        else:
+            fields.append(part)
+    return fields, embeds
+
+
+def _project(row, fields):
+    if "*" in fields:
+        return dict(row)
+    return {field: row.get(field) for field in fields}
+
+
+# --- Constructor de consultas ---
+
+class FakeResponse:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    """Subconjunto fluido de postgrest-py que usa la app."""
+
+    def __init__(self, client, table_name):
+        self._client = client
+        self._table_name = table_name
+        self._operation = "select"
+        self._columns = "*"
+        self._payload = None
+        self._default_to_null = True
+        self._count = None
+        self._filters = []
+        self._orders = []
+        self._limit = None
+        self._offset = 0
+
+    # Operaciones
+    def select(self, columns="*", count=None):
+        self._operation, self._columns, self._count = "select", columns, count
+        return self
+
+    def insert(self, rows, **kwargs):
+        self._operation, self._payload = "insert", rows
+        return self
+
+    def update(self, values, **kwargs):
+        self._operation, self._payload = "update", values
+        return self
+
+    def upsert(self, rows, default_to_null=True, **kwargs):
+        self._operation, self._payload, self._default_to_null = "upsert", rows, default_to_null
+        return self
+
+    def delete(self, **kwargs):
+        self._operation = "delete"
+        return self
+
+    # Filtros
+    def _filter(self, column, op, value):
+        self._filters.append((column, op, value))
+        return self
+
+    def eq(self, column, value):
+        return self._filter(column, "eq", value)
+
+    def neq(self, column, value):
+        return self._filter(column, "neq", value)
+
+    def gt(self, column, value):
+        return self._filter(column, "gt", value)
+
+    def gte(self, column, value):
+        return self._filter(column, "gte", value)
+
+    def lt(self, column, value):
+        return self._filter(column, "lt", value)
+
+    def lte(self, column, value):
+        return self._filter(column, "lte", value)
+
+    def in_(self, column, values):
+        return self._filter(column, "in", list(values))
+
+    def is_(self, column, value):
+        return self._filter(column, "is", value)
+
+    def or_(self, filters):
+        return self._filter(None, "or", parse_or_filter(filters))
+
+    # Orden y paginado
+    def order(self, column, desc=False, **kwargs):
+        self._orders.append((column, desc))
+        return self
+
+    def limit(self, size):
+        self._limit = size
+        return self
+
+    def range(self, start, end):
+        self._offset, self._limit = start, end - start + 1
+        return self
+
+    def execute(self):
+        return self._client._execute(self)
+
+
+class FakeDatabase:
+    """Tablas en memoria compartidas por uno o varios clientes falsos."""
+
+    def __init__(self, schema=None):
+        self.schema = schema or FAKE_SCHEMA
+        self.tables = {name: _Table(name, table_schema) for name, table_schema in self.schema.items()}
+        self.lock = threading.RLock()
+
+    def table(self, name):
+        if name not in self.tables:
+            raise FakeAPIError(f'relation "public.{name}" does not exist', status=404)
+        return self.tables[name]
+
+    def load(self, data):
+        """Carga {tabla: [filas]} respetando las claves que traigan las filas."""
+        with self.lock:
+            for name, rows in data.items():
+                table = self.table(name)
+                for row in rows:
+                    table.insert(row)
+
+    def dump(self):
+        with self.lock:
+            return {name: list(table.rows.values()) for name, table in self.tables.items()}
+
+
+# --- Auth ---
+
+def _fake_jwt(claims):
+    def encode(part):
+        return base64.urlsafe_b64encode(json.dumps(part).encode()).rstrip(b"=").decode()
+    return f"{encode({'alg': 'none', 'typ': 'JWT'})}.{encode(claims)}.fake"
+
+
+class FakeAuth:
+    """Acepta cualquier usuario; emite tokens con `sub`, `email` y `exp` reales."""
+
+    def __init__(self, session_seconds=3600):
+        self.session_seconds = session_seconds
+        self._refresh_tokens = {}   # refresh token -> usuario
+        self._lock = threading.Lock()
+
+    def _issue(self, user):
+        refresh_token = uuid.uuid4().hex
+        with self._lock:
+            self._refresh_tokens[refresh_token] = user
+        claims = {
+            "sub": user.id, "email": user.email, "role": "authenticated",
+            "exp": int(time.time()) + self.session_seconds,
+            "user_metadata": user.user_metadata, "app_metadata": user.app_metadata,
+        }
+        session = SimpleNamespace(access_token=_fake_jwt(claims), refresh_token=refresh_token, user=user)
+        return SimpleNamespace(session=session, user=user)
+
+    @staticmethod
+    def _user(email):
+        return SimpleNamespace(
+            id=str(uuid.uuid5(uuid.NAMESPACE_URL, email)), email=email, role="authenticated",
+            user_metadata={}, app_metadata={"provider": "email"}
+        )
+
+    def sign_in_with_password(self, credentials):
+        return self._issue(self._user(credentials["email"]))
+
+    def sign_up(self, credentials):
+        return SimpleNamespace(session=None, user=self._user(credentials["email"]))
+
+    def refresh_session(self, refresh_token=None):
+        with self._lock:
+            user = self._refresh_tokens.pop(refresh_token, None)
+        if user is None:
+            raise FakeAPIError("Invalid Refresh Token: Refresh Token Not Found", status=400)
+        return self._issue(user)
+
+    def set_session(self, access_token, refresh_token):
+        return self.refresh_session(refresh_token)
+
+    def sign_out(self):
+        pass
+
+
+class FakeSupabaseClient:
+    """
+    Reemplazo en proceso del `supabase.Client` para medir y probar las páginas
+    sin red. Implementa el subconjunto que usa la app: `table()` con select
+    (incluidos los anidados), insert, update, upsert, delete, filtros, orden y
+    límite, sobre tablas en memoria indexadas. Cada `execute()` espera
+    `latency_ms` (± `jitter_ms`) para simular el round trip.
+    """
+
+    def __init__(self, database=None, latency_ms=0, jitter_ms=0):
+        self.database = database or FakeDatabase()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.auth = FakeAuth()
+        self.postgrest = SimpleNamespace(auth=lambda token: None)
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    from_ = table
+
+    def set_access_token_source(self, source):
+        pass
+
+    @property
+    def is_loaded(self):
+        return True
+
+    # --- Ejecución ---
+
+    def _simulate_latency(self):
+        delay = self.latency_ms + (random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def _execute(self, query):
+        self._simulate_latency()
+        db = self.database
+        with db.lock:
+            table = db.table(query._table_name)
+            handler = getattr(self, f"_run_{query._operation}")
+            data = handler(table, query)
+        count = len(data) if query._count else None
+        return FakeResponse(data, count)
+
+    def _matching_keys(self, table, filters):
+        """Usa el primer filtro de igualdad indexado y filtra el resto fila por fila."""
+        candidates = None
+        remaining = []
+        for column, op, value in filters:
+            if candidates is None and op == "eq":
+                candidates = table.lookup(column, value)
+                if candidates is not None:
+                    continue
+            remaining.append((column, op, value))
+        if candidates is None:
+            candidates = list(table.rows)
+        return [
+            key for key in candidates
+            if all(_matches(table.rows[key], column, op, value) for column, op, value in remaining)
+        ]
+
+    def _run_select(self, table, query):
+        rows = [table.rows[key] for key in self._matching_keys(table, query._filters)]
+        # Orden estable: se aplica desde la última clave hacia la primera
+        for column, desc in reversed(query._orders):
+            # Como en Postgres: NULLS LAST al ascender y NULLS FIRST al descender
+            rows.sort(key=lambda row: (row.get(column) is None, row.get(column) if row.get(column) is not None else 0),
+                      reverse=desc)
+        end = None if query._limit is None else query._offset + query._limit
+        rows = rows[query._offset:end]
+        fields, embeds = parse_select(query._columns)
+        return [self._shape(table, row, fields, embeds) for row in rows]
+
+    def _shape(self, table, row, fields, embeds):
+        result = _project(row, fields)
+        for name, (sub_fields, sub_embeds) in embeds.items():
+            target = self.database.table(name)
+            fk = next((col for col, ref in table.references.items() if ref == name), None)
+            if fk is not None:
+                # Muchos a uno: objeto o None
+                parent = target.rows.get(row.get(fk))
+                result[name] = self._shape(target, parent, sub_fields, sub_embeds) if parent else None
+                continue
+            back_fk = next((col for col, ref in target.references.items() if ref == table.name), None)
+            if back_fk is None:
+                raise FakeAPIError(f"Could not find a relationship between '{table.name}' and '{name}'")
+            keys = target.lookup(back_fk, row[table.pk])
+            children = (
+                [target.rows[key] for key in keys] if keys is not None
+                else [child for child in target.rows.values() if child.get(back_fk) == row[table.pk]]
+            )
+            result[name] = [self._shape(target, child, sub_fields, sub_embeds) for child in children]
+        return result
+
+    def _run_insert(self, table, query):
+        rows = query._payload if isinstance(query._payload, list) else [query._payload]
+        return [dict(table.insert(row)) for row in rows]
+
+    def _run_update(self, table, query):
+        keys = self._matching_keys(table, query._filters)
+        return [dict(table.update(key, query._payload)) for key in keys]
+
+    def _run_upsert(self, table, query):
+        rows = query._payload if isinstance(query._payload, list) else [query._payload]
+        # Como PostgREST: las columnas del lote son la unión de las claves;
+        # con default_to_null, las que falten en una fila se envían como null
+        columns = set().union(*(row.keys() for row in rows)) if rows else set()
+        saved = []
+        for row in rows:
+            values = dict(row)
+            if query._default_to_null:
+                for column in columns - values.keys():
+                    values[column] = None
+            key = _coerce_key(values.get(table.pk), table.rows)
+            if key is not None and key in table.rows:
+                values.pop(table.pk, None)
+                saved.append(dict(table.update(key, values)))
+            else:
+                saved.append(dict(table.insert(values)))
+        return saved
+
+    def _run_delete(self, table, query):
+        keys = self._matching_keys(table, query._filters)
+        return [table.delete(key) for key in keys]
+
+
+def create_fake_client(latency_ms=0, jitter_ms=0, data_file=None):
+    """Crea el cliente falso y, si se indica, lo carga desde un JSON {tabla: [filas]}."""
+    client = FakeSupabaseClient(latency_ms=latency_ms, jitter_ms=jitter_ms)
+    if data_file:
+        with open(data_file, encoding="utf-8") as f:
+            client.database.load(json.load(f))
+        logging.info(f"Datos falsos cargados desde {data_file}")
+    return client
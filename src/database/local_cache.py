@@ -0,0 +1,322 @@
+# src/database/local_cache.py
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# Tiempo de vida (segundos) de cada tabla cacheada
+# (los proyectos no usan TTL: se sincronizan por delta, ver delta_sync.py)
+DEFAULT_TTLS = {
+    "areas_maestro": 3600,
+    "proyectos_areas": 120,
+}
+
+
+class CacheEntry:
+    """Resultado de una lectura del cache."""
+
+    def __init__(self, rows, fetched_at, ttl):
+        self.rows = rows
+        self.fetched_at = fetched_at
+        self.fresh = (time.time() - fetched_at) < ttl
+
+
+class LocalCache:
+    """
+    Cache persistente en SQLite para las lecturas de Supabase. Las páginas
+    muestran primero lo que hay en disco y sólo van a la red si el dato
+    expiró según el TTL de su tabla.
+    """
+
+    def __init__(self, db_path=None, ttls=None):
+        self.db_path = Path(db_path) if db_path else Path.home() / ".proyecto_manager" / "cache.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self._lock = threading.Lock()
+        # Lecturas resueltas sin red (hits) frente a las que fueron a Supabase,
+        # tanto de las tablas con TTL como de las páginas del conjunto
+        # sincronizado. Se cuentan bajo el lock desde el hilo de Tk y los workers.
+        self.hits = 0
+        self.misses = 0
+        # La conexión se comparte entre el hilo de Tk y los workers, protegida por el lock
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            " table_name TEXT NOT NULL,"
+            " cache_key TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " PRIMARY KEY (table_name, cache_key))"
+        )
+        # Filas sincronizadas incrementalmente (ver delta_sync.py)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS synced_rows ("
+            " table_name TEXT NOT NULL,"
+            " pk TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " PRIMARY KEY (table_name, pk))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sync_watermarks ("
+            " table_name TEXT PRIMARY KEY,"
+            " watermark TEXT NOT NULL,"
+            " synced_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, table_name, cache_key="*"):
+        """Devuelve un CacheEntry o None si no hay nada guardado."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, fetched_at FROM cache_entries WHERE table_name = ? AND cache_key = ?",
+                    (table_name, str(cache_key))
+                ).fetchone()
+        except sqlite3.Error as e:
+            logging.error(f"Error al leer el cache local: {e}")
+            return None
+
+        if not row:
+            return None
+        return CacheEntry(json.loads(row[0]), row[1], self.ttls.get(table_name, 0))
+
+    def put(self, table_name, cache_key, rows):
+        """Guarda el resultado de una consulta."""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (table_name, cache_key, payload, fetched_at) VALUES (?, ?, ?, ?)",
+                    (table_name, str(cache_key), json.dumps(rows), time.time())
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logging.error(f"Error al escribir el cache local: {e}")
+
+    def invalidate(self, table_name, cache_key=None):
+        """Invalida una clave concreta o toda la tabla tras una escritura."""
+        try:
+            with self._lock:
+                if cache_key is None:
+                    self._conn.execute("DELETE FROM cache_entries WHERE table_name = ?", (table_name,))
+                else:
+                    self._conn.execute(
+                        "DELETE FROM cache_entries WHERE table_name = ? AND cache_key = ?",
+                        (table_name, str(cache_key))
+                    )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logging.error(f"Error al invalidar el cache local: {e}")
+
+    def get_synced_rows(self, table_name):
+        """Devuelve todas las filas sincronizadas de una tabla."""
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT payload FROM synced_rows WHERE table_name = ?", (table_name,)
+                ).fetchall()
+        except sqlite3.Error as e:
+            logging.error(f"Error al leer filas sincronizadas: {e}")
+            return []
+        return [json.loads(r[0]) for r in rows]
+
+    def get_synced_page(self, table_name, keyset, cursor=None, limit=30):
+        """
+        Devuelve una página del conjunto sincronizado ordenada por `keyset`
+        (dos columnas, descendente) empezando después de `cursor`.
+        """
+        first, second = (f"json_extract(payload, '$.{field}')" for field in keyset)
+        sql = "SELECT payload FROM synced_rows WHERE table_name = ?"
+        params = [table_name]
+        if cursor is not None:
+            sql += f" AND ({first} < ? OR ({first} = ? AND {second} < ?))"
+            params += [cursor[0], cursor[0], cursor[1]]
+        sql += f" ORDER BY {first} DESC, {second} DESC LIMIT ?"
+        params.append(limit)
+
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+                self.hits += 1
+        except sqlite3.Error as e:
+            logging.error(f"Error al leer página sincronizada: {e}")
+            return []
+        return [json.loads(r[0]) for r in rows]
+
+    def record_miss(self):
+        """Cuenta una lectura que tuvo que ir a Supabase fuera de `read_through`."""
+        with self._lock:
+            self.misses += 1
+
+    def count_synced_rows(self, table_name):
+        """Cantidad de filas sincronizadas de una tabla."""
+        try:
+            with self._lock:
+                return self._conn.execute(
+                    "SELECT COUNT(*) FROM synced_rows WHERE table_name = ?", (table_name,)
+                ).fetchone()[0]
+        except sqlite3.Error as e:
+            logging.error(f"Error al contar filas sincronizadas: {e}")
+            return 0
+
+    def hit_rate(self):
+        """Proporción de lecturas servidas desde el cache, o None si no hubo lecturas."""
+        with self._lock:
+            hits, total = self.hits, self.hits + self.misses
+        return hits / total if total else None
+
+    def get_last_sync(self, table_name=None):
+        """Momento (epoch) de la última sincronización de la tabla, o de cualquiera si no se indica."""
+        try:
+            with self._lock:
+                if table_name is None:
+                    row = self._conn.execute("SELECT MAX(synced_at) FROM sync_watermarks").fetchone()
+                else:
+                    row = self._conn.execute(
+                        "SELECT synced_at FROM sync_watermarks WHERE table_name = ?", (table_name,)
+                    ).fetchone()
+        except sqlite3.Error as e:
+            logging.error(f"Error al leer la última sincronización: {e}")
+            return None
+        return row[0] if row else None
+
+    def get_watermark(self, table_name):
+        """Devuelve la marca de agua (último `updated_at` visto) o None."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT watermark FROM sync_watermarks WHERE table_name = ?", (table_name,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logging.error(f"Error al leer la marca de agua: {e}")
+            return None
+        return row[0] if row else None
+
+    def merge_rows(self, table_name, pk_field, rows, watermark=None, tombstone_field=None):
+        """
+        Fusiona filas en el conjunto sincronizado: las que traen `tombstone_field`
+        se eliminan y el resto se insertan o reemplazan. Si se indica `watermark`
+        se guarda en la misma transacción. Devuelve cuántas filas cambiaron
+        realmente respecto de lo guardado.
+        """
+        upserts = []
+        deletes = []
+        for row in rows:
+            if tombstone_field and row.get(tombstone_field):
+                deletes.append((table_name, str(row[pk_field])))
+            else:
+                upserts.append((table_name, str(row[pk_field]), json.dumps(row, sort_keys=True)))
+
+        try:
+            with self._lock:
+                pks = [u[1] for u in upserts] + [d[1] for d in deletes]
+                existing = {}
+                for start in range(0, len(pks), 500):
+                    chunk = pks[start:start + 500]
+                    existing.update(self._conn.execute(
+                        f"SELECT pk, payload FROM synced_rows WHERE table_name = ? AND pk IN ({','.join('?' * len(chunk))})",
+                        [table_name, *chunk]
+                    ).fetchall())
+                changed = sum(1 for u in upserts if existing.get(u[1]) != u[2])
+                changed += sum(1 for d in deletes if d[1] in existing)
+
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO synced_rows (table_name, pk, payload) VALUES (?, ?, ?)", upserts
+                )
+                self._conn.executemany("DELETE FROM synced_rows WHERE table_name = ? AND pk = ?", deletes)
+                if watermark is not None:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO sync_watermarks (table_name, watermark, synced_at) VALUES (?, ?, ?)",
+                        (table_name, watermark, time.time())
+                    )
+                self._conn.commit()
+            return changed
+        except sqlite3.Error as e:
+            logging.error(f"Error al fusionar filas sincronizadas: {e}")
+            return 0
+
+    def replace_rows(self, table_name, pk_field, rows, watermark):
+        """
+        Reemplaza todo el conjunto sincronizado de la tabla por `rows` (las filas
+        que ya no vienen se eliminan) y guarda `watermark`. Devuelve cuántas
+        filas cambiaron respecto de lo guardado.
+        """
+        upserts = {str(row[pk_field]): json.dumps(row, sort_keys=True) for row in rows}
+
+        try:
+            with self._lock:
+                existing = dict(self._conn.execute(
+                    "SELECT pk, payload FROM synced_rows WHERE table_name = ?", (table_name,)
+                ).fetchall())
+                changed = sum(1 for pk, payload in upserts.items() if existing.get(pk) != payload)
+                changed += sum(1 for pk in existing if pk not in upserts)
+
+                self._conn.execute("DELETE FROM synced_rows WHERE table_name = ?", (table_name,))
+                self._conn.executemany(
+                    "INSERT INTO synced_rows (table_name, pk, payload) VALUES (?, ?, ?)",
+                    [(table_name, pk, payload) for pk, payload in upserts.items()]
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sync_watermarks (table_name, watermark, synced_at) VALUES (?, ?, ?)",
+                    (table_name, watermark, time.time())
+                )
+                self._conn.commit()
+            return changed
+        except sqlite3.Error as e:
+            logging.error(f"Error al reemplazar filas sincronizadas: {e}")
+            return 0
+
+    def clear(self):
+        """Elimina todo el contenido del cache (por ejemplo al cerrar sesión)."""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM cache_entries")
+                self._conn.execute("DELETE FROM synced_rows")
+                self._conn.execute("DELETE FROM sync_watermarks")
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logging.error(f"Error al limpiar el cache local: {e}")
+
+    def read_through(self, query_executor, table_name, cache_key, fetch_fn, on_data, on_error=None, owner=None):
+        """
+        Entrega los datos cacheados de inmediato y, si expiraron o no existen,
+        lanza `fetch_fn` en el executor, guarda el resultado y vuelve a llamar
+        a `on_data` (salvo que sea igual a lo ya entregado). Si ya se
+        mostraron datos viejos, un fallo de red sólo se registra en el log.
+        """
+        entry = self.get(table_name, cache_key)
+        if entry is not None:
+            on_data(entry.rows)
+            if entry.fresh:
+                with self._lock:
+                    self.hits += 1
+                return None
+        with self._lock:
+            self.misses += 1
+
+        def fetch_and_store():
+            rows = fetch_fn()
+            self.put(table_name, cache_key, rows)
+            return rows
+
+        def on_refresh_error(error):
+            logging.warning(f"No se pudo refrescar '{table_name}', se muestran datos en cache: {error}")
+
+        def on_fresh_data(rows):
+            # Lo mismo que ya se mostró: no hace falta reconstruir la vista
+            if entry is None or rows != entry.rows:
+                on_data(rows)
+
+        return query_executor.submit(
+            fetch_and_store,
+            on_success=on_fresh_data,
+            on_error=on_error if entry is None else on_refresh_error,
+            owner=owner
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
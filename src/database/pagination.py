@@ -0,0 +1,53 @@
+# src/database/pagination.py
+
+from src.database.delta_sync import SYNC_TABLES, is_missing_column_error
+
+# Cantidad de proyectos por página en el listado
+PROJECTS_PAGE_SIZE = 30
+
+# Orden estable del listado: más recientes primero, desempate por id
+PROJECTS_KEYSET = ("fecha_creacion", "id_proyecto")
+
+
+def cursor_from_row(row, keyset=PROJECTS_KEYSET):
+    """Devuelve el cursor (valores de las columnas del keyset) de la última fila recibida."""
+    return tuple(row.get(field) for field in keyset)
+
+
+def fetch_projects_page(supabase_client, cursor=None, limit=PROJECTS_PAGE_SIZE, delta_sync=None):
+    """
+    Trae una página de proyectos con paginación por keyset sobre
+    (fecha_creacion, id_proyecto) descendente. A diferencia de OFFSET, el
+    costo de cada página no crece con la posición en la lista. Si se pasa
+    `delta_sync`, recuerda ahí que a la base le falta la columna tombstone.
+    """
+    tombstone_field = SYNC_TABLES["proyectos"]["tombstone_field"]
+    if delta_sync is not None and delta_sync.column_missing("proyectos", tombstone_field):
+        return _fetch_projects_page(supabase_client, cursor, limit, None)
+    try:
+        return _fetch_projects_page(supabase_client, cursor, limit, tombstone_field)
+    except Exception as e:
+        if not is_missing_column_error(e, tombstone_field):
+            raise
+        # Sin la migración no hay bajas lógicas: se listan todas las filas
+        if delta_sync is not None:
+            delta_sync.mark_column_missing("proyectos", tombstone_field)
+        return _fetch_projects_page(supabase_client, cursor, limit, None)
+
+
+def _fetch_projects_page(supabase_client, cursor, limit, tombstone_field):
+    date_field, id_field = PROJECTS_KEYSET
+    query = supabase_client.table("proyectos").select("*")
+    if tombstone_field:
+        # Los proyectos dados de baja quedan como tombstone (ver delta_sync.py)
+        query = query.is_(tombstone_field, "null")
+
+    if cursor is not None:
+        last_date, last_id = cursor
+        # (fecha, id) < (last_date, last_id) expresado con el filtro `or` de PostgREST
+        query = query.or_(
+            f'{date_field}.lt."{last_date}",'
+            f'and({date_field}.eq."{last_date}",{id_field}.lt.{last_id})'
+        )
+
+    return query.order(date_field, desc=True).order(id_field, desc=True).limit(limit).execute().data
@@ -0,0 +1,163 @@
+# src/database/query_executor.py
+
+import contextvars
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class QueryHandle:
+    """Referencia a una consulta enviada al executor. Permite cancelarla."""
+
+    def __init__(self, owner_path=None):
+        self.owner_path = owner_path
+        self.future = None
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Cancela la consulta. Si ya se está ejecutando, su resultado se descarta."""
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+
+class QueryExecutor:
+    """
+    Ejecuta las consultas a Supabase en un pool de hilos para no bloquear el
+    loop de Tk. Los resultados vuelven al hilo principal a través de una cola
+    que se vacía periódicamente con `after`, que es el único lugar donde es
+    seguro tocar widgets.
+    """
+
+    def __init__(self, tk_root, max_workers=4, poll_interval_ms=30, idle_poll_interval_ms=250):
+        self.tk_root = tk_root
+        self.poll_interval_ms = poll_interval_ms
+        # Sin consultas pendientes se sigue revisando la cola con menos frecuencia,
+        # para entregar los avisos de otros hilos enviados con `call_soon`
+        self.idle_poll_interval_ms = idle_poll_interval_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-worker")
+        self._results = queue.Queue()
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._after_id = None
+        self._after_is_idle = False
+        self._closed = False
+        self._schedule_poll(idle=True)
+
+    def submit(self, query_fn, on_success=None, on_error=None, owner=None):
+        """
+        Envía `query_fn` al pool. `on_success(resultado)` u `on_error(excepción)`
+        se llaman en el hilo de Tk. Si se indica `owner` (un widget), la consulta
+        se cancela automáticamente al destruirlo mediante `cancel_owner`.
+        """
+        if self._closed:
+            raise RuntimeError("El executor de consultas ya fue cerrado")
+
+        handle = QueryHandle(str(owner) if owner is not None else None)
+        # La consulta y sus callbacks corren con el contexto de quien la pidió
+        # (acción del profiler), así las consultas encadenadas heredan el clic
+        context = contextvars.copy_context()
+
+        def run():
+            if handle.cancelled:
+                return
+            try:
+                result = query_fn()
+                self._results.put((handle, on_success, result, context))
+            except Exception as e:
+                self._results.put((handle, on_error, e, context))
+
+        with self._lock:
+            self._pending.add(handle)
+        handle.future = self._pool.submit(context.copy().run, run)
+        self._schedule_poll()
+        return handle
+
+    def call_soon(self, callback, *args):
+        """
+        Ejecuta `callback(*args)` en el hilo de Tk. Es seguro llamarlo desde
+        cualquier hilo (por ejemplo, el scheduler de refresco de sesión).
+        """
+        self._results.put((None, lambda _: callback(*args), None, None))
+
+    def cancel_owner(self, owner):
+        """Cancela todas las consultas del widget `owner` y de sus descendientes."""
+        owner_path = str(owner)
+        prefix = owner_path.rstrip(".") + "."
+        with self._lock:
+            handles = [
+                h for h in self._pending
+                if h.owner_path and (h.owner_path == owner_path or h.owner_path.startswith(prefix))
+            ]
+            for handle in handles:
+                self._pending.discard(handle)
+        for handle in handles:
+            handle.cancel()
+        if handles:
+            logging.debug(f"{len(handles)} consultas canceladas para {owner_path}")
+
+    def shutdown(self):
+        """Detiene el dispatcher y descarta las consultas pendientes."""
+        self._closed = True
+        with self._lock:
+            handles = list(self._pending)
+            self._pending.clear()
+        for handle in handles:
+            handle.cancel()
+        if self._after_id:
+            try:
+                self.tk_root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule_poll(self, idle=False):
+        # `after` sólo se invoca desde el hilo de Tk (submit y _drain)
+        if self._closed:
+            return
+        if self._after_id is not None:
+            if idle or not self._after_is_idle:
+                return
+            # Llegó una consulta mientras se esperaba el sondeo lento
+            self.tk_root.after_cancel(self._after_id)
+        interval = self.idle_poll_interval_ms if idle else self.poll_interval_ms
+        self._after_id = self.tk_root.after(interval, self._drain)
+        self._after_is_idle = idle
+
+    def _drain(self):
+        self._after_id = None
+        while True:
+            try:
+                handle, callback, payload, context = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            if handle is None:
+                # Aviso enviado con call_soon
+                try:
+                    callback(payload)
+                except Exception as e:
+                    logging.error(f"Error en callback diferido: {e}")
+                continue
+
+            with self._lock:
+                self._pending.discard(handle)
+            if handle.cancelled or callback is None:
+                if isinstance(payload, Exception) and not handle.cancelled:
+                    logging.error(f"Error en consulta sin manejador: {payload}")
+                continue
+
+            try:
+                context.run(callback, payload)
+            except Exception as e:
+                logging.error(f"Error en callback de consulta: {e}")
+
+        with self._lock:
+            has_pending = bool(self._pending)
+        self._schedule_poll(idle=not has_pending)
@@ -0,0 +1,183 @@
+# src/database/query_profiler.py
+
+import contextvars
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# Acción de la interfaz que originó las consultas. Es una ContextVar para que
+# viaje con las consultas que QueryExecutor manda a sus hilos.
+_current_action = contextvars.ContextVar("query_action", default="inicio")
+
+# Métodos del builder de postgrest que se registran como filtros de la consulta
+_OPERATIONS = ("select", "insert", "update", "upsert", "delete")
+_FILTERS = ("eq", "neq", "gt", "gte", "lt", "lte", "in_", "is_", "or_", "like", "ilike", "order", "limit", "range")
+
+
+def set_action(name):
+    """Marca las consultas que se hagan desde ahora (en este hilo) con `name`."""
+    _current_action.set(name)
+
+
+def current_action():
+    return _current_action.get()
+
+
+@contextmanager
+def action(name):
+    """Marca las consultas de un bloque con `name` y restaura la acción anterior."""
+    token = _current_action.set(name)
+    try:
+        yield
+    finally:
+        _current_action.reset(token)
+
+
+def action_from_widget(widget, max_depth=4):
+    """Nombre legible de un clic: el texto del widget o de alguno de sus contenedores."""
+    current = widget
+    for _ in range(max_depth):
+        if current is None:
+            break
+        try:
+            text = current.cget("text")
+        except Exception:
+            text = None
+        if isinstance(text, str) and text.strip():
+            return f"clic: {text.strip().splitlines()[0][:40]}"
+        current = getattr(current, "master", None)
+    return f"clic: {type(widget).__name__}"
+
+
+class QueryProfiler:
+    """
+    Registro de las consultas a Supabase: tabla, operación, filtros, filas,
+    bytes y latencia de cada una, agrupadas por la acción que las disparó.
+    Guarda las últimas `max_records` consultas y totales por acción.
+    """
+
+    def __init__(self, max_records=2000):
+        self.records = deque(maxlen=max_records)
+        self._actions = {}
+        self._lock = threading.Lock()
+
+    def record(self, table, operation, filters, rows, size, latency_ms, error=None):
+        entry = {
+            'at': datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            'action': current_action(),
+            'table': table,
+            'operation': operation,
+            'filters': filters,
+            'rows': rows,
+            'bytes': size,
+            'latency_ms': round(latency_ms, 2),
+            'thread': threading.current_thread().name,
+            'error': error,
+        }
+        with self._lock:
+            self.records.append(entry)
+            totals = self._actions.setdefault(
+                entry['action'], {'calls': 0, 'wait_ms': 0.0, 'rows': 0, 'bytes': 0, 'errors': 0, 'tables': set()}
+            )
+            totals['calls'] += 1
+            totals['wait_ms'] += latency_ms
+            totals['rows'] += rows
+            totals['bytes'] += size
+            totals['errors'] += error is not None
+            totals['tables'].add(table)
+        return entry
+
+    def summary(self):
+        """Totales por acción, de la más costosa a la menos costosa."""
+        with self._lock:
+            items = [
+                dict(totals, action=name, wait_ms=round(totals['wait_ms'], 1), tables=sorted(totals['tables']))
+                for name, totals in self._actions.items()
+            ]
+        return sorted(items, key=lambda item: item['wait_ms'], reverse=True)
+
+    def recent(self, limit=100):
+        """Últimas `limit` consultas; todas si `limit` es None."""
+        with self._lock:
+            records = list(self.records)
+        return records if limit is None else records[-limit:]
+
+    def latencies(self):
+        with self._lock:
+            return [entry['latency_ms'] for entry in self.records]
+
+    def clear(self):
+        with self._lock:
+            self.records.clear()
+            self._actions.clear()
+
+    def dump(self, path):
+        """Vuelca el resumen por acción y las consultas registradas a un JSON."""
+        # Se serializa antes de abrir el archivo para no dejarlo a medio escribir
+        content = json.dumps({'summary': self.summary(), 'queries': self.recent(limit=None)}, ensure_ascii=False, indent=2)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+profiler = QueryProfiler()
+
+
+class _ProfiledQuery:
+    """Envuelve un builder de postgrest y anota cada llamada hasta `execute()`."""
+
+    def __init__(self, builder, table, calls=()):
+        self._builder = builder
+        self._table = table
+        self._calls = calls
+
+    def __getattr__(self, name):
+        attr = getattr(self._builder, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            if hasattr(result, "execute"):
+                return _ProfiledQuery(result, self._table, self._calls + ((name, args, kwargs),))
+            return result
+        return call
+
+    def execute(self):
+        operation = next((name for name, _, _ in self._calls if name in _OPERATIONS), "select")
+        filters = [
+            f"{name.rstrip('_')}({', '.join([str(arg) for arg in args] + [f'{k}={v}' for k, v in kwargs.items()])})"
+            for name, args, kwargs in self._calls if name in _FILTERS
+        ]
+        start = time.perf_counter()
+        try:
+            response = self._builder.execute()
+        except Exception as e:
+            profiler.record(self._table, operation, filters, 0, 0, (time.perf_counter() - start) * 1000, error=str(e))
+            raise
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        data = getattr(response, "data", None) or []
+        payload = next((args[0] for name, args, _ in self._calls if name in _OPERATIONS and name != "select" and args), None)
+        # Tamaño aproximado de lo que viajó: respuesta más cuerpo enviado
+        size = len(json.dumps(data, default=str)) + (len(json.dumps(payload, default=str)) if payload else 0)
+        profiler.record(self._table, operation, filters, len(data) if isinstance(data, list) else 1, size, latency_ms)
+        return response
+
+
+class ProfiledSupabaseClient:
+    """Cliente de Supabase que registra en `profiler` cada consulta de `table()`."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def table(self, name):
+        return _ProfiledQuery(self._client.table(name), name)
+
+    def from_(self, name):
+        return self.table(name)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
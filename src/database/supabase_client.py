@@ -1,26 +1,120 @@
 import os
-from dotenv import load_dotenv
-from supabase import create_client, Client
+import threading
 from urllib.parse import urlparse, parse_qs
 
 # --- Configuración y Conexión ---
 # Usa una ruta relativa para encontrar el archivo .env sin importar el directorio
 dotenv_path = os.path.join(os.path.dirname(__file__), '..', '..', '.env')
-load_dotenv(dotenv_path)
 
-# Obtiene las credenciales del entorno
-url: str = os.environ.get("SUPABASE_URL")
-key: str = os.environ.get("SUPABASE_API_KEY")
+# El paquete `supabase` (httpx, pydantic, postgrest...) tarda cientos de ms en
+# importarse: se difiere hasta la primera consulta real para que la ventana de
+# login pinte antes.
+_client = None
+_client_lock = threading.Lock()
+# Función que devuelve el token del usuario (AuthService.get_access_token) y
+# el último token aplicado al cliente
+_access_token_source = None
+_applied_access_token = None
 
-if not url or not key:
-    raise ValueError("Las credenciales de Supabase no se encontraron. Asegúrate de que el archivo .env está en la raíz del proyecto y tiene las variables SUPABASE_URL y SUPABASE_API_KEY.")
 
-# Crea una instancia del cliente de Supabase
-supabase: Client = create_client(url, key)
+def load_supabase_config():
+    """Lee y valida las credenciales del .env sin crear el cliente."""
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path)
 
-def get_supabase_client() -> Client:
-    """Devuelve la instancia del cliente de Supabase para ser usada en otras partes del código."""
-    return supabase
+    # Obtiene las credenciales del entorno
+    url: str = os.environ.get("SUPABASE_URL")
+    key: str = os.environ.get("SUPABASE_API_KEY")
+
+    if not url or not key:
+        raise ValueError("Las credenciales de Supabase no se encontraron. Asegúrate de que el archivo .env está en la raíz del proyecto y tiene las variables SUPABASE_URL y SUPABASE_API_KEY.")
+    return url, key
+
+
+def _create_client():
+    global _client
+    with _client_lock:
+        if _client is None:
+            from supabase import create_client, ClientOptions
+            url, key = load_supabase_config()
+            # El refresco de tokens lo programa AuthService: dos refrescos en
+            # paralelo con el mismo refresh token invalidarían la sesión
+            _client = create_client(url, key, options=ClientOptions(auto_refresh_token=False))
+    return _client
+
+
+def _apply_access_token(client):
+    """
+    Autentica las consultas con el token vigente de la fuente, si cambió desde
+    la última. Sin token (sesión cerrada o rechazada) vuelve a la clave anónima
+    para no seguir mandando el token del usuario anterior.
+    """
+    global _applied_access_token
+    access_token = _access_token_source() if _access_token_source else None
+    if access_token != _applied_access_token:
+        with _client_lock:
+            if access_token != _applied_access_token:
+                client.postgrest.auth(access_token or client.supabase_key)
+                _applied_access_token = access_token
+
+
+class LazySupabaseClient:
+    """
+    Representa al cliente de Supabase y lo crea recién en el primer acceso a
+    uno de sus atributos (`table`, `auth`, ...). Es seguro entre hilos: la
+    primera consulta puede venir del QueryExecutor.
+    """
+
+    def __getattr__(self, name):
+        return getattr(_client or _create_client(), name)
+
+    def table(self, name):
+        client = _client or _create_client()
+        # Cada consulta toma el token de la fuente: un refresco de sesión se
+        # aplica en la siguiente consulta, sin que AuthService toque el cliente
+        _apply_access_token(client)
+        return client.table(name)
+
+    from_ = table
+
+    @property
+    def is_loaded(self):
+        return _client is not None
+
+    def set_access_token_source(self, source):
+        """Registra la función que devuelve el token del usuario para las consultas de datos."""
+        global _access_token_source
+        _access_token_source = source
+
+
+supabase = LazySupabaseClient()
+_fake_client = None
+# Lo que reciben las páginas: el cliente envuelto por el profiler de consultas
+_profiled_clients = {}
+
+
+def use_fake_supabase():
+    """SUPABASE_FAKE=1 reemplaza Supabase por tablas en memoria (ver fake_supabase.py)."""
+    return os.environ.get("SUPABASE_FAKE", "").lower() in ("1", "true", "yes")
+
+
+def get_supabase_client():
+    """Devuelve el cliente de Supabase (creado de forma diferida) para ser usado en otras partes del código."""
+    global _fake_client
+    from src.database.query_profiler import ProfiledSupabaseClient
+    client = supabase
+    if use_fake_supabase():
+        if _fake_client is None:
+            from src.database.fake_supabase import create_fake_client
+            _fake_client = create_fake_client(
+                latency_ms=float(os.environ.get("SUPABASE_FAKE_LATENCY_MS", 0)),
+                jitter_ms=float(os.environ.get("SUPABASE_FAKE_JITTER_MS", 0)),
+                data_file=os.environ.get("SUPABASE_FAKE_DATA")
+            )
+        client = _fake_client
+    if id(client) not in _profiled_clients:
+        _profiled_clients[id(client)] = ProfiledSupabaseClient(client)
+    return _profiled_clients[id(client)]
 
 
 
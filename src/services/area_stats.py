@@ -0,0 +1,67 @@
+# src/services/area_stats.py
+
+
+def parse_dimension(value):
+    """Convierte el texto de una entrada en metros; lo inválido cuenta como 0."""
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class AreaAggregator:
+    """
+    Totales acumulados de las áreas de un proyecto. Cada fila guarda su aporte
+    y al cambiar una dimensión sólo se aplica la diferencia, de modo que
+    actualizar los totales cuesta O(1) sin importar la cantidad de áreas.
+    """
+
+    def __init__(self):
+        self._contributions = {}   # id de fila -> (piso, muros, volumen)
+        self.count = 0
+        self.floor_m2 = 0.0
+        self.wall_m2 = 0.0
+        self.volume_m3 = 0.0
+
+    @staticmethod
+    def _contribution(ancho, largo, alto):
+        ancho, largo, alto = parse_dimension(ancho), parse_dimension(largo), parse_dimension(alto)
+        floor = ancho * largo
+        # Superficie bruta de muros: perímetro por alto (sin descontar aberturas)
+        walls = 2 * (ancho + largo) * alto
+        return floor, walls, floor * alto
+
+    def set_row(self, row_id, ancho, largo, alto):
+        """Agrega o actualiza una fila aplicando sólo la diferencia con su aporte anterior."""
+        new = self._contribution(ancho, largo, alto)
+        old = self._contributions.get(row_id)
+        if old is None:
+            self.count += 1
+            old = (0.0, 0.0, 0.0)
+        self._contributions[row_id] = new
+        self.floor_m2 += new[0] - old[0]
+        self.wall_m2 += new[1] - old[1]
+        self.volume_m3 += new[2] - old[2]
+
+    def remove_row(self, row_id):
+        old = self._contributions.pop(row_id, None)
+        if old is None:
+            return
+        self.count -= 1
+        self.floor_m2 -= old[0]
+        self.wall_m2 -= old[1]
+        self.volume_m3 -= old[2]
+
+    def clear(self):
+        self._contributions.clear()
+        self.count = 0
+        self.floor_m2 = self.wall_m2 = self.volume_m3 = 0.0
+
+    def totals(self):
+        # Las restas sucesivas pueden dejar residuos como -1e-15
+        return {
+            'count': self.count,
+            'floor_m2': max(0.0, self.floor_m2),
+            'wall_m2': max(0.0, self.wall_m2),
+            'volume_m3': max(0.0, self.volume_m3),
+        }
@@ -1,16 +1,51 @@
+import base64
 import json
 import os
+import threading
+import time
 from pathlib import Path
-from supabase import Client
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 import logging
 
+if TYPE_CHECKING:
+    # Sólo para la anotación: importar `supabase` al arrancar es costoso
+    from supabase import Client
+
+# Se refresca la sesión este tiempo antes de que venza el access token
+REFRESH_MARGIN_SECONDS = 120
+# Espera antes de reintentar un refresco que falló por la red
+REFRESH_RETRY_SECONDS = 30
+
+def decode_jwt_claims(token):
+    """
+    Devuelve los claims de un JWT sin verificar la firma (sólo se usan para
+    saber localmente a quién pertenece y cuándo vence; el servidor valida).
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload))
+    except (AttributeError, IndexError, ValueError):
+        return {}
+
+
 class AuthService:
     """Servicio de autenticación mejorado con mejor manejo de sesiones."""
     
-    def __init__(self, supabase_client: Client):
+    def __init__(self, supabase_client: "Client"):
         self.supabase = supabase_client
         self.session_file = Path.home() / ".proyecto_manager" / "session.json"
         self.session_file.parent.mkdir(exist_ok=True)
+        # {"access_token", "refresh_token", "claims"} de la sesión en uso
+        self.current_session = None
+        # Se llama (desde el hilo del scheduler) si el servidor rechaza la sesión
+        self.on_session_lost = None
+        self._refresh_timer = None
+        self._refresh_lock = threading.RLock()
+        # Las consultas de datos piden el token vigente a este servicio
+        if hasattr(self.supabase, "set_access_token_source"):
+            self.supabase.set_access_token_source(self.get_access_token)
 
     def login(self, email: str, password: str):
         """Inicia sesión con email y contraseña."""
@@ -22,6 +57,7 @@ class AuthService:
             
             if response.session:
                 logging.info(f"Login exitoso para: {email}")
+                self._set_current_session(response.session.access_token, response.session.refresh_token)
                 return response
             else:
                 raise Exception("No se pudo iniciar sesión")
@@ -50,6 +86,7 @@ class AuthService:
 
     def logout(self):
         """Cierra la sesión actual."""
+        self.stop_refresh_scheduler()
         try:
             self.supabase.auth.sign_out()
             self.clear_session()
@@ -59,11 +96,13 @@ class AuthService:
             # Aún así limpiamos la sesión local
             self.clear_session()
 
-    def save_session(self, refresh_token: str):
-        """Guarda el token de sesión localmente."""
+    def save_session(self, refresh_token: str, access_token: str = None):
+        """Guarda los tokens de sesión localmente."""
         try:
             session_data = {
-                "refresh_token": refresh_token
+                "refresh_token": refresh_token,
+                # Permite abrir la app sin esperar a la red mientras siga vigente
+                "access_token": access_token
             }
             
             with open(self.session_file, 'w') as f:
@@ -73,56 +112,140 @@ class AuthService:
         except Exception as e:
             logging.error(f"Error al guardar sesión: {e}")
 
-    def load_session(self):
-        """Carga la sesión desde el archivo local."""
+    def _read_session_file(self):
+        if not self.session_file.exists():
+            return None
         try:
-            if not self.session_file.exists():
-                return None
-            
             with open(self.session_file, 'r') as f:
-                session_data = json.load(f)
-            
-            refresh_token = session_data.get("refresh_token")
-            if not refresh_token:
-                return None
-            
-            # Intentar refrescar la sesión
-            response = self.supabase.auth.refresh_session(refresh_token)
-            
-            if response.session:
-                logging.info("Sesión cargada y refrescada correctamente")
-                return response.session
-            else:
-                logging.warning("No se pudo refrescar la sesión")
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.error(f"Error al leer la sesión local: {e}")
+            return None
+
+    def has_saved_session(self):
+        session_data = self._read_session_file()
+        return bool(session_data and session_data.get("refresh_token"))
+
+    def load_cached_session(self, min_validity=60):
+        """
+        Devuelve la sesión guardada si su access token sigue vigente por al
+        menos `min_validity` segundos, sin ninguna llamada de red. El token se
+        aplica al cliente para que las consultas salgan autenticadas.
+        """
+        session_data = self._read_session_file()
+        if not session_data or not session_data.get("access_token"):
+            return None
+
+        claims = decode_jwt_claims(session_data["access_token"])
+        if claims.get("exp", 0) - time.time() < min_validity:
+            return None
+
+        self._set_current_session(session_data["access_token"], session_data["refresh_token"])
+        logging.info("Sesión local vigente: se abre la aplicación sin esperar a la red")
+        return session_data
+
+    def refresh_stored_session(self):
+        """
+        Refresca la sesión guardada contra el servidor y persiste los tokens
+        nuevos (el refresh token rota en cada uso). Devuelve None si el
+        servidor rechaza la sesión; los errores de red se propagan.
+        Pensado para correr en el QueryExecutor.
+        """
+        session_data = self._read_session_file()
+        if not session_data or not session_data.get("refresh_token"):
+            return None
+        return self._refresh(session_data["refresh_token"])
+
+    def _refresh(self, refresh_token):
+        """Refresca contra el servidor; None si la sesión fue rechazada."""
+        with self._refresh_lock:
+            # Otro hilo pudo haber refrescado mientras se esperaba el lock
+            if self.current_session and self.current_session["refresh_token"] != refresh_token:
+                return self.current_session
+
+            try:
+                response = self.supabase.auth.refresh_session(refresh_token)
+            except Exception as e:
+                # Un 4xx es un rechazo del servidor; lo demás se trata como falla de red
+                if 400 <= (getattr(e, "status", None) or 0) < 500:
+                    logging.warning(f"El servidor rechazó la sesión: {e}")
+                    self.stop_refresh_scheduler()
+                    self.clear_session()
+                    return None
+                raise
+
+            if not response.session:
+                self.stop_refresh_scheduler()
                 self.clear_session()
                 return None
-                
-        except Exception as e:
-            logging.error(f"Error al cargar sesión: {e}")
-            self.clear_session()
-            return None
 
-    def validate_session(self, session):
-        """Valida si una sesión sigue siendo válida."""
+            # Sólo se persiste si el usuario pidió recordar la sesión
+            if self.session_file.exists():
+                self.save_session(response.session.refresh_token, response.session.access_token)
+            self._set_current_session(response.session.access_token, response.session.refresh_token)
+            logging.info("Sesión refrescada en segundo plano")
+            return self.current_session
+
+    def _set_current_session(self, access_token, refresh_token):
+        self.current_session = {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "claims": decode_jwt_claims(access_token)
+        }
+        self._schedule_refresh()
+
+    # --- Refresco proactivo ---
+
+    def _schedule_refresh(self, delay=None):
+        """Programa el próximo refresco poco antes de que venza el access token."""
+        if delay is None:
+            expires_at = self.current_session["claims"].get("exp", 0)
+            delay = expires_at - time.time() - REFRESH_MARGIN_SECONDS
+        self.stop_refresh_scheduler()
+        self._refresh_timer = threading.Timer(max(1.0, delay), self._run_scheduled_refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _run_scheduled_refresh(self):
+        session = self.current_session
+        if not session:
+            return
         try:
-            if not session:
-                return False
-            
-            # Verificar si tenemos un usuario válido
-            user = self.supabase.auth.get_user()
-            if not user or not user.user:
-                logging.warning("No hay usuario válido en la sesión")
-                return False
-                
-            return True
-            
+            if self._refresh(session["refresh_token"]) is None and self.on_session_lost:
+                self.on_session_lost()
         except Exception as e:
-            logging.error(f"Error al validar sesión: {e}")
+            logging.warning(f"Falló el refresco programado, reintentando en {REFRESH_RETRY_SECONDS}s: {e}")
+            self._schedule_refresh(REFRESH_RETRY_SECONDS)
+
+    def stop_refresh_scheduler(self):
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+    def get_access_token(self):
+        """Token vigente para las consultas, sin ninguna llamada de red."""
+        return self.current_session["access_token"] if self.current_session else None
+
+    def validate_session(self, session=None):
+        """Valida con los claims en memoria si la sesión sigue vigente."""
+        if session is None:
+            session = self.current_session
+        if not session:
             return False
 
+        if isinstance(session, dict):
+            claims = session.get("claims") or decode_jwt_claims(session.get("access_token"))
+        else:
+            claims = decode_jwt_claims(getattr(session, "access_token", None))
+        if not claims.get("sub") or claims.get("exp", 0) <= time.time():
+            logging.warning("No hay usuario válido en la sesión")
+            return False
+        return True
+
     def clear_session(self):
         """Elimina la sesión guardada localmente."""
         try:
+            self.current_session = None
             if self.session_file.exists():
                 self.session_file.unlink()
             logging.info("Sesión local eliminada")
@@ -130,10 +253,16 @@ class AuthService:
             logging.error(f"Error al eliminar sesión local: {e}")
 
     def get_current_user(self):
-        """Obtiene el usuario actual si hay una sesión activa."""
-        try:
-            user = self.supabase.auth.get_user()
-            return user.user if user else None
-        except Exception as e:
-            logging.error(f"Error al obtener usuario actual: {e}")
-            return None
\ No newline at end of file
+        """Obtiene el usuario actual a partir de los claims del token, sin ir a la red."""
+        if not self.current_session:
+            return None
+        claims = self.current_session["claims"]
+        if not claims.get("sub"):
+            return None
+        return SimpleNamespace(
+            id=claims["sub"],
+            email=claims.get("email"),
+            role=claims.get("role"),
+            user_metadata=claims.get("user_metadata", {}),
+            app_metadata=claims.get("app_metadata", {})
+        )
\ No newline at end of file
@@ -0,0 +1,44 @@
+# src/services/project_model.py
+
+# Un único select anidado de PostgREST trae el grafo completo del proyecto:
+# áreas, nombre del área maestra, puertas y ventanas.
+PROJECT_GRAPH_SELECT = "*, areas_maestro(nombre_area), puertas(*), ventanas(*)"
+
+
+def fetch_project_graph(supabase_client, proyecto_id):
+    """Trae todas las áreas del proyecto con sus aberturas en un solo round trip."""
+    return supabase_client.table("proyectos_areas").select(
+        PROJECT_GRAPH_SELECT
+    ).eq("proyecto_id", proyecto_id).execute().data
+
+
+class ProjectModel:
+    """
+    Modelo en memoria de un proyecto abierto. La página de detalle y el
+    gestor de puertas y ventanas leen de aquí en lugar de volver a la red.
+    """
+
+    def __init__(self, proyecto, areas):
+        self.proyecto = proyecto
+        self.areas = areas
+        self._areas_by_id = {area['id_proyectos_areas']: area for area in areas}
+        for area in areas:
+            area.setdefault('puertas', [])
+            area.setdefault('ventanas', [])
+
+    def __len__(self):
+        return len(self.areas)
+
+    def get_area(self, area_id):
+        return self._areas_by_id.get(area_id)
+
+    def get_openings(self, area_id):
+        """Devuelve (puertas, ventanas) de un área."""
+        area = self._areas_by_id[area_id]
+        return area['puertas'], area['ventanas']
+
+    def set_openings(self, area_id, puertas, ventanas):
+        """Reemplaza las aberturas de un área tras guardarlas."""
+        area = self._areas_by_id[area_id]
+        area['puertas'] = list(puertas)
+        area['ventanas'] = list(ventanas)
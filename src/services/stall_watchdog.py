@@ -0,0 +1,105 @@
+# src/services/stall_watchdog.py
+
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+# Los frames de estos archivos son "nuestros": se reportan como culpables
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_LOG_PATH = Path.home() / ".proyecto_manager" / "stalls.log"
+
+
+def _create_stall_logger(log_path, max_bytes, backup_count):
+    logger = logging.getLogger("buildmate.stalls")
+    logger.setLevel(logging.INFO)
+    # Sólo al archivo rotativo: no se mezcla con el log general
+    logger.propagate = False
+    if not logger.handlers:
+        Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+        handler = RotatingFileHandler(log_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        logger.addHandler(handler)
+    return logger
+
+
+class StallWatchdog:
+    """
+    Hilo que vigila el latido de MainLoopMonitor. Si el loop de Tk lleva más
+    de `threshold_ms` sin procesar eventos, muestrea la pila del hilo
+    principal (`sys._current_frames`) cada `sample_interval_ms` hasta que se
+    libera. Al terminar el bloqueo registra su duración, la pila más vista y
+    los frames del proyecto que la causaron en un archivo rotativo.
+    """
+
+    def __init__(self, monitor, threshold_ms=100, sample_interval_ms=20, log_path=DEFAULT_LOG_PATH,
+                 max_bytes=1_000_000, backup_count=3):
+        self.monitor = monitor
+        self.threshold_ms = threshold_ms
+        self.sample_interval_ms = sample_interval_ms
+        self.log_path = log_path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.stalls_logged = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._logger = None
+
+    def start(self):
+        self._logger = _create_stall_logger(self.log_path, self.max_bytes, self.backup_count)
+        self._thread = threading.Thread(target=self._run, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _late_ms(self):
+        return (time.monotonic() - self.monitor.last_beat) * 1000 - self.monitor.interval_ms
+
+    def _run(self):
+        main_id = threading.main_thread().ident
+        samples = Counter()
+        worst_ms = 0.0
+        while not self._stop.wait(self.sample_interval_ms / 1000):
+            late_ms = self._late_ms()
+            if late_ms > self.threshold_ms:
+                frame = sys._current_frames().get(main_id)
+                if frame is not None:
+                    stack = tuple((f.filename, f.lineno, f.name) for f in traceback.extract_stack(frame))
+                    samples[stack] += 1
+                worst_ms = max(worst_ms, late_ms)
+            elif samples:
+                self._report(worst_ms, samples)
+                samples = Counter()
+                worst_ms = 0.0
+        if samples:
+            self._report(worst_ms, samples)
+
+    def _report(self, duration_ms, samples):
+        """Escribe el bloqueo con su pila dominante y los frames del proyecto."""
+        stack, hits = samples.most_common(1)[0]
+        total = sum(samples.values())
+        culprits = [frame for frame in stack if frame[0].startswith(str(PROJECT_ROOT))][-5:]
+
+        lines = [f"Bloqueo del loop de Tk: {duration_ms:.0f} ms ({total} muestras, pila dominante en {hits})"]
+        lines += [f"  culpable: {self._format(frame)}" for frame in reversed(culprits)]
+        lines.append("  pila:")
+        lines += [f"    {self._format(frame)}" for frame in stack[-15:]]
+        self._logger.info("\n".join(lines))
+        self.stalls_logged += 1
+
+        where = self._format(culprits[-1]) if culprits else "fuera del proyecto"
+        logging.warning(f"La interfaz estuvo bloqueada {duration_ms:.0f} ms en {where}")
+
+    @staticmethod
+    def _format(frame):
+        filename, lineno, name = frame
+        try:
+            filename = str(Path(filename).relative_to(PROJECT_ROOT))
+        except ValueError:
+            pass
+        return f"{filename}:{lineno} en {name}"
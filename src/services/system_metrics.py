@@ -0,0 +1,79 @@
+# src/services/system_metrics.py
+
+import os
+import sys
+import time
+
+
+class MainLoopMonitor:
+    """
+    Latido en el loop de Tk: cada `interval_ms` se agenda con `after` y mide
+    cuánto tarde llegó. Un retraso mayor a `stall_threshold_ms` significa que
+    el hilo de Tk estuvo ocupado sin procesar eventos (la app se "congeló").
+    """
+
+    def __init__(self, tk_root, interval_ms=100, stall_threshold_ms=100):
+        self.tk_root = tk_root
+        self.interval_ms = interval_ms
+        self.stall_threshold_ms = stall_threshold_ms
+        # Último latido procesado (time.monotonic); lo leen otros hilos
+        self.last_beat = time.monotonic()
+        self.stall_count = 0
+        self.longest_stall_ms = 0.0
+        self._after_id = None
+
+    def start(self):
+        self.last_beat = time.monotonic()
+        self._after_id = self.tk_root.after(self.interval_ms, self._beat)
+
+    def stop(self):
+        if self._after_id is not None:
+            try:
+                self.tk_root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _beat(self):
+        now = time.monotonic()
+        delay_ms = (now - self.last_beat) * 1000 - self.interval_ms
+        if delay_ms > self.stall_threshold_ms:
+            self.stall_count += 1
+            self.longest_stall_ms = max(self.longest_stall_ms, delay_ms)
+        self.last_beat = now
+        self._after_id = self.tk_root.after(self.interval_ms, self._beat)
+
+
+def percentiles(values, points=(50, 95, 99)):
+    """Percentiles por rango más cercano; None si no hay valores."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    return {p: ordered[min(last, max(0, round(p / 100 * len(ordered)) - 1))] for p in points}
+
+
+def current_rss_mb():
+    """Memoria residente actual del proceso en MB, o None si no se puede leer."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        pass
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+        except (OSError, ValueError, IndexError):
+            return None
+    return None
+
+
+def count_widgets(widget):
+    """Cantidad de widgets de Tk vivos bajo `widget` (incluido)."""
+    count, stack = 0, [widget]
+    while stack:
+        current = stack.pop()
+        count += 1
+        stack.extend(current.winfo_children())
+    return count
@@ -0,0 +1,96 @@
+# src/ui/asset_cache.py
+
+import logging
+import threading
+from pathlib import Path
+
+import customtkinter as ctk
+
+# Carpetas donde se buscan los assets, en orden de prioridad. Se resuelven una
+# sola vez por proceso.
+ASSET_DIRS = [
+    Path(__file__).resolve().parents[1] / "assets",
+    Path(__file__).resolve().parents[2] / "assets",
+    Path("assets"),
+]
+
+# Imágenes que conviene tener decodificadas antes de mostrar login y sidebar
+STARTUP_ASSETS = [
+    "logoNuevo.png",
+    "icons/eye_open.ico",
+    "icons/eye_closed.ico",
+    "icons/menu.png",
+    "icons/proyectos.png",
+    "icons/materiales.png",
+    "icons/areas.png",
+    "icons/configuracion.png",
+]
+
+_lock = threading.Lock()
+_paths = {}        # nombre relativo -> Path o None si no existe
+_decoded = {}      # nombre relativo -> PIL.Image ya cargada
+_ctk_images = {}   # (nombre relativo, (ancho, alto)) -> CTkImage
+
+
+def resolve_asset(name):
+    """Devuelve la ruta del asset `name` (relativo a assets/) o None si no existe."""
+    with _lock:
+        if name not in _paths:
+            _paths[name] = next((d / name for d in ASSET_DIRS if (d / name).exists()), None)
+        return _paths[name]
+
+
+def get_pil_image(name):
+    """Decodifica el asset una única vez por proceso; None si no existe o no se puede leer."""
+    with _lock:
+        if name in _decoded:
+            return _decoded[name]
+
+    path = resolve_asset(name)
+    image = None
+    if path is not None:
+        # Diferido: en preload_assets la importación de PIL también corre en el hilo de fondo
+        from PIL import Image
+        try:
+            with Image.open(path) as source:
+                source.load()
+                image = source.copy()
+        except OSError as e:
+            logging.warning(f"No se pudo decodificar el asset '{name}': {e}")
+
+    with _lock:
+        return _decoded.setdefault(name, image)
+
+
+def get_image(name, size):
+    """CTkImage compartida del asset para un tamaño dado; None si el asset no existe."""
+    key = (name, tuple(size))
+    image = _ctk_images.get(key)
+    if image is None:
+        pil_image = get_pil_image(name)
+        if pil_image is None:
+            return None
+        image = _ctk_images[key] = ctk.CTkImage(pil_image, size=key[1])
+    return image
+
+
+def get_placeholder_image(size, color=(255, 255, 255, 100)):
+    """Cuadro liso para reemplazar un ícono que falta."""
+    key = (f"placeholder:{color}", tuple(size))
+    image = _ctk_images.get(key)
+    if image is None:
+        from PIL import Image
+        image = _ctk_images[key] = ctk.CTkImage(Image.new('RGBA', key[1], color), size=key[1])
+    return image
+
+
+def preload_assets(names=STARTUP_ASSETS):
+    """Decodifica los assets indicados en un hilo de fondo mientras arranca la app."""
+    def run():
+        for name in names:
+            get_pil_image(name)
+        logging.debug(f"{len(names)} assets precargados")
+
+    thread = threading.Thread(target=run, name="asset-preload", daemon=True)
+    thread.start()
+    return thread
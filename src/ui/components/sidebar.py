@@ -1,16 +1,15 @@
 # src/ui/components/sidebar.py (Versión final Overlay, sin cabezal interno)
 
 import customtkinter as ctk
-from PIL import Image
-from pathlib import Path
 import unicodedata
 import time
 import math
-from config import get_sidebar_colors
+from src.ui.styles import get_font, get_colors
+from src.ui.asset_cache import get_image, get_placeholder_image
 
 class Sidebar(ctk.CTkFrame):
     def __init__(self, master, commands, **kwargs):
-        self.colors = get_sidebar_colors()
+        self.colors = get_colors('sidebar')
         self.EXPANDED_WIDTH = 240
         
         super().__init__(master, corner_radius=0, fg_color=self.colors['bg'], width=self.EXPANDED_WIDTH, **kwargs)
@@ -52,30 +51,26 @@ class Sidebar(ctk.CTkFrame):
         footer_frame.pack(side="bottom", fill="x", pady=15, padx=20)
         
         ctk.CTkLabel(
-            footer_frame, text="v1.0.0", font=ctk.CTkFont(size=10), text_color="#9CA3AF"
+            footer_frame, text="v1.0.0", font=get_font(size=10), text_color="#9CA3AF"
         ).pack(anchor="w")
 
     def _normalize_str(self, s):
         return "".join(c for c in unicodedata.normalize('NFD', s.lower()) if unicodedata.category(c) != 'Mn')
 
     def _load_icons(self):
-        icon_path = Path(__file__).resolve().parent.parent.parent / "assets" / "icons"
+        # Las imágenes salen del cache de assets: se decodifican una vez por proceso
         icon_names = ["menu", "proyectos", "materiales", "areas", "configuracion"]
-        icons = {}
-        for name in icon_names:
-            try:
-                img = Image.open(icon_path / f"{name}.png")
-                icons[name] = ctk.CTkImage(img, size=(20, 20))
-            except FileNotFoundError:
-                icons[name] = ctk.CTkImage(Image.new('RGBA', (20, 20), (255, 255, 255, 100)), size=(20, 20))
-        return icons
+        return {
+            name: get_image(f"icons/{name}.png", (20, 20)) or get_placeholder_image((20, 20))
+            for name in icon_names
+        }
 
     def _create_button(self, parent, icon, text, command, is_menu=False):
         return ctk.CTkButton(
             parent, image=icon, text=text, command=command,
             fg_color=self.colors['bg'], hover_color=self.colors['hover'],
             text_color=self.colors['text'], anchor="w",
-            font=ctk.CTkFont(size=14, weight="bold" if is_menu else "normal"),
+            font=get_font(size=14, weight="bold" if is_menu else "normal"),
             height=45 if not is_menu else 40, corner_radius=8
         )
 
@@ -2,14 +2,14 @@
 
 import customtkinter as ctk
 from tkinter import messagebox
-from PIL import Image
 import os
 import logging
-from pathlib import Path
+from src.ui.asset_cache import get_image
 # CORREGIDO: Importamos TRANSPARENT_HOVER para usarlo en el botón.
-from config import TRANSPARENT_BG, TRANSPARENT_HOVER, get_login_colors
+from config import TRANSPARENT_BG, TRANSPARENT_HOVER
+from src.ui.styles import get_font, get_colors
     
-colors = get_login_colors()
+colors = get_colors('login')
 
 class LoginWindow(ctk.CTkFrame):
     def __init__(self, master, auth_service, **kwargs):
@@ -36,20 +36,9 @@ class LoginWindow(ctk.CTkFrame):
         self.grid_columnconfigure(0, weight=1)
         
         try:
-            possible_paths = [
-                Path(__file__).resolve().parents[2] / "assets" / "logoNuevo.png",
-                Path(__file__).resolve().parents[1] / "assets" / "logoNuevo.png",
-                Path("assets") / "logoNuevo.png",
-            ]
-            
-            logo_path = None
-            for path in possible_paths:
-                if path.exists():
-                    logo_path = path
-                    break
-            
-            if logo_path:
-                avatar_image = ctk.CTkImage(Image.open(logo_path), size=(120, 100))
+            # El cache de assets resuelve la ruta y decodifica el logo una sola vez
+            avatar_image = get_image("logoNuevo.png", (120, 100))
+            if avatar_image:
                 avatar_label = ctk.CTkLabel(
                     self, 
                     image=avatar_image, 
@@ -64,14 +53,14 @@ class LoginWindow(ctk.CTkFrame):
             placeholder_avatar = ctk.CTkLabel(
                 self, 
                 text="🏗️", 
-                font=ctk.CTkFont(size=80)
+                font=get_font(size=80)
             )
             placeholder_avatar.grid(row=0, column=0, pady=(30, 15))
         
         welcome_label = ctk.CTkLabel(
             self, 
             text="¡Bienvenido a BuildMate!", 
-            font=ctk.CTkFont(size=18, weight="bold"), 
+            font=get_font(size=18, weight="bold"), 
             text_color=colors['text_primary']
         )
         welcome_label.grid(row=1, column=0, pady=(0, 5))
@@ -79,7 +68,7 @@ class LoginWindow(ctk.CTkFrame):
         subtitle_label = ctk.CTkLabel(
             self, 
             text="Inicia sesión para gestionar tus proyectos", 
-            font=ctk.CTkFont(size=12), 
+            font=get_font(size=12), 
             text_color=colors['text_secondary']
         )
         subtitle_label.grid(row=2, column=0, pady=(0, 10))
@@ -92,25 +81,9 @@ class LoginWindow(ctk.CTkFrame):
         separator_bar.grid(row=3, column=0, padx=40, pady=(5, 20), sticky="ew")
 
         try:
-            possible_icon_paths = [
-                Path(__file__).resolve().parents[2] / "assets" / "icons",
-                Path(__file__).resolve().parents[1] / "assets" / "icons",
-                Path("assets") / "icons",
-            ]
-            
-            icon_path = None
-            for path in possible_icon_paths:
-                if path.exists():
-                    icon_path = path
-                    break
-            
-            if icon_path:
-                eye_open_path = icon_path / "eye_open.ico"
-                eye_closed_path = icon_path / "eye_closed.ico"
-                
-                self.eye_open_icon = ctk.CTkImage(Image.open(eye_open_path), size=(18, 18))
-                self.eye_closed_icon = ctk.CTkImage(Image.open(eye_closed_path), size=(18, 18))
-            else:
+            self.eye_open_icon = get_image("icons/eye_open.ico", (18, 18))
+            self.eye_closed_icon = get_image("icons/eye_closed.ico", (18, 18))
+            if not (self.eye_open_icon and self.eye_closed_icon):
                 raise FileNotFoundError("Iconos no encontrados")
                 
         except Exception as e:
@@ -128,7 +101,7 @@ class LoginWindow(ctk.CTkFrame):
             self, 
             text="Correo electrónico", 
             anchor="w",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(size=13, weight="bold"),
             text_color=self.colors['text_primary']
         )
         self.email_label.grid(row=4, column=0, padx=40, pady=(0, 5), sticky="w")
@@ -142,7 +115,7 @@ class LoginWindow(ctk.CTkFrame):
             border_color=self.colors['input_border'],
             fg_color=TRANSPARENT_BG ,
             placeholder_text="ejemplo@correo.com",
-            font=ctk.CTkFont(size=14)
+            font=get_font(size=14)
         )
         self.email_entry.grid(row=5, column=0, padx=40, pady=(0, 15), sticky="ew")
         
@@ -150,7 +123,7 @@ class LoginWindow(ctk.CTkFrame):
             self, 
             text="Contraseña", 
             anchor="w",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(size=13, weight="bold"),
             text_color=self.colors['text_primary']
         )
         self.password_label.grid(row=6, column=0, padx=40, pady=(0, 5), sticky="w")
@@ -174,7 +147,7 @@ class LoginWindow(ctk.CTkFrame):
             border_width=0,
             fg_color=TRANSPARENT_BG ,
             placeholder_text="Ingresa tu contraseña",
-            font=ctk.CTkFont(size=14)
+            font=get_font(size=14)
         )
         self.password_entry.grid(row=0, column=0, sticky="ew", padx=(15, 0), pady=5)
 
@@ -201,7 +174,7 @@ class LoginWindow(ctk.CTkFrame):
             variable=self.remember_me_var, 
             border_color=self.colors['accent_text'],
             checkmark_color=self.colors['button_bg'],
-            font=ctk.CTkFont(size=12),
+            font=get_font(size=12),
             text_color=self.colors['text_secondary']
         )
         self.remember_me_check.grid(row=0, column=0, sticky="w")
@@ -212,7 +185,7 @@ class LoginWindow(ctk.CTkFrame):
             command=self.login, 
             height=50, 
             corner_radius=12, 
-            font=ctk.CTkFont(weight="bold", size=16),
+            font=get_font(weight="bold", size=16),
             fg_color=self.colors['button_bg'],
             hover_color=self.colors['button_hover'],
             text_color="#FFFFFF"
@@ -227,7 +200,7 @@ class LoginWindow(ctk.CTkFrame):
             # CORREGIDO: Usamos TRANSPARENT_HOVER en lugar de TRANSPARENT_BG.
             hover_color=TRANSPARENT_HOVER,
             text_color=self.colors['accent_text'],
-            font=ctk.CTkFont(underline=True, size=12)
+            font=get_font(underline=True, size=12)
         )
         self.toggle_btn.grid(row=10, column=0, padx=40, pady=(0, 25), sticky="ew")
 
@@ -269,7 +242,7 @@ class LoginWindow(ctk.CTkFrame):
             auth_response = self.auth_service.login(email, password)
             if auth_response:
                 if self.remember_me_var.get():
-                    self.auth_service.save_session(auth_response.session.refresh_token)
+                    self.auth_service.save_session(auth_response.session.refresh_token, auth_response.session.access_token)
                 
                 app_window = self.master
                 while hasattr(app_window, 'master') and app_window.master:
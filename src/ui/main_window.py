@@ -1,28 +1,51 @@
-# src/ui/main_window.py (Versión final con corrección en _bind_click_outside)
+# src/ui/main_window.py
 
+import importlib
+from collections import OrderedDict
 import customtkinter as ctk
 from tkinter import messagebox
-from PIL import Image
-from pathlib import Path
 
 from src.ui.components.sidebar import Sidebar
-from src.ui.pages.proyectos_page import ProyectosPage
-from src.ui.pages.project_detail_page import ProjectDetailPage
-from src.ui.pages.areas_view import AreasView
-from src.ui.pages.materiales_view import MaterialesView
-from src.ui.pages.configuracion_view import ConfiguracionView
-from src.ui.windows.proyecto_form_window import ProyectoFormWindow
-from config import get_main_colors, get_sidebar_colors
+from src.ui.asset_cache import get_image
+from src.ui.styles import get_colors
+
+# Registro de páginas: el módulo de cada una se importa recién la primera vez
+# que se muestra (la de detalle, por ejemplo, arrastra NumPy).
+PAGE_REGISTRY = {
+    "proyectos": ("src.ui.pages.proyectos_page", "ProyectosPage"),
+    "detalle_proyecto": ("src.ui.pages.project_detail_page", "ProjectDetailPage"),
+    "areas": ("src.ui.pages.areas_view", "AreasView"),
+    "materiales": ("src.ui.pages.materiales_view", "MaterialesView"),
+    "configuracion": ("src.ui.pages.configuracion_view", "ConfiguracionView"),
+}
+
+_loaded_pages = {}
+
+# Páginas que se mantienen construidas (ocultas) para volver a ellas al instante
+MAX_CACHED_PAGES = 4
+
+
+def load_page_class(page_name):
+    """Importa (una sola vez) y devuelve la clase registrada como `page_name`."""
+    page_class = _loaded_pages.get(page_name)
+    if page_class is None:
+        module_name, class_name = PAGE_REGISTRY[page_name]
+        page_class = getattr(importlib.import_module(module_name), class_name)
+        _loaded_pages[page_name] = page_class
+    return page_class
 
 class MainWindow(ctk.CTkFrame):
     def __init__(self, master, **kwargs):
-        self.colors = get_main_colors()
-        sidebar_colors = get_sidebar_colors()
+        self.colors = get_colors('main')
+        sidebar_colors = get_colors('sidebar')
         super().__init__(master, fg_color=self.colors['bg_primary'], **kwargs)
         
         self.master = master
         self.supabase_client = master.supabase_client
         self.auth_service = master.auth_service
+        # (nombre de página, clave) -> page_wrapper, del menos al más recientemente usado
+        self._page_cache = OrderedDict()
+        self._current_page_key = None
 
         self.view_container = ctk.CTkFrame(
             self, corner_radius=0, fg_color=self.colors['bg_primary']
@@ -39,12 +62,9 @@ class MainWindow(ctk.CTkFrame):
         self.sidebar_frame = Sidebar(self, commands=commands)
         self.sidebar_frame.place(x=-self.sidebar_frame.EXPANDED_WIDTH, y=0, relheight=1)
 
-        try:
-            icon_path = Path(__file__).resolve().parent.parent / "assets" / "icons" / "menu.png"
-            menu_icon = ctk.CTkImage(Image.open(icon_path), size=(20, 20))
-        except Exception as e:
-            print(f"Error cargando ícono de menú: {e}")
-            menu_icon = None
+        menu_icon = get_image("icons/menu.png", (20, 20))
+        if menu_icon is None:
+            print("Error cargando ícono de menú: icons/menu.png no encontrado")
 
         self.menu_button = ctk.CTkButton(
             self, text="", image=menu_icon, width=40, height=40, corner_radius=0,
@@ -54,43 +74,117 @@ class MainWindow(ctk.CTkFrame):
         self.menu_button.place(x=15, y=15)
         
         self.menu_button.lift()
+
+        self._click_binding = self.bind_all("<Button-1>", self._on_global_click, add="+")
         
         self.show_proyectos_page()
 
-    def _bind_click_outside(self, widget):
-        """Vincula el evento de clic para cerrar el sidebar."""
-        widget.bind("<Button-1>", lambda event: self.sidebar_frame.hide())
+    def _on_global_click(self, event):
+        """
+        Único manejador de clics de la aplicación (bind_all): cierra el sidebar
+        si el clic cayó fuera de él. Es una prueba de geometría en coordenadas
+        de pantalla, así que no depende de cuántos widgets tenga la página.
+        """
+        if not self.sidebar_frame.is_expanded:
+            return
+        try:
+            # Clics en otras ventanas (formularios, diálogos) no cierran el sidebar
+            if event.widget.winfo_toplevel() is not self.winfo_toplevel():
+                return
+        except (AttributeError, KeyError):
+            return
+        if self._point_inside(self.sidebar_frame, event.x_root, event.y_root) or \
+                self._point_inside(self.menu_button, event.x_root, event.y_root):
+            return
+        self.sidebar_frame.hide()
+
+    @staticmethod
+    def _point_inside(widget, x_root, y_root):
+        x, y = widget.winfo_rootx(), widget.winfo_rooty()
+        return x <= x_root < x + widget.winfo_width() and y <= y_root < y + widget.winfo_height()
+
+    def destroy(self):
+        # Quitar sólo nuestro comando del tag "all", sin tocar otros bind_all de <Button-1>
+        script = self.tk.call("bind", "all", "<Button-1>") or ""
+        remaining = "\n".join(line for line in str(script).split("\n") if self._click_binding not in line)
+        self.tk.call("bind", "all", "<Button-1>", remaining)
+        self.deletecommand(self._click_binding)
+        # Las consultas en curso de todas las páginas (visibles o en cache)
+        # no deben llamar de vuelta a widgets destruidos, por ejemplo al cerrar sesión
+        self.master.query_executor.cancel_owner(self)
+        super().destroy()
+
+    def _switch_page(self, page_name, cache_key=None, **kwargs):
+        """
+        Muestra una página. Las páginas ya construidas se ocultan en lugar de
+        destruirse y se reutilizan si se vuelve a pedir la misma (`page_name`
+        y `cache_key`, por ejemplo el id del proyecto); al reaparecer se llama
+        a su `on_show()` si lo define.
+        """
+        key = (page_name, cache_key)
+        if key == self._current_page_key:
+            # Misma página (por ejemplo, tras crear un proyecto): sólo refrescar
+            page = self._page_cache[key].page
+            if hasattr(page, "on_show"):
+                page.on_show()
+            return
+
+        if self._current_page_key in self._page_cache:
+            self._page_cache[self._current_page_key].pack_forget()
+        self._current_page_key = key
+
+        page_wrapper = self._page_cache.get(key)
+        if page_wrapper is not None:
+            self._page_cache.move_to_end(key)
+            page_wrapper.pack(fill="both", expand=True, padx=(70, 25), pady=(25,25))
+            if hasattr(page_wrapper.page, "on_show"):
+                page_wrapper.page.on_show()
+            return
 
-        for child in widget.winfo_children():
-            # CORREGIDO: Añadimos CTkTabview y CTkSegmentedButton a la lista de widgets a ignorar.
-            if isinstance(child, (ctk.CTkButton, ctk.CTkEntry, ctk.CTkOptionMenu, 
-                                  ctk.CTkScrollableFrame, ctk.CTkTextbox, ctk.CTkSlider,
-                                  ctk.CTkTabview, ctk.CTkSegmentedButton)):
-                continue
-            
-            # La vinculación recursiva puede ser problemática en widgets complejos,
-            # así que la aplicamos con más cuidado.
-            try:
-                self._bind_click_outside(child)
-            except:
-                # Si un widget hijo no soporta bind, simplemente lo ignoramos.
-                pass
-
-    def _switch_page(self, page_class, **kwargs):
-        for widget in self.view_container.winfo_children():
-            widget.destroy()
-        
         page_wrapper = ctk.CTkFrame(self.view_container, fg_color=self.colors['bg_primary'])
         page_wrapper.pack(fill="both", expand=True, padx=(70, 25), pady=(25,25))
         
-        current_page = page_class(
+        current_page = load_page_class(page_name)(
             page_wrapper, master_app=self.master, **kwargs
         )
         current_page.pack(fill="both", expand=True)
-
-        self._bind_click_outside(page_wrapper)
+        page_wrapper.page = current_page
+        self._page_cache[key] = page_wrapper
+
+        self._evict_pages()
+
+    def _evict_pages(self):
+        """
+        Destruye las páginas menos usadas por encima de MAX_CACHED_PAGES. Las
+        que tienen cambios sin guardar (`has_unsaved_changes()`) no se
+        descartan: el cache puede pasarse del límite hasta que se guarden.
+        """
+        evictable = [
+            key for key, page_wrapper in self._page_cache.items()
+            if key != self._current_page_key and not self._has_unsaved_changes(page_wrapper)
+        ]
+        for key in evictable[:max(0, len(self._page_cache) - MAX_CACHED_PAGES)]:
+            page_wrapper = self._page_cache.pop(key)
+            # Descartar las consultas en curso de la página que se destruye
+            self.master.query_executor.cancel_owner(page_wrapper)
+            page_wrapper.destroy()
+
+    @staticmethod
+    def _has_unsaved_changes(page_wrapper):
+        has_unsaved_changes = getattr(page_wrapper.page, "has_unsaved_changes", None)
+        return bool(has_unsaved_changes and has_unsaved_changes())
+
+    def forget_page(self, page_name, cache_key=None):
+        """Saca una página del cache (por ejemplo, si sus datos dejaron de existir)."""
+        page_wrapper = self._page_cache.pop((page_name, cache_key), None)
+        if page_wrapper is not None:
+            if self._current_page_key == (page_name, cache_key):
+                self._current_page_key = None
+            self.master.query_executor.cancel_owner(page_wrapper)
+            page_wrapper.destroy()
 
     def create_new_proyecto(self):
+        from src.ui.windows.proyecto_form_window import ProyectoFormWindow
         form = ProyectoFormWindow(self.master, callback=self.show_proyectos_page)
         form.grab_set()
 
@@ -98,6 +192,7 @@ class MainWindow(ctk.CTkFrame):
         if messagebox.askyesno("Cerrar Sesión", "¿Estás seguro que deseas cerrar sesión?", icon="question"):
             try:
                 self.auth_service.logout()
+                self.master.local_cache.clear()
                 self.master.show_login_window()
                 messagebox.showinfo("Sesión Cerrada", "Has cerrado sesión exitosamente.")
             except Exception as e:
@@ -106,23 +201,23 @@ class MainWindow(ctk.CTkFrame):
     def show_proyectos_page(self):
         self.sidebar_frame.set_selected_button("Proyectos")
         self._switch_page(
-            ProyectosPage, on_create_new=self.create_new_proyecto, on_view_details=self.show_project_detail_page
+            "proyectos", on_create_new=self.create_new_proyecto, on_view_details=self.show_project_detail_page
         )
 
     def show_project_detail_page(self, proyecto):
         self.sidebar_frame.set_selected_button("Proyectos")
         self._switch_page(
-            ProjectDetailPage, proyecto=proyecto, on_back=self.show_proyectos_page
+            "detalle_proyecto", cache_key=proyecto['id_proyecto'], proyecto=proyecto, on_back=self.show_proyectos_page
         )
 
     def show_materiales_page(self):
         self.sidebar_frame.set_selected_button("Materiales")
-        self._switch_page(MaterialesView)
+        self._switch_page("materiales")
 
     def show_areas_page(self):
         self.sidebar_frame.set_selected_button("Áreas")
-        self._switch_page(AreasView)
+        self._switch_page("areas")
 
     def show_configuracion_page(self):
         self.sidebar_frame.set_selected_button("Configuración")
-        self._switch_page(ConfiguracionView, on_logout=self.logout)
\ No newline at end of file
+        self._switch_page("configuracion", on_logout=self.logout)
\ No newline at end of file
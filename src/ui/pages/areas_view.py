@@ -1,23 +1,33 @@
 # src/ui/pages/areas_view.py
 
+import bisect
 import customtkinter as ctk
 from tkinter import messagebox
 from config import (
     FONT_SIZE_TITLE, FONT_SIZE_NORMAL, FONT_SIZE_SMALL, 
-    get_main_colors, BACKGROUND_CARD, ACCENT_PRIMARY, 
+    BACKGROUND_CARD, ACCENT_PRIMARY, 
     ACCENT_HOVER, TEXT_PRIMARY, TEXT_SECONDARY, BORDER_PRIMARY,
     SUCCESS_COLOR, ERROR_COLOR, TRANSPARENT_BG 
 )
+from src.ui.styles import get_font, get_colors
+from src.ui import theme
+from src.ui.widgets.virtual_list import VirtualList
+
+# Alto fijo de cada tarjeta de área (requisito de la lista virtual)
+AREA_CARD_HEIGHT = 50
 
 class AreasView(ctk.CTkFrame):
     def __init__(self, master, master_app, **kwargs):
-        colors = get_main_colors()
+        colors = get_colors('main')
         super().__init__(master, fg_color=colors['bg_primary'], **kwargs)
         
         self.supabase_client = master_app.supabase_client
+        self.query_executor = master_app.query_executor
+        self.local_cache = master_app.local_cache
         self.master_areas_data = []
         self.selected_area = None
-        self.selected_card = None
+        # id de área -> tarjeta que la muestra ahora mismo (sólo las visibles)
+        self._cards_by_id = {}
         self.colors = colors
         
         self._build_ui()
@@ -34,7 +44,7 @@ class AreasView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_frame, 
             text="🏗️ Administración de Áreas Maestras", 
-            font=ctk.CTkFont(size=FONT_SIZE_TITLE, weight="bold"),
+            font=get_font(size=FONT_SIZE_TITLE, weight="bold"),
             text_color=self.colors['text_primary']
         )
         title_label.pack(side="left", anchor="w", pady=15)
@@ -43,7 +53,7 @@ class AreasView(ctk.CTkFrame):
         desc_label = ctk.CTkLabel(
             header_frame, 
             text="Gestiona las áreas que podrás asignar a tus proyectos", 
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1),
+            font=get_font(size=FONT_SIZE_SMALL + 1),
             text_color=self.colors['text_secondary']
         )
         desc_label.pack(side="left", anchor="w", padx=(20, 0))
@@ -76,7 +86,7 @@ class AreasView(ctk.CTkFrame):
         ctk.CTkLabel(
             list_header,
             text="📋 Áreas Existentes",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 2, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 2, weight="bold"),
             text_color=self.colors['text_primary']
         ).pack(side="left")
         
@@ -84,20 +94,25 @@ class AreasView(ctk.CTkFrame):
         self.area_count_label = ctk.CTkLabel(
             list_header,
             text="",
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL),
+            font=get_font(size=FONT_SIZE_SMALL),
             text_color=self.colors['text_secondary']
         )
         self.area_count_label.pack(side="right")
         
-        # ScrollableFrame para las áreas
-        self.areas_list_frame = ctk.CTkScrollableFrame(
+        # Lista virtualizada: sólo se crean las tarjetas visibles y se reciclan al scrollear
+        self.areas_list = VirtualList(
             list_container,
+            row_height=AREA_CARD_HEIGHT,
+            row_spacing=6,
+            row_factory=self._create_area_card,
+            bind_row=self._bind_area_card,
+            inner_padding=8,
             fg_color=BACKGROUND_CARD,
             corner_radius=15,
             border_width=1,
             border_color=BORDER_PRIMARY
         )
-        self.areas_list_frame.pack(fill="both", expand=True)
+        self.areas_list.pack(fill="both", expand=True)
 
     def _create_actions_panel(self, parent):
         """Crea el panel derecho con las acciones"""
@@ -115,7 +130,7 @@ class AreasView(ctk.CTkFrame):
         actions_header = ctk.CTkLabel(
             actions_container,
             text="⚙️ Panel de Acciones",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 1, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 1, weight="bold"),
             text_color=self.colors['text_primary']
         )
         actions_header.pack(pady=(25, 20))
@@ -127,7 +142,7 @@ class AreasView(ctk.CTkFrame):
         ctk.CTkLabel(
             new_area_frame,
             text="➕ Nueva Área",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             text_color=self.colors['text_primary']
         ).pack(anchor="w", pady=(0, 10))
         
@@ -139,7 +154,7 @@ class AreasView(ctk.CTkFrame):
             border_width=2,
             border_color=BORDER_PRIMARY,
             placeholder_text="Ej: Cocina, Baño, Dormitorio...",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL)
+            font=get_font(size=FONT_SIZE_NORMAL)
         )
         self.new_area_entry.pack(fill="x", pady=(0, 10))
         
@@ -152,7 +167,7 @@ class AreasView(ctk.CTkFrame):
             text="➕ Añadir Área",
             command=self.add_area,
             height=40,
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             fg_color=ACCENT_PRIMARY,
             hover_color=ACCENT_HOVER,
             corner_radius=10
@@ -170,7 +185,7 @@ class AreasView(ctk.CTkFrame):
         ctk.CTkLabel(
             selected_frame,
             text="✏️ Área Seleccionada",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             text_color=self.colors['text_primary']
         ).pack(anchor="w", pady=(0, 10))
         
@@ -178,7 +193,7 @@ class AreasView(ctk.CTkFrame):
         self.selected_area_label = ctk.CTkLabel(
             selected_frame,
             text="Ninguna área seleccionada",
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL),
+            font=get_font(size=FONT_SIZE_SMALL),
             text_color=self.colors['text_secondary'],
             fg_color="#F3F4F6",
             corner_radius=8,
@@ -195,7 +210,7 @@ class AreasView(ctk.CTkFrame):
             border_width=2,
             border_color=BORDER_PRIMARY,
             placeholder_text="Nuevo nombre del área",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL),
+            font=get_font(size=FONT_SIZE_NORMAL),
             state="disabled"
         )
         self.edit_area_entry.pack(fill="x", pady=(0, 10))
@@ -209,7 +224,7 @@ class AreasView(ctk.CTkFrame):
             text="✏️ Editar",
             command=self.update_selected_area,
             height=35,
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1, weight="bold"),
+            font=get_font(size=FONT_SIZE_SMALL + 1, weight="bold"),
             fg_color=TRANSPARENT_BG ,
             hover_color=BORDER_PRIMARY,
             text_color=self.colors['text_secondary'],
@@ -225,7 +240,7 @@ class AreasView(ctk.CTkFrame):
             text="🗑️ Eliminar",
             command=self.delete_selected_area,
             height=35,
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1, weight="bold"),
+            font=get_font(size=FONT_SIZE_SMALL + 1, weight="bold"),
             fg_color=TRANSPARENT_BG ,
             hover_color="#FEE2E2",
             text_color=ERROR_COLOR,
@@ -243,172 +258,198 @@ class AreasView(ctk.CTkFrame):
         info_text = ctk.CTkLabel(
             info_frame,
             text="💡 Tip: Haz clic en un área de la lista\npara seleccionarla y poder editarla\no eliminarla.",
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL - 1),
+            font=get_font(size=FONT_SIZE_SMALL - 1),
             text_color=self.colors['text_secondary'],
             justify="center"
         )
         info_text.pack()
 
     def load_master_areas(self):
-        """Carga las áreas maestras desde la base de datos"""
+        """Carga las áreas maestras (cache local primero, red en segundo plano)"""
+        
+        self._create_loading_areas_state()
+        self.local_cache.read_through(
+            self.query_executor, "areas_maestro", "*",
+            lambda: self.supabase_client.table("areas_maestro").select("*").order("nombre_area").execute().data,
+            on_data=self._render_master_areas,
+            on_error=self._on_load_error,
+            owner=self
+        )
+
+    def on_show(self):
+        """Al volver desde el cache de páginas: recarga sólo si el cache expiró"""
+
+        entry = self.local_cache.get("areas_maestro", "*")
+        if entry is None or not entry.fresh:
+            self.load_master_areas()
+
+    def _render_master_areas(self, areas):
+        """Muestra las áreas recibidas en la lista virtual"""
+        
+        # Mismo orden que usa la inserción con bisect en _apply_area_changes;
+        # la colación del servidor puede ordenar distinto acentos y mayúsculas
+        self.areas_list.set_items(sorted(areas, key=self._area_sort_key))
+        # La lista local es la misma que recorre la lista virtual
+        self.master_areas_data = self.areas_list.items
+        self._update_areas_summary()
+
+        # La selección se conserva si el área sigue existiendo
+        if self.selected_area is not None:
+            index = self._index_of_area(self.selected_area['id_area_maestro'])
+            self.selected_area = self.master_areas_data[index] if index is not None else None
+            self._update_actions_panel()
+
+    def _update_areas_summary(self):
+        """Actualiza el contador y el estado vacío según la lista local"""
+        
+        self.area_count_label.configure(text=f"({len(self.master_areas_data)} áreas)")
+        if not self.master_areas_data:
+            self._create_empty_areas_state()
+        else:
+            self.areas_list.hide_placeholder()
+
+    @staticmethod
+    def _area_sort_key(area):
+        return area['nombre_area'].casefold()
+
+    def _index_of_area(self, area_id):
+        return next(
+            (i for i, area in enumerate(self.master_areas_data) if area['id_area_maestro'] == area_id),
+            None
+        )
+
+    def _apply_area_changes(self, upserted=(), deleted_ids=()):
+        """
+        Aplica la respuesta de una escritura a la lista local: inserta, mueve o
+        quita sólo las tarjetas afectadas, manteniendo el orden por nombre.
+        """
+        for area_id in deleted_ids:
+            if area_id == self._selected_id():
+                self._set_selected_area(None)
+            index = self._index_of_area(area_id)
+            if index is not None:
+                self.areas_list.remove_item(index)
+
+        for area in upserted:
+            if area['id_area_maestro'] == self._selected_id():
+                self.selected_area = area
+            data = self.master_areas_data
+            key = self._area_sort_key(area)
+            index = self._index_of_area(area['id_area_maestro'])
+            if index is not None:
+                in_order = (
+                    (index == 0 or self._area_sort_key(data[index - 1]) <= key)
+                    and (index == len(data) - 1 or key <= self._area_sort_key(data[index + 1]))
+                )
+                if in_order:
+                    self.areas_list.update_item(index, area)
+                    continue
+                self.areas_list.remove_item(index)
+            position = bisect.bisect_right(data, key, key=self._area_sort_key)
+            self.areas_list.insert_item(position, area)
+
+        self._update_areas_summary()
+        # El cache queda al día sin volver a pedir la tabla
+        self.local_cache.put("areas_maestro", "*", self.master_areas_data)
+
+    def _on_load_error(self, error):
+        """Muestra el estado de error si la consulta falla"""
         
-        # Limpiar lista actual
-        for widget in self.areas_list_frame.winfo_children():
-            widget.destroy()
+        self.areas_list.set_items([])
+        self._create_error_areas_state(str(error))
+        messagebox.showerror("Error", f"No se pudieron cargar las áreas: {error}")
+
+    def _create_loading_areas_state(self):
+        """Crea el indicador de carga mientras llega la consulta"""
         
-        try:
-            # Obtener áreas de la base de datos
-            self.master_areas_data = self.supabase_client.table("areas_maestro").select("*").order("nombre_area").execute().data
-            
-            # Actualizar contador
-            self.area_count_label.configure(text=f"({len(self.master_areas_data)} áreas)")
-            
-            if not self.master_areas_data:
-                self._create_empty_areas_state()
-            else:
-                for area in self.master_areas_data:
-                    self._create_area_card(area)
-                    
-        except Exception as e:
-            self._create_error_areas_state(str(e))
-            messagebox.showerror("Error", f"No se pudieron cargar las áreas: {e}")
+        ctk.CTkLabel(
+            self.areas_list.show_placeholder(),
+            text="⏳ Cargando áreas...",
+            font=get_font(size=FONT_SIZE_NORMAL),
+            text_color=self.colors['text_secondary']
+        ).pack(pady=40)
 
     def _create_empty_areas_state(self):
         """Crea el estado vacío cuando no hay áreas"""
         
-        empty_frame = ctk.CTkFrame(self.areas_list_frame, fg_color=TRANSPARENT_BG )
+        empty_frame = ctk.CTkFrame(self.areas_list.show_placeholder(), fg_color=TRANSPARENT_BG )
         empty_frame.pack(fill="both", expand=True, pady=40)
         
         ctk.CTkLabel(
             empty_frame,
             text="📦",
-            font=ctk.CTkFont(size=60)
+            font=get_font(size=60)
         ).pack(pady=(0, 10))
         
         ctk.CTkLabel(
             empty_frame,
             text="No hay áreas creadas",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 1, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 1, weight="bold"),
             text_color=self.colors['text_primary']
         ).pack(pady=(0, 5))
         
         ctk.CTkLabel(
             empty_frame,
             text="Crea tu primera área usando el panel de la derecha",
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL),
+            font=get_font(size=FONT_SIZE_SMALL),
             text_color=self.colors['text_secondary']
         ).pack()
 
     def _create_error_areas_state(self, error_msg):
         """Crea el estado de error al cargar áreas"""
         
-        error_frame = ctk.CTkFrame(self.areas_list_frame, fg_color=TRANSPARENT_BG )
+        error_frame = ctk.CTkFrame(self.areas_list.show_placeholder(), fg_color=TRANSPARENT_BG )
         error_frame.pack(fill="both", expand=True, pady=40)
         
         ctk.CTkLabel(
             error_frame,
             text="⚠️ Error al cargar áreas",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             text_color=ERROR_COLOR
         ).pack(pady=(0, 10))
         
         ctk.CTkLabel(
             error_frame,
             text=error_msg,
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL),
+            font=get_font(size=FONT_SIZE_SMALL),
             text_color=self.colors['text_secondary']
         ).pack()
 
-    def _create_area_card(self, area):
-        """Crea una tarjeta para cada área"""
-        
-        # Card frame
-        card_frame = ctk.CTkFrame(
-            self.areas_list_frame,
-            fg_color=TRANSPARENT_BG ,
-            corner_radius=8,
-            border_width=2,
-            border_color=BACKGROUND_CARD
-        )
-        card_frame.pack(fill="x", pady=3, padx=15)
-        
-        # Content frame
-        content_frame = ctk.CTkFrame(card_frame, fg_color=TRANSPARENT_BG )
-        content_frame.pack(fill="x", padx=15, pady=12)
-        
-        # Área name
-        name_label = ctk.CTkLabel(
-            content_frame,
-            text=f"🏠 {area['nombre_area']}",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
-            text_color=self.colors['text_primary'],
-            anchor="w"
-        )
-        name_label.pack(side="left", fill="x", expand=True)
-        
-        # Selection indicator (initially hidden)
-        selection_indicator = ctk.CTkLabel(
-            content_frame,
-            text="✓",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 2, weight="bold"),
-            text_color=SUCCESS_COLOR,
-            width=30
-        )
-        
-        # Click event for selection
-        def select_area(event=None):
-            self._select_area(area, card_frame, selection_indicator)
-        
-        # Bind click events
-        card_frame.bind("<Button-1>", select_area)
-        content_frame.bind("<Button-1>", select_area)
-        name_label.bind("<Button-1>", select_area)
-        
-        # Hover effects
-        def on_enter(event):
-            if card_frame != self.selected_card:
-                card_frame.configure(border_color=BORDER_PRIMARY, fg_color="#FAFAFA")
-        
-        def on_leave(event):
-            if card_frame != self.selected_card:
-                card_frame.configure(border_color=BACKGROUND_CARD, fg_color=TRANSPARENT_BG )
-        
-        card_frame.bind("<Enter>", on_enter)
-        card_frame.bind("<Leave>", on_leave)
+    def _create_area_card(self, parent):
+        """Crea una tarjeta vacía; la lista virtual la reutiliza para distintas áreas"""
+        return _AreaCard(parent, colors=self.colors, on_select=self._select_area)
+
+    def _bind_area_card(self, card, area, index):
+        """Vuelca los datos de un área en una tarjeta reciclada"""
+        if card.area is not None and self._cards_by_id.get(card.area['id_area_maestro']) is card:
+            del self._cards_by_id[card.area['id_area_maestro']]
+        self._cards_by_id[area['id_area_maestro']] = card
+        card.set_area(area, area['id_area_maestro'] == self._selected_id())
 
-    def _select_area(self, area, card_frame, selection_indicator):
+    def _selected_id(self):
+        return self.selected_area['id_area_maestro'] if self.selected_area else None
+
+    def _select_area(self, area):
         """Selecciona un área"""
         
-        # Deseleccionar área anterior
-        if self.selected_card:
-            self.selected_card.configure(
-                border_color=BACKGROUND_CARD , 
-                fg_color=TRANSPARENT_BG 
-            )
-            # Ocultar indicador anterior
-            for widget in self.selected_card.winfo_children():
-                for child in widget.winfo_children():
-                    if isinstance(child, ctk.CTkFrame):
-                        for grandchild in child.winfo_children():
-                            if isinstance(grandchild, ctk.CTkLabel) and grandchild.cget("text") == "✓":
-                                grandchild.pack_forget()
-        
-        # Seleccionar nueva área
-        self.selected_area = area
-        self.selected_card = card_frame
-        
-        # Actualizar apariencia
-        card_frame.configure(
-            border_color=ACCENT_PRIMARY, 
-            fg_color="#FFF7ED"
-        )
-        
-        # Mostrar indicador de selección
-        selection_indicator.pack(side="right")
+        self._set_selected_area(area)
         
         # Actualizar panel de acciones
         self._update_actions_panel()
 
+    def _set_selected_area(self, area):
+        """Cambia la selección retocando sólo la tarjeta anterior y la nueva"""
+        
+        previous_id = self._selected_id()
+        self.selected_area = area
+        current_id = self._selected_id()
+        if previous_id == current_id:
+            return
+        for area_id, selected in ((previous_id, False), (current_id, True)):
+            card = self._cards_by_id.get(area_id)
+            if card is not None and card.area['id_area_maestro'] == area_id:
+                card.set_selected(selected)
+
     def _update_actions_panel(self):
         """Actualiza el panel de acciones con el área seleccionada"""
         
@@ -441,6 +482,10 @@ class AreasView(ctk.CTkFrame):
             self.edit_btn.configure(state="disabled")
             self.delete_btn.configure(state="disabled")
 
+    def _invalidate_project_areas(self):
+        """proyectos_areas embebe el nombre del área: se invalida tras renombrar o eliminar"""
+        self.local_cache.invalidate("proyectos_areas")
+
     def add_area(self):
         """Añade una nueva área"""
         
@@ -457,13 +502,16 @@ class AreasView(ctk.CTkFrame):
         
         try:
             # Insertar en la base de datos
-            self.supabase_client.table("areas_maestro").insert({
+            inserted = self.supabase_client.table("areas_maestro").insert({
                 "nombre_area": new_name
-            }).execute()
+            }).execute().data
             
-            # Limpiar campo y recargar lista
+            # Limpiar campo y agregar sólo la tarjeta nueva
             self.new_area_entry.delete(0, "end")
-            self.load_master_areas()
+            if inserted:
+                self._apply_area_changes(upserted=inserted)
+            else:
+                self.load_master_areas()
             
             # Mostrar mensaje de éxito
             messagebox.showinfo("Éxito", f"Área '{new_name}' añadida correctamente.")
@@ -505,14 +553,16 @@ class AreasView(ctk.CTkFrame):
         
         try:
             # Actualizar en la base de datos
-            self.supabase_client.table("areas_maestro").update({
+            updated = self.supabase_client.table("areas_maestro").update({
                 "nombre_area": new_name
-            }).eq(id_column_name, self.selected_area[id_column_name]).execute()
+            }).eq(id_column_name, self.selected_area[id_column_name]).execute().data
+            self._invalidate_project_areas()
             
-            # Recargar lista
-            self.selected_area = None
-            self.selected_card = None
-            self.load_master_areas()
+            # Actualizar (o reubicar) sólo la tarjeta editada; sigue seleccionada
+            if updated:
+                self._apply_area_changes(upserted=updated)
+            else:
+                self.load_master_areas()
             self._update_actions_panel()
             
             # Mostrar mensaje de éxito
@@ -540,18 +590,97 @@ class AreasView(ctk.CTkFrame):
             id_column_name = 'id_area_maestro'
 
             # Eliminar de la base de datos
-            self.supabase_client.table("areas_maestro").delete().eq(
+            deleted = self.supabase_client.table("areas_maestro").delete().eq(
                 id_column_name, self.selected_area[id_column_name]
-            ).execute()
+            ).execute().data
+            self._invalidate_project_areas()
             
-            # Recargar lista
-            self.selected_area = None
-            self.selected_card = None
-            self.load_master_areas()
+            # Quitar sólo la tarjeta eliminada (y con ella la selección)
+            if deleted:
+                self._apply_area_changes(deleted_ids=[area[id_column_name] for area in deleted])
+            else:
+                self.load_master_areas()
             self._update_actions_panel()
             
             # Mostrar mensaje de éxito
             messagebox.showinfo("Éxito", "Área eliminada correctamente.")
             
         except Exception as e:
-            messagebox.showerror("Error", f"No se pudo eliminar el área: {e}")
\ No newline at end of file
+            messagebox.showerror("Error", f"No se pudo eliminar el área: {e}")
+
+
+class _AreaCard(ctk.CTkFrame):
+    """Tarjeta de área reutilizable: los widgets se crean una sola vez
+    y `set_area` sólo cambia el texto y el estado de selección. Guarda
+    referencias directas a sus widgets, así que seleccionar o resaltar
+    una tarjeta no recorre el árbol."""
+
+    def __init__(self, master, colors, on_select, **kwargs):
+        super().__init__(
+            master,
+            fg_color=BACKGROUND_CARD,
+            corner_radius=8,
+            border_width=2,
+            border_color=BACKGROUND_CARD,
+            height=AREA_CARD_HEIGHT,
+            **kwargs
+        )
+        self.area = None
+        self.selected = False
+        self.on_select = on_select
+
+        # Content frame
+        content_frame = ctk.CTkFrame(self, fg_color=TRANSPARENT_BG )
+        content_frame.pack(fill="x", padx=15, pady=12)
+
+        # Área name
+        self.name_label = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
+            text_color=colors['text_primary'],
+            anchor="w"
+        )
+        self.name_label.pack(side="left", fill="x", expand=True)
+
+        # Selection indicator (initially hidden)
+        self.selection_indicator = ctk.CTkLabel(
+            content_frame,
+            text="✓",
+            font=get_font(size=FONT_SIZE_NORMAL + 2, weight="bold"),
+            text_color=SUCCESS_COLOR,
+            width=30
+        )
+
+        # Bind click events
+        for widget in (self, content_frame, self.name_label):
+            widget.bind("<Button-1>", lambda e: self.on_select(self.area))
+
+        # Hover effects
+        self.bind("<Enter>", self._on_enter)
+        self.bind("<Leave>", self._on_leave)
+
+    def set_area(self, area, selected):
+        """Enlaza la tarjeta con otra área y aplica su estado de selección"""
+        self.area = area
+        self.name_label.configure(text=f"🏠 {area['nombre_area']}")
+        self.set_selected(selected)
+
+    def set_selected(self, selected):
+        if selected == self.selected:
+            return
+        self.selected = selected
+        if selected:
+            theme.configure(self, border_color=theme.color("accent"), fg_color=theme.color("card_selected"))
+            self.selection_indicator.pack(side="right")
+        else:
+            theme.configure(self, border_color=theme.color("card_bg"), fg_color=theme.color("card_bg"))
+            self.selection_indicator.pack_forget()
+
+    def _on_enter(self, event):
+        if not self.selected:
+            theme.configure(self, border_color=theme.color("border"), fg_color=theme.color("card_hover"))
+
+    def _on_leave(self, event):
+        if not self.selected:
+            theme.configure(self, border_color=theme.color("card_bg"), fg_color=theme.color("card_bg"))
@@ -4,22 +4,36 @@ import customtkinter as ctk
 from tkinter import messagebox
 from config import (
     FONT_SIZE_TITLE, FONT_SIZE_NORMAL, FONT_SIZE_SMALL, 
-    get_main_colors, BACKGROUND_CARD, ACCENT_PRIMARY, 
+    BACKGROUND_CARD, ACCENT_PRIMARY, 
     ACCENT_HOVER, TEXT_PRIMARY, TEXT_SECONDARY, BORDER_PRIMARY,
     SUCCESS_COLOR, ERROR_COLOR, WARNING_COLOR, INFO_COLOR, 
     NEUTRAL_COLOR, TRANSPARENT_BG, TRANSPARENT_HOVER
 )
+import time
+from src.database.query_profiler import profiler
+from src.services.system_metrics import count_widgets, current_rss_mb, percentiles
+from src.ui.styles import get_font, get_colors
+from src.ui import theme
+
+# Refresco de las métricas en vivo; el conteo de widgets (recorre todo el
+# árbol) se hace sólo cada WIDGET_COUNT_EVERY refrescos
+METRICS_REFRESH_MS = 2000
+WIDGET_COUNT_EVERY = 5
 
 class ConfiguracionView(ctk.CTkFrame):
     def __init__(self, master, master_app, on_logout, **kwargs):
-        colors = get_main_colors()
+        colors = get_colors('main')
         super().__init__(master, fg_color=colors['bg_primary'], **kwargs)
         
         self.on_logout = on_logout
         self.master_app = master_app
         self.colors = colors
+        self._metric_labels = {}
+        self._metrics_after_id = None
+        self._metrics_ticks = 0
         
         self._build_ui()
+        self._refresh_system_metrics()
 
     def _build_ui(self):
         """Construye la interfaz de usuario"""
@@ -32,7 +46,7 @@ class ConfiguracionView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_frame, 
             text="⚙️ Configuración de la Aplicación", 
-            font=ctk.CTkFont(size=FONT_SIZE_TITLE, weight="bold"),
+            font=get_font(size=FONT_SIZE_TITLE, weight="bold"),
             text_color=self.colors['text_primary']
         )
         title_label.pack(side="left", anchor="w", pady=15)
@@ -41,7 +55,7 @@ class ConfiguracionView(ctk.CTkFrame):
         desc_label = ctk.CTkLabel(
             header_frame, 
             text="Personaliza tu experiencia y gestiona tu cuenta", 
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1),
+            font=get_font(size=FONT_SIZE_SMALL + 1),
             text_color=self.colors['text_secondary']
         )
         desc_label.pack(side="left", anchor="w", padx=(20, 0))
@@ -99,14 +113,14 @@ class ConfiguracionView(ctk.CTkFrame):
         ctk.CTkLabel(
             user_content,
             text="📧 Email:",
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL, weight="bold"),
+            font=get_font(size=FONT_SIZE_SMALL, weight="bold"),
             text_color=self.colors['text_secondary']
         ).pack(anchor="w")
         
         ctk.CTkLabel(
             user_content,
             text="usuario@ejemplo.com",  # Placeholder
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL),
+            font=get_font(size=FONT_SIZE_NORMAL),
             text_color=self.colors['text_primary']
         ).pack(anchor="w", pady=(2, 10))
         
@@ -114,7 +128,7 @@ class ConfiguracionView(ctk.CTkFrame):
         ctk.CTkLabel(
             user_content,
             text="🟢 Sesión activa",
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL),
+            font=get_font(size=FONT_SIZE_SMALL),
             text_color=SUCCESS_COLOR
         ).pack(anchor="w")
         
@@ -128,7 +142,7 @@ class ConfiguracionView(ctk.CTkFrame):
             text="🔑 Cambiar Contraseña",
             command=self._show_change_password_info,
             height=40,
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             fg_color=TRANSPARENT_BG,
             hover_color=TRANSPARENT_HOVER,
             text_color=self.colors['text_primary'],
@@ -144,7 +158,7 @@ class ConfiguracionView(ctk.CTkFrame):
             text="🚪 Cerrar Sesión",
             command=self._confirm_logout,
             height=45,
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             fg_color=ERROR_COLOR,
             hover_color="#DC2626",
             corner_radius=8
@@ -177,13 +191,13 @@ class ConfiguracionView(ctk.CTkFrame):
         ctk.CTkLabel(
             theme_frame,
             text="🌙 Tema de la aplicación:",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             text_color=self.colors['text_primary']
         ).pack(anchor="w", pady=(0, 8))
         
         theme_combo = ctk.CTkComboBox(
             theme_frame,
-            values=["Claro", "Oscuro", "Sistema"],
+            values=list(theme.THEME_LABELS.values()),
             state="readonly",
             height=40,
             corner_radius=8,
@@ -191,9 +205,10 @@ class ConfiguracionView(ctk.CTkFrame):
             border_color=BORDER_PRIMARY,
             button_color=ACCENT_PRIMARY,
             button_hover_color=ACCENT_HOVER,
-            dropdown_hover_color=ACCENT_HOVER
+            dropdown_hover_color=ACCENT_HOVER,
+            command=self._on_theme_selected
         )
-        theme_combo.set("Claro")
+        theme_combo.set(theme.THEME_LABELS[theme.current_mode()])
         theme_combo.pack(fill="x")
         
         # Auto-save option
@@ -205,7 +220,7 @@ class ConfiguracionView(ctk.CTkFrame):
             autosave_frame,
             text="💾 Guardado automático",
             variable=autosave_var,
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             text_color=self.colors['text_primary'],
             border_color=ACCENT_PRIMARY,
             checkmark_color=ACCENT_PRIMARY
@@ -215,7 +230,7 @@ class ConfiguracionView(ctk.CTkFrame):
         ctk.CTkLabel(
             autosave_frame,
             text="Guarda automáticamente los cambios en las dimensiones",
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL),
+            font=get_font(size=FONT_SIZE_SMALL),
             text_color=self.colors['text_secondary']
         ).pack(anchor="w", padx=(25, 0), pady=(5, 0))
 
@@ -238,32 +253,39 @@ class ConfiguracionView(ctk.CTkFrame):
         content_frame = ctk.CTkFrame(system_card, fg_color=TRANSPARENT_BG)
         content_frame.pack(fill="both", expand=True, padx=25, pady=(0, 25))
         
-        # App info
+        # App info; las filas con clave se actualizan en vivo (ver _refresh_system_metrics)
         info_items = [
-            ("📱 Aplicación:", "BuildMate v1.0.0"),
-            ("🗏 Tipo:", "Sistema de Gestión de Construcción"),
-            ("📅 Última actualización:", "Septiembre 2025"),
-            ("💾 Base de datos:", "Conectado ✅"),
-            ("🔧 Estado:", "Funcionando correctamente")
+            (None, "📱 Aplicación:", "BuildMate v1.0.0"),
+            (None, "🗏 Tipo:", "Sistema de Gestión de Construcción"),
+            (None, "📅 Última actualización:", "Septiembre 2025"),
+            ('latency', "💾 Latencia BD (p50/p95/p99):", "…"),
+            ('cache', "📦 Aciertos de cache:", "…"),
+            ('stalls', "⏱️ Bloqueos de la interfaz:", "…"),
+            ('memory', "🧠 Memoria:", "…"),
+            ('widgets', "🧩 Widgets:", "…"),
+            ('last_sync', "🔄 Última sincronización:", "…")
         ]
         
-        for label, value in info_items:
+        for key, label, value in info_items:
             item_frame = ctk.CTkFrame(content_frame, fg_color=TRANSPARENT_BG)
             item_frame.pack(fill="x", pady=2)
             
             ctk.CTkLabel(
                 item_frame,
                 text=label,
-                font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1, weight="bold"),
+                font=get_font(size=FONT_SIZE_SMALL + 1, weight="bold"),
                 text_color=self.colors['text_secondary']
             ).pack(side="left")
             
-            ctk.CTkLabel(
+            value_label = ctk.CTkLabel(
                 item_frame,
                 text=value,
-                font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1),
+                font=get_font(size=FONT_SIZE_SMALL + 1),
                 text_color=self.colors['text_primary']
-            ).pack(side="right")
+            )
+            value_label.pack(side="right")
+            if key:
+                self._metric_labels[key] = value_label
         
         # Separator
         separator = ctk.CTkFrame(content_frame, height=1, fg_color=BORDER_PRIMARY)
@@ -275,7 +297,7 @@ class ConfiguracionView(ctk.CTkFrame):
             text="🔄 Buscar Actualizaciones",
             command=self._check_updates,
             height=35,
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1, weight="bold"),
+            font=get_font(size=FONT_SIZE_SMALL + 1, weight="bold"),
             fg_color=TRANSPARENT_BG,
             hover_color=TRANSPARENT_HOVER,
             text_color=self.colors['text_primary'],
@@ -285,6 +307,54 @@ class ConfiguracionView(ctk.CTkFrame):
         )
         check_updates_btn.pack(fill="x")
 
+    def _refresh_system_metrics(self):
+        """Actualiza las métricas en vivo; con la página oculta sólo se reagenda."""
+        
+        self._metrics_after_id = self.after(METRICS_REFRESH_MS, self._refresh_system_metrics)
+        if self._metrics_ticks and not self.winfo_ismapped():
+            return
+        app = self.master_app
+        
+        stats = percentiles(profiler.latencies())
+        latency = f"{stats[50]:.0f} / {stats[95]:.0f} / {stats[99]:.0f} ms" if stats else "sin consultas"
+        
+        cache = app.local_cache
+        hit_rate = cache.hit_rate()
+        cache_text = f"{hit_rate:.0%} ({cache.hits}/{cache.hits + cache.misses})" if hit_rate is not None else "sin lecturas"
+        
+        monitor = getattr(app, 'loop_monitor', None)
+        if monitor is None:
+            stalls = "—"
+        elif monitor.stall_count:
+            stalls = f"{monitor.stall_count} (máx. {monitor.longest_stall_ms:.0f} ms)"
+        else:
+            stalls = "ninguno"
+        
+        rss = current_rss_mb()
+        last_sync = cache.get_last_sync()
+        
+        values = {
+            'latency': latency,
+            'cache': cache_text,
+            'stalls': stalls,
+            'memory': f"{rss:.0f} MB" if rss is not None else "—",
+            'last_sync': time.strftime("%d/%m %H:%M:%S", time.localtime(last_sync)) if last_sync else "nunca",
+        }
+        if self._metrics_ticks % WIDGET_COUNT_EVERY == 0:
+            values['widgets'] = f"{count_widgets(self.winfo_toplevel()):,}".replace(",", ".")
+        self._metrics_ticks += 1
+        
+        for key, text in values.items():
+            label = self._metric_labels[key]
+            if label.cget("text") != text:
+                label.configure(text=text)
+
+    def destroy(self):
+        if self._metrics_after_id is not None:
+            self.after_cancel(self._metrics_after_id)
+            self._metrics_after_id = None
+        super().destroy()
+
     def _create_support_section(self, parent, row, col):
         """Crea la sección de soporte"""
         
@@ -308,7 +378,7 @@ class ConfiguracionView(ctk.CTkFrame):
         help_text = ctk.CTkLabel(
             content_frame,
             text="¿Necesitas ayuda con BuildMate?\nEstamos aquí para asistirte",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL),
+            font=get_font(size=FONT_SIZE_NORMAL),
             text_color=self.colors['text_primary'],
             justify="center"
         )
@@ -319,7 +389,8 @@ class ConfiguracionView(ctk.CTkFrame):
             ("📚", "Manual de Usuario", self._open_manual, INFO_COLOR),
             ("💬", "Reportar Problema", self._report_issue, WARNING_COLOR),
             ("📧", "Contactar Soporte", self._contact_support, ACCENT_PRIMARY),
-            ("⭐", "Calificar App", self._rate_app, SUCCESS_COLOR)
+            ("⭐", "Calificar App", self._rate_app, SUCCESS_COLOR),
+            ("🔍", "Perfil de Consultas", self.master_app.open_query_profiler, NEUTRAL_COLOR)
         ]
         
         for icon, text, command, color in buttons_data:
@@ -328,7 +399,7 @@ class ConfiguracionView(ctk.CTkFrame):
                 text=f"{icon} {text}",
                 command=command,
                 height=40,
-                font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1, weight="bold"),
+                font=get_font(size=FONT_SIZE_SMALL + 1, weight="bold"),
                 fg_color=color,
                 hover_color=self._darken_color(color),
                 corner_radius=8
@@ -348,7 +419,7 @@ class ConfiguracionView(ctk.CTkFrame):
         icon_label = ctk.CTkLabel(
             header_content,
             text=icon,
-            font=ctk.CTkFont(size=20)
+            font=get_font(size=20)
         )
         icon_label.pack(side="left", padx=(0, 10))
         
@@ -356,7 +427,7 @@ class ConfiguracionView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_content,
             text=title,
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 1, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 1, weight="bold"),
             text_color="white"
         )
         title_label.pack(side="left")
@@ -372,6 +443,12 @@ class ConfiguracionView(ctk.CTkFrame):
         }
         return color_map.get(color, "#374151")
 
+    def _on_theme_selected(self, label):
+        """Aplica el tema elegido sobre la ventana sin reconstruir las páginas"""
+        mode = next((m for m, text in theme.THEME_LABELS.items() if text == label), "light")
+        if mode != theme.current_mode():
+            theme.set_theme(mode, self.winfo_toplevel())
+
     def _confirm_logout(self):
         """Confirma el cierre de sesión"""
         
@@ -392,7 +469,7 @@ class ConfiguracionView(ctk.CTkFrame):
         icon_label = ctk.CTkLabel(
             dialog,
             text="🚪",
-            font=ctk.CTkFont(size=60)
+            font=get_font(size=60)
         )
         icon_label.pack(pady=(30, 10))
         
@@ -400,7 +477,7 @@ class ConfiguracionView(ctk.CTkFrame):
         message_label = ctk.CTkLabel(
             dialog,
             text="¿Estás seguro que deseas cerrar sesión?",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 2, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 2, weight="bold"),
             text_color=self.colors['text_primary']
         )
         message_label.pack(pady=(0, 5))
@@ -408,7 +485,7 @@ class ConfiguracionView(ctk.CTkFrame):
         sub_message_label = ctk.CTkLabel(
             dialog,
             text="Tendrás que volver a iniciar sesión la próxima vez",
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1),
+            font=get_font(size=FONT_SIZE_SMALL + 1),
             text_color=self.colors['text_secondary']
         )
         sub_message_label.pack(pady=(0, 30))
@@ -468,7 +545,7 @@ class ConfiguracionView(ctk.CTkFrame):
         ctk.CTkLabel(
             progress_dialog,
             text="🔄 Buscando actualizaciones...",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 1, weight="bold")
+            font=get_font(size=FONT_SIZE_NORMAL + 1, weight="bold")
         ).pack(pady=30)
         
         progress_bar = ctk.CTkProgressBar(progress_dialog, width=250)
@@ -516,14 +593,14 @@ class ConfiguracionView(ctk.CTkFrame):
         ctk.CTkLabel(
             dialog,
             text="🐛 Reportar Problema",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 4, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 4, weight="bold"),
             text_color=self.colors['text_primary']
         ).pack(pady=(20, 10))
         
         ctk.CTkLabel(
             dialog,
             text="Describe el problema que encontraste",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL),
+            font=get_font(size=FONT_SIZE_NORMAL),
             text_color=self.colors['text_secondary']
         ).pack(pady=(0, 20))
         
@@ -609,14 +686,14 @@ class ConfiguracionView(ctk.CTkFrame):
         ctk.CTkLabel(
             dialog,
             text="⭐ Califica BuildMate",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 4, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 4, weight="bold"),
             text_color=self.colors['text_primary']
         ).pack(pady=(30, 10))
         
         ctk.CTkLabel(
             dialog,
             text="¿Qué te parece nuestra aplicación?",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL),
+            font=get_font(size=FONT_SIZE_NORMAL),
             text_color=self.colors['text_secondary']
         ).pack(pady=(0, 20))
         
@@ -632,7 +709,7 @@ class ConfiguracionView(ctk.CTkFrame):
                 text=f"{i} ⭐",
                 variable=rating_var,
                 value=i,
-                font=ctk.CTkFont(size=FONT_SIZE_NORMAL),
+                font=get_font(size=FONT_SIZE_NORMAL),
                 text_color=self.colors['text_primary']
             )
             star_btn.pack(pady=2)
@@ -641,7 +718,7 @@ class ConfiguracionView(ctk.CTkFrame):
         ctk.CTkLabel(
             dialog,
             text="Comentarios (opcional):",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             text_color=self.colors['text_primary']
         ).pack(anchor="w", padx=40, pady=(20, 5))
         
@@ -4,14 +4,15 @@ import customtkinter as ctk
 from tkinter import messagebox
 from config import (
     FONT_SIZE_TITLE, FONT_SIZE_NORMAL, FONT_SIZE_SMALL, 
-    get_main_colors, BACKGROUND_CARD, ACCENT_PRIMARY, 
+    BACKGROUND_CARD, ACCENT_PRIMARY, 
     ACCENT_HOVER, TEXT_PRIMARY, TEXT_SECONDARY, BORDER_PRIMARY,
     SUCCESS_COLOR, WARNING_COLOR, INFO_COLOR,TRANSPARENT_BG
 )
+from src.ui.styles import get_font, get_colors
 
 class MaterialesView(ctk.CTkFrame):
     def __init__(self, master, master_app, **kwargs):
-        colors = get_main_colors()
+        colors = get_colors('main')
         super().__init__(master, fg_color=colors['bg_primary'], **kwargs)
         
         self.supabase_client = master_app.supabase_client
@@ -35,7 +36,7 @@ class MaterialesView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             title_frame, 
             text="🧱 Gestión de Materiales", 
-            font=ctk.CTkFont(size=FONT_SIZE_TITLE, weight="bold"),
+            font=get_font(size=FONT_SIZE_TITLE, weight="bold"),
             text_color=self.colors['text_primary']
         )
         title_label.pack(side="left", anchor="w")
@@ -44,7 +45,7 @@ class MaterialesView(ctk.CTkFrame):
         desc_label = ctk.CTkLabel(
             title_frame, 
             text="Administra el catálogo de materiales de construcción", 
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1),
+            font=get_font(size=FONT_SIZE_SMALL + 1),
             text_color=self.colors['text_secondary']
         )
         desc_label.pack(side="left", anchor="w", padx=(20, 0))
@@ -65,7 +66,7 @@ class MaterialesView(ctk.CTkFrame):
         ctk.CTkLabel(
             status_content,
             text="🚧",
-            font=ctk.CTkFont(size=24)
+            font=get_font(size=24)
         ).pack(side="left", padx=(0, 15))
         
         # Mensaje de estado
@@ -75,14 +76,14 @@ class MaterialesView(ctk.CTkFrame):
         ctk.CTkLabel(
             status_text_frame,
             text="Módulo en Desarrollo",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 2, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 2, weight="bold"),
             text_color="white"
         ).pack(anchor="w")
         
         ctk.CTkLabel(
             status_text_frame,
             text="Este módulo está siendo desarrollado y estará disponible próximamente",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL),
+            font=get_font(size=FONT_SIZE_NORMAL),
             text_color="white"
         ).pack(anchor="w")
         
@@ -184,7 +185,7 @@ class MaterialesView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_frame,
             text=title,
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 1, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 1, weight="bold"),
             text_color="white"
         )
         title_label.pack(pady=15)
@@ -197,7 +198,7 @@ class MaterialesView(ctk.CTkFrame):
         desc_label = ctk.CTkLabel(
             content_frame,
             text=description,
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1),
+            font=get_font(size=FONT_SIZE_SMALL + 1),
             text_color=self.colors['text_primary'],
             wraplength=250,
             justify="left"
@@ -209,7 +210,7 @@ class MaterialesView(ctk.CTkFrame):
             feature_label = ctk.CTkLabel(
                 content_frame,
                 text=feature,
-                font=ctk.CTkFont(size=FONT_SIZE_SMALL),
+                font=get_font(size=FONT_SIZE_SMALL),
                 text_color=self.colors['text_secondary'],
                 anchor="w",
                 justify="left"
@@ -223,7 +224,7 @@ class MaterialesView(ctk.CTkFrame):
         ctk.CTkLabel(
             status_frame,
             text="⏳ Próximamente disponible",
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL, weight="bold"),
+            font=get_font(size=FONT_SIZE_SMALL, weight="bold"),
             text_color="#92400E"
         ).pack(pady=8)
         
@@ -251,7 +252,7 @@ class MaterialesView(ctk.CTkFrame):
         ctk.CTkLabel(
             info_frame,
             text="💡",
-            font=ctk.CTkFont(size=20)
+            font=get_font(size=20)
         ).pack(side="left", padx=(0, 10))
         
         # Texto informativo
@@ -261,14 +262,14 @@ class MaterialesView(ctk.CTkFrame):
         ctk.CTkLabel(
             info_text_frame,
             text="¿Tienes sugerencias para el módulo de materiales?",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             text_color=self.colors['text_primary']
         ).pack(anchor="w")
         
         ctk.CTkLabel(
             info_text_frame,
             text="Tu feedback es importante para nosotros. Comparte tus ideas sobre qué funcionalidades te gustaría ver en este módulo.",
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL),
+            font=get_font(size=FONT_SIZE_SMALL),
             text_color=self.colors['text_secondary']
         ).pack(anchor="w", pady=(5, 0))
         
@@ -279,7 +280,7 @@ class MaterialesView(ctk.CTkFrame):
             command=self._show_feedback_dialog,
             height=40,
             width=180,
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1, weight="bold"),
+            font=get_font(size=FONT_SIZE_SMALL + 1, weight="bold"),
             fg_color=ACCENT_PRIMARY,
             hover_color=ACCENT_HOVER,
             corner_radius=10
@@ -312,7 +313,7 @@ class MaterialesView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             dialog,
             text="💡 Comparte tus Ideas",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 4, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 4, weight="bold"),
             text_color=self.colors['text_primary']
         )
         title_label.pack(pady=(20, 10))
@@ -321,7 +322,7 @@ class MaterialesView(ctk.CTkFrame):
         desc_label = ctk.CTkLabel(
             dialog,
             text="¿Qué funcionalidades te gustaría ver en el módulo de materiales?",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL),
+            font=get_font(size=FONT_SIZE_NORMAL),
             text_color=self.colors['text_secondary']
         )
         desc_label.pack(pady=(0, 20))
@@ -333,7 +334,7 @@ class MaterialesView(ctk.CTkFrame):
             corner_radius=10,
             border_width=2,
             border_color=BORDER_PRIMARY,
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL)
+            font=get_font(size=FONT_SIZE_NORMAL)
         )
         feedback_text.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
@@ -3,29 +3,49 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from src.ui.windows.doors_windows_manager import DoorsWindowsManager
+from src.services.project_model import ProjectModel, fetch_project_graph
+from src.services.area_stats import AreaAggregator
+from src.services.materials_engine import MATERIAL_QUANTITIES, areas_to_arrays, compute_materials, summarize
 from config import (
     FONT_SIZE_TITLE, FONT_SIZE_NORMAL, FONT_SIZE_SMALL,
-    get_main_colors, BACKGROUND_CARD, ACCENT_PRIMARY,
+    BACKGROUND_CARD, ACCENT_PRIMARY,
     ACCENT_HOVER, TEXT_PRIMARY, TEXT_SECONDARY, BORDER_PRIMARY,
     SUCCESS_COLOR, ERROR_COLOR, WARNING_COLOR, TRANSPARENT_BG
 )
+from src.ui.styles import get_font, get_colors
+from src.ui import theme
 
 class ProjectDetailPage(ctk.CTkFrame):
     def __init__(self, master, master_app, proyecto, on_back, **kwargs):
-        colors = get_main_colors()
+        colors = get_colors('main')
         super().__init__(master, fg_color=colors['bg_primary'], **kwargs)
 
         self.supabase_client = master_app.supabase_client
+        self.query_executor = master_app.query_executor
+        self.local_cache = master_app.local_cache
         self.proyecto = proyecto
         self.on_back = on_back
         self.colors = colors
         self.project_areas = []
+        self.project_model = None
 
         self.stat_total_areas_label = None
         self.stat_total_m2_label = None
+        self.stat_wall_m2_label = None
+        self.stat_volume_label = None
+
+        # Totales incrementales; las etiquetas se refrescan a lo sumo una vez por cuadro
+        self.area_stats = AreaAggregator()
+        self._stats_refresh_id = None
 
         # Lista para guardar referencias a los widgets de cada fila
         self.area_widget_refs = []
+        # Ids de las filas cuyas dimensiones difieren de lo último guardado
+        self.dirty_area_ids = set()
+        self.save_all_button = None
+
+        self.material_selector = None
+        self.materials_results_frame = None
 
         self.build_ui()
 
@@ -60,7 +80,7 @@ class ProjectDetailPage(ctk.CTkFrame):
 
         back_btn = ctk.CTkButton(
             header_frame, text="← Volver a Proyectos", command=self.on_back, height=40, width=160,
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"), fg_color=TRANSPARENT_BG,
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"), fg_color=TRANSPARENT_BG,
             hover_color=BORDER_PRIMARY, text_color=self.colors['text_primary'], border_width=2,
             border_color=BORDER_PRIMARY, corner_radius=10
         )
@@ -71,14 +91,14 @@ class ProjectDetailPage(ctk.CTkFrame):
 
         ctk.CTkLabel(
             title_frame, text=f"🏗️ {self.proyecto['nombre_proyecto']}",
-            font=ctk.CTkFont(size=FONT_SIZE_TITLE + 2, weight="bold"),
+            font=get_font(size=FONT_SIZE_TITLE + 2, weight="bold"),
             text_color=self.colors['text_primary'], anchor="w"
         ).pack(anchor="w")
 
         if self.proyecto.get('direccion_proyecto'):
             ctk.CTkLabel(
                 title_frame, text=f"📍 {self.proyecto['direccion_proyecto']}",
-                font=ctk.CTkFont(size=FONT_SIZE_NORMAL),
+                font=get_font(size=FONT_SIZE_NORMAL),
                 text_color=self.colors['text_secondary'], anchor="w"
             ).pack(anchor="w", pady=(5, 0))
 
@@ -90,6 +110,8 @@ class ProjectDetailPage(ctk.CTkFrame):
         self.stat_total_areas_label = self._create_stat_item(tab, "📋", "Áreas Totales", "...", 0, 0)
         self.stat_total_m2_label = self._create_stat_item(tab, "📏", "Área Total (m²)", "...", 0, 1)
         self._create_stat_item(tab, "📅", "Fecha Creación", self._format_date(self.proyecto.get('fecha_creacion')), 0, 2)
+        self.stat_wall_m2_label = self._create_stat_item(tab, "🧱", "Superficie de Muros (m²)", "...", 1, 0)
+        self.stat_volume_label = self._create_stat_item(tab, "📦", "Volumen (m³)", "...", 1, 1)
 
     def _create_stat_item(self, parent, icon, label, value, row, col):
         """Crea un elemento de estadística y devuelve el label del valor para futuras actualizaciones."""
@@ -99,16 +121,16 @@ class ProjectDetailPage(ctk.CTkFrame):
         content = ctk.CTkFrame(stat_frame, fg_color=TRANSPARENT_BG)
         content.pack(fill="x", padx=15, pady=15)
 
-        ctk.CTkLabel(content, text=icon, font=ctk.CTkFont(size=20)).pack(pady=(0, 5))
+        ctk.CTkLabel(content, text=icon, font=get_font(size=20)).pack(pady=(0, 5))
 
         value_label = ctk.CTkLabel(
-            content, text=str(value), font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 2, weight="bold"),
+            content, text=str(value), font=get_font(size=FONT_SIZE_NORMAL + 2, weight="bold"),
             text_color=ACCENT_PRIMARY
         )
         value_label.pack()
 
         ctk.CTkLabel(
-            content, text=label, font=ctk.CTkFont(size=FONT_SIZE_SMALL),
+            content, text=label, font=get_font(size=FONT_SIZE_SMALL),
             text_color=self.colors['text_secondary']
         ).pack(pady=(2, 0))
 
@@ -124,13 +146,13 @@ class ProjectDetailPage(ctk.CTkFrame):
 
         ctk.CTkLabel(
             areas_header, text="Gestión de Áreas del Proyecto",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 3, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 3, weight="bold"),
             text_color=self.colors['text_primary']
         ).pack(side="left")
 
         ctk.CTkButton(
             areas_header, text="+ Agregar Área", height=35, width=130,
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1, weight="bold"),
+            font=get_font(size=FONT_SIZE_SMALL + 1, weight="bold"),
             fg_color=ACCENT_PRIMARY, hover_color=ACCENT_HOVER, corner_radius=8,
             command=self._show_add_area_info
         ).pack(side="right")
@@ -138,13 +160,13 @@ class ProjectDetailPage(ctk.CTkFrame):
         self.areas_container = ctk.CTkFrame(tab, fg_color=TRANSPARENT_BG)
         self.areas_container.grid(row=1, column=0, sticky="nsew", padx=20, pady=0)
 
-        save_all_button = ctk.CTkButton(
+        self.save_all_button = ctk.CTkButton(
             tab, text="💾 Guardar Todos los Cambios", height=40,
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             fg_color=SUCCESS_COLOR, hover_color="#059669",
             command=self.save_all_changes
         )
-        save_all_button.grid(row=2, column=0, sticky="e", padx=20, pady=15)
+        self.save_all_button.grid(row=2, column=0, sticky="e", padx=20, pady=15)
 
         self.load_project_areas()
 
@@ -156,67 +178,165 @@ class ProjectDetailPage(ctk.CTkFrame):
 
         ctk.CTkLabel(
             container, text="Cálculo de Materiales por Tipo",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 3, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 3, weight="bold"),
             text_color=self.colors['text_primary']
         ).pack(anchor="w")
 
         ctk.CTkLabel(
             container, text="Selecciona un tipo de material para comenzar el cálculo.",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL), text_color=TEXT_SECONDARY
+            font=get_font(size=FONT_SIZE_NORMAL), text_color=TEXT_SECONDARY
         ).pack(anchor="w", pady=(5, 15))
 
-        material_types = ["Pintura", "Techo", "Piso", "Muros", "Electricidad"]
-        segmented_button = ctk.CTkSegmentedButton(
+        material_types = list(MATERIAL_QUANTITIES)
+        self.material_selector = ctk.CTkSegmentedButton(
             container, values=material_types, height=40,
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             selected_color=ACCENT_PRIMARY,
-            selected_hover_color=ACCENT_HOVER
+            selected_hover_color=ACCENT_HOVER,
+            command=lambda _: self._refresh_materials()
         )
-        segmented_button.pack(fill="x", pady=10)
+        self.material_selector.pack(fill="x", pady=10)
 
-        ctk.CTkLabel(
-            container, text="🚧 Esta sección está en desarrollo y mostrará los cálculos detallados para el tipo de material seleccionado.",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL), text_color=WARNING_COLOR, wraplength=600
-        ).pack(pady=40)
+        self.materials_results_frame = ctk.CTkFrame(container, fg_color="#F8FAFC", corner_radius=10)
+        self.materials_results_frame.pack(fill="x", pady=(10, 0))
+        self._refresh_materials()
+
+    def _refresh_materials(self):
+        """Recalcula los materiales del tipo seleccionado con las dimensiones guardadas del proyecto."""
+        if not self.materials_results_frame:
+            return
+        for widget in self.materials_results_frame.winfo_children():
+            widget.destroy()
+
+        material = self.material_selector.get()
+        if not material:
+            message = "Selecciona un tipo de material para ver el cálculo."
+        elif not self.project_model or not len(self.project_model):
+            message = "El proyecto no tiene áreas para calcular."
+        else:
+            message = None
+        if message:
+            ctk.CTkLabel(
+                self.materials_results_frame, text=message,
+                font=get_font(size=FONT_SIZE_NORMAL), text_color=TEXT_SECONDARY
+            ).pack(padx=15, pady=20)
+            return
+
+        totals = summarize(compute_materials(areas_to_arrays(self.project_model.areas)))
+        lines = [
+            ("Superficie de piso", totals['piso_m2_neto'], "m²"),
+            ("Superficie neta de muros", totals['muros_netos_m2'], "m²"),
+        ] + [(label, totals[key], unit) for key, label, unit in MATERIAL_QUANTITIES[material]]
+
+        for row, (label, value, unit) in enumerate(lines):
+            is_material = row >= 2
+            ctk.CTkLabel(
+                self.materials_results_frame, text=label,
+                font=get_font(size=FONT_SIZE_NORMAL, weight="bold" if is_material else "normal"),
+                text_color=self.colors['text_primary'] if is_material else TEXT_SECONDARY, anchor="w"
+            ).grid(row=row, column=0, sticky="w", padx=15, pady=6)
+            ctk.CTkLabel(
+                self.materials_results_frame, text=f"{value:,.2f} {unit}",
+                font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
+                text_color=ACCENT_PRIMARY if is_material else TEXT_SECONDARY, anchor="e"
+            ).grid(row=row, column=1, sticky="e", padx=15, pady=6)
+        self.materials_results_frame.grid_columnconfigure(1, weight=1)
 
     def load_project_areas(self):
         """Carga y muestra las áreas del proyecto en su contenedor."""
         if not hasattr(self, 'areas_container'): return
 
         self.area_widget_refs.clear()
+        self.dirty_area_ids.clear()
         for widget in self.areas_container.winfo_children():
             widget.destroy()
 
-        try:
-            self.project_areas = self.supabase_client.table("proyectos_areas").select(
-                "*, areas_maestro(nombre_area)"
-            ).eq("proyecto_id", self.proyecto['id_proyecto']).execute().data
+        ctk.CTkLabel(
+            self.areas_container, text="⏳ Cargando áreas del proyecto...",
+            font=get_font(size=FONT_SIZE_NORMAL), text_color=self.colors['text_secondary']
+        ).pack(pady=50)
+
+        self.local_cache.read_through(
+            self.query_executor, "proyectos_areas", self.proyecto['id_proyecto'],
+            lambda: fetch_project_graph(self.supabase_client, self.proyecto['id_proyecto']),
+            on_data=self._render_project_areas,
+            on_error=self._on_load_error,
+            owner=self
+        )
+
+    def has_unsaved_changes(self):
+        """Hay áreas editadas sin guardar (MainWindow no descarta la página del cache)."""
+        return bool(self.dirty_area_ids)
 
-            self._update_project_stats()
+    def on_show(self):
+        """Al volver desde el cache de páginas: recarga sólo si el cache expiró y no hay ediciones."""
+        if self.dirty_area_ids:
+            return
+        entry = self.local_cache.get("proyectos_areas", self.proyecto['id_proyecto'])
+        if entry is None or not entry.fresh:
+            self.load_project_areas()
+
+    def _render_project_areas(self, project_areas):
+        """Construye la tabla de áreas con el resultado de la consulta."""
+        if self.dirty_area_ids:
+            # Llegó la versión fresca del servidor con ediciones sin guardar:
+            # no pisar lo que el usuario está escribiendo.
+            return
 
-            if not self.project_areas:
-                self._create_empty_areas_state()
-            else:
-                scrollable_areas = ctk.CTkScrollableFrame(self.areas_container, fg_color=TRANSPARENT_BG)
-                scrollable_areas.pack(fill="both", expand=True)
+        self.area_widget_refs.clear()
+        for widget in self.areas_container.winfo_children():
+            widget.destroy()
 
-                self._create_areas_table_header(scrollable_areas)
-                for area_data in self.project_areas:
-                    self._create_area_row(scrollable_areas, area_data)
+        self.project_model = ProjectModel(self.proyecto, project_areas)
+        self.project_areas = self.project_model.areas
+        self.area_stats.clear()
+        for area in self.project_areas:
+            self.area_stats.set_row(area['id_proyectos_areas'], area.get('ancho'), area.get('largo'), area.get('alto'))
+        self._schedule_stats_refresh()
+        self._refresh_materials()
+
+        if not self.project_areas:
+            self._create_empty_areas_state()
+        else:
+            scrollable_areas = ctk.CTkScrollableFrame(self.areas_container, fg_color=TRANSPARENT_BG)
+            scrollable_areas.pack(fill="both", expand=True)
+
+            self._create_areas_table_header(scrollable_areas)
+            for area_data in self.project_areas:
+                self._create_area_row(scrollable_areas, area_data)
+
+    def _on_load_error(self, error):
+        for widget in self.areas_container.winfo_children():
+            widget.destroy()
+        self._create_error_areas_state(str(error))
+        messagebox.showerror("Error", f"No se pudieron cargar las áreas del proyecto: {error}")
 
-        except Exception as e:
-            self._create_error_areas_state(str(e))
-            messagebox.showerror("Error", f"No se pudieron cargar las áreas del proyecto: {e}")
+    def _schedule_stats_refresh(self):
+        """Agrupa los cambios de una ráfaga de teclas en un solo refresco (~1 cuadro)."""
+        if self._stats_refresh_id is not None:
+            return
+        self._stats_refresh_id = self.after(16, self._update_project_stats)
 
     def _update_project_stats(self):
         """Actualiza las etiquetas de estadísticas en la pestaña Resumen."""
-        total_areas = len(self.project_areas)
-        total_area_m2 = sum(self._calculate_area(a.get('ancho', 0), a.get('largo', 0)) for a in self.project_areas)
+        self._stats_refresh_id = None
+        totals = self.area_stats.totals()
 
         if self.stat_total_areas_label:
-            self.stat_total_areas_label.configure(text=str(total_areas))
+            self.stat_total_areas_label.configure(text=str(totals['count']))
         if self.stat_total_m2_label:
-            self.stat_total_m2_label.configure(text=f"{total_area_m2:.2f} m²")
+            self.stat_total_m2_label.configure(text=f"{totals['floor_m2']:.2f} m²")
+        if self.stat_wall_m2_label:
+            self.stat_wall_m2_label.configure(text=f"{totals['wall_m2']:.2f} m²")
+        if self.stat_volume_label:
+            self.stat_volume_label.configure(text=f"{totals['volume_m3']:.2f} m³")
+
+    def destroy(self):
+        # La página puede destruirse (cache de páginas, cierre de sesión) con un refresco pendiente
+        if self._stats_refresh_id is not None:
+            self.after_cancel(self._stats_refresh_id)
+            self._stats_refresh_id = None
+        super().destroy()
 
     def _create_areas_table_header(self, container):
         header_frame = ctk.CTkFrame(container, fg_color="#F1F5F9", corner_radius=10, border_width=1, border_color=BORDER_PRIMARY)
@@ -229,7 +349,7 @@ class ProjectDetailPage(ctk.CTkFrame):
         headers = ["🏠 Área", "Ancho (m)", "Largo (m)", "Alto (m)", "Área (m²)", "Opciones"]
         for i, h in enumerate(headers):
             ctk.CTkLabel(
-                header_frame, text=h, font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1, weight="bold"),
+                header_frame, text=h, font=get_font(size=FONT_SIZE_SMALL + 1, weight="bold"),
                 text_color=self.colors['text_primary']
             ).grid(row=0, column=i, sticky="w", padx=15, pady=12)
 
@@ -242,14 +362,14 @@ class ProjectDetailPage(ctk.CTkFrame):
 
         ctk.CTkLabel(
             row_frame, text=area_data['areas_maestro']['nombre_area'],
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"), anchor="w"
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"), anchor="w"
         ).grid(row=0, column=0, sticky="w", padx=15, pady=15)
 
         ancho_var = ctk.StringVar(value=str(area_data.get('ancho', '') or ''))
         largo_var = ctk.StringVar(value=str(area_data.get('largo', '') or ''))
         alto_var = ctk.StringVar(value=str(area_data.get('alto', '') or ''))
 
-        entry_props = {'width': 80, 'height': 35, 'corner_radius': 6, 'border_width': 1, 'border_color': BORDER_PRIMARY, 'font': ctk.CTkFont(size=FONT_SIZE_SMALL + 1)}
+        entry_props = {'width': 80, 'height': 35, 'corner_radius': 6, 'border_width': 1, 'border_color': BORDER_PRIMARY, 'font': get_font(size=FONT_SIZE_SMALL + 1)}
         ancho_entry = ctk.CTkEntry(row_frame, textvariable=ancho_var, **entry_props)
         ancho_entry.grid(row=0, column=1, padx=10, pady=10)
         largo_entry = ctk.CTkEntry(row_frame, textvariable=largo_var, **entry_props)
@@ -258,60 +378,131 @@ class ProjectDetailPage(ctk.CTkFrame):
         alto_entry.grid(row=0, column=3, padx=10, pady=10)
 
         area_m2 = self._calculate_area(ancho_var.get(), largo_var.get())
-        area_label = ctk.CTkLabel(row_frame, text=f"{area_m2:.2f}", font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1, weight="bold"), text_color=ACCENT_PRIMARY)
+        area_label = ctk.CTkLabel(row_frame, text=f"{area_m2:.2f}", font=get_font(size=FONT_SIZE_SMALL + 1, weight="bold"), text_color=ACCENT_PRIMARY)
         area_label.grid(row=0, column=4, padx=10, pady=10)
 
-        def update_area(*args):
-            new_area = self._calculate_area(ancho_var.get(), largo_var.get())
-            area_label.configure(text=f"{new_area:.2f}")
-            self._update_project_stats()
-
-        ancho_var.trace('w', update_area)
-        largo_var.trace('w', update_area)
-
-        self.area_widget_refs.append({
+        ref = {
             'id': area_data['id_proyectos_areas'],
             'ancho_var': ancho_var,
             'largo_var': largo_var,
-            'alto_var': alto_var
-        })
+            'alto_var': alto_var,
+            'entries': (ancho_entry, largo_entry, alto_entry),
+            'saved': self._dims_key(area_data.get('ancho'), area_data.get('largo'), area_data.get('alto'))
+        }
+        self.area_widget_refs.append(ref)
+
+        def update_area(*args):
+            # Lee los valores vivos de las entradas y aplica sólo el delta de esta fila
+            ancho, largo, alto = ancho_var.get(), largo_var.get(), alto_var.get()
+            area_label.configure(text=f"{self._calculate_area(ancho, largo):.2f}")
+            self.area_stats.set_row(ref['id'], ancho, largo, alto)
+            self._schedule_stats_refresh()
+            self._mark_dirty(ref)
+
+        for var in (ancho_var, largo_var, alto_var):
+            var.trace('w', update_area)
 
         doors_windows_btn = ctk.CTkButton(
             row_frame, text="Puertas y Ventanas", height=35,
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL, weight="bold"),
+            font=get_font(size=FONT_SIZE_SMALL, weight="bold"),
             fg_color=TRANSPARENT_BG, border_color=BORDER_PRIMARY, border_width=1,
             text_color=TEXT_SECONDARY, hover_color=self.colors.get('bg_secondary'),
             command=lambda data=area_data: self._open_doors_windows_manager(data)
         )
         doors_windows_btn.grid(row=0, column=5, padx=15, pady=10, sticky="e")
 
+    @staticmethod
+    def _dims_key(ancho, largo, alto):
+        """Normaliza (ancho, largo, alto) para comparar lo escrito con lo guardado."""
+        def norm(value):
+            try: return float(value or 0)
+            except (TypeError, ValueError): return str(value)
+        return (norm(ancho), norm(largo), norm(alto))
+
+    def _mark_dirty(self, ref):
+        """Marca o desmarca la fila según difiera de lo último guardado."""
+        current = self._dims_key(ref['ancho_var'].get(), ref['largo_var'].get(), ref['alto_var'].get())
+        is_dirty = current != ref['saved']
+        if is_dirty == (ref['id'] in self.dirty_area_ids):
+            return
+
+        if is_dirty:
+            self.dirty_area_ids.add(ref['id'])
+        else:
+            self.dirty_area_ids.discard(ref['id'])
+        border = WARNING_COLOR if is_dirty else theme.color("border")
+        for entry in ref['entries']:
+            theme.configure(entry, border_color=border)
+
     def save_all_changes(self):
-        """Recopila los datos de todas las filas y los guarda en la base de datos."""
-        try:
-            data_to_update = []
-            for ref in self.area_widget_refs:
-                data_to_update.append({
-                    'id_proyectos_areas': ref['id'],
-                    'ancho': float(ref['ancho_var'].get() or 0),
-                    'largo': float(ref['largo_var'].get() or 0),
-                    'alto': float(ref['alto_var'].get() or 0)
-                })
-
-            if not data_to_update:
-                messagebox.showinfo("Información", "No hay áreas para guardar.")
-                return
-
-            self.supabase_client.table("proyectos_areas").upsert(data_to_update).execute()
-            messagebox.showinfo("Éxito", "Todos los cambios han sido guardados correctamente.")
-            self.load_project_areas()
+        """Guarda sólo las filas modificadas desde la última carga o guardado."""
+        dirty_refs = [ref for ref in self.area_widget_refs if ref['id'] in self.dirty_area_ids]
+        if not dirty_refs:
+            messagebox.showinfo("Información", "No hay cambios para guardar.")
+            return
 
+        try:
+            data_to_update = [{
+                'id_proyectos_areas': ref['id'],
+                'ancho': float(ref['ancho_var'].get() or 0),
+                'largo': float(ref['largo_var'].get() or 0),
+                'alto': float(ref['alto_var'].get() or 0)
+            } for ref in dirty_refs]
         except ValueError:
             messagebox.showerror("Error de Validación", "Por favor, asegúrate de que todas las dimensiones sean números válidos.")
-        except Exception as e:
-            messagebox.showerror("Error al Guardar", f"No se pudieron guardar los cambios: {e}")
+            return
+
+        self.save_all_button.configure(state="disabled", text="Guardando...")
+        self.query_executor.submit(
+            lambda: self.supabase_client.table("proyectos_areas").upsert(data_to_update).execute().data,
+            on_success=lambda rows: self._on_areas_saved(data_to_update, rows),
+            on_error=self._on_areas_save_error,
+            owner=self
+        )
+
+    def _on_areas_saved(self, sent_rows, saved_rows):
+        """Concilia el modelo local con la respuesta del upsert, sin recargar la tabla."""
+        refs_by_id = {ref['id']: ref for ref in self.area_widget_refs}
+        # Si el servidor no devolvió las filas, lo enviado es lo que quedó guardado
+        for row in saved_rows or sent_rows:
+            area_id = row['id_proyectos_areas']
+            area = self.project_model.get_area(area_id) if self.project_model else None
+            if area is not None:
+                for field in ('ancho', 'largo', 'alto'):
+                    area[field] = row.get(field)
+
+            ref = refs_by_id.get(area_id)
+            if ref is not None:
+                ref['saved'] = self._dims_key(row.get('ancho'), row.get('largo'), row.get('alto'))
+                self._mark_dirty(ref)
+
+        if self.project_model:
+            self.local_cache.put("proyectos_areas", self.proyecto['id_proyecto'], self.project_model.areas)
+            self._refresh_materials()
+
+        self._restore_save_button()
+        messagebox.showinfo("Éxito", f"Se guardaron los cambios de {len(sent_rows)} área(s).")
+
+    def _on_areas_save_error(self, error):
+        self._restore_save_button()
+        messagebox.showerror("Error al Guardar", f"No se pudieron guardar los cambios: {error}")
+
+    def _restore_save_button(self):
+        if self.save_all_button and self.save_all_button.winfo_exists():
+            self.save_all_button.configure(state="normal", text="💾 Guardar Todos los Cambios")
 
     def _open_doors_windows_manager(self, area_data):
-        DoorsWindowsManager(self, self.supabase_client, area_data)
+        # Las aberturas ya vienen en el modelo: la ventana abre sin ir a la red
+        DoorsWindowsManager(
+            self, self.supabase_client, area_data, self.query_executor,
+            on_saved=self._on_openings_saved
+        )
+
+    def _on_openings_saved(self, area_id, puertas, ventanas):
+        """Actualiza el modelo y el cache local con las aberturas guardadas."""
+        self.project_model.set_openings(area_id, puertas, ventanas)
+        self.local_cache.put("proyectos_areas", self.proyecto['id_proyecto'], self.project_model.areas)
+        self._refresh_materials()
 
     def _calculate_area(self, ancho_str, largo_str):
         try: return float(ancho_str or 0) * float(largo_str or 0)
@@ -327,16 +518,16 @@ class ProjectDetailPage(ctk.CTkFrame):
     def _create_empty_areas_state(self):
         empty_frame = ctk.CTkFrame(self.areas_container, fg_color=TRANSPARENT_BG)
         empty_frame.pack(fill="both", expand=True, pady=50)
-        ctk.CTkLabel(empty_frame, text="🏠", font=ctk.CTkFont(size=80)).pack(pady=(0, 15))
-        ctk.CTkLabel(empty_frame, text="Este proyecto no tiene áreas asignadas", font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 2, weight="bold"), text_color=self.colors['text_primary']).pack(pady=(0, 5))
-        ctk.CTkLabel(empty_frame, text="Las áreas te permiten organizar y calcular materiales\npor espacios específicos de tu proyecto", font=ctk.CTkFont(size=FONT_SIZE_NORMAL), text_color=self.colors['text_secondary'], justify="center").pack(pady=(0, 20))
+        ctk.CTkLabel(empty_frame, text="🏠", font=get_font(size=80)).pack(pady=(0, 15))
+        ctk.CTkLabel(empty_frame, text="Este proyecto no tiene áreas asignadas", font=get_font(size=FONT_SIZE_NORMAL + 2, weight="bold"), text_color=self.colors['text_primary']).pack(pady=(0, 5))
+        ctk.CTkLabel(empty_frame, text="Las áreas te permiten organizar y calcular materiales\npor espacios específicos de tu proyecto", font=get_font(size=FONT_SIZE_NORMAL), text_color=self.colors['text_secondary'], justify="center").pack(pady=(0, 20))
 
     def _create_error_areas_state(self, error_msg):
         error_frame = ctk.CTkFrame(self.areas_container, fg_color=TRANSPARENT_BG)
         error_frame.pack(fill="both", expand=True, pady=50)
-        ctk.CTkLabel(error_frame, text="⚠️", font=ctk.CTkFont(size=60), text_color=ERROR_COLOR).pack(pady=(0, 15))
-        ctk.CTkLabel(error_frame, text="Error al cargar las áreas", font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 1, weight="bold"), text_color=ERROR_COLOR).pack(pady=(0, 10))
-        ctk.CTkLabel(error_frame, text=error_msg, font=ctk.CTkFont(size=FONT_SIZE_SMALL), text_color=self.colors['text_secondary']).pack(pady=(0, 20))
+        ctk.CTkLabel(error_frame, text="⚠️", font=get_font(size=60), text_color=ERROR_COLOR).pack(pady=(0, 15))
+        ctk.CTkLabel(error_frame, text="Error al cargar las áreas", font=get_font(size=FONT_SIZE_NORMAL + 1, weight="bold"), text_color=ERROR_COLOR).pack(pady=(0, 10))
+        ctk.CTkLabel(error_frame, text=error_msg, font=get_font(size=FONT_SIZE_SMALL), text_color=self.colors['text_secondary']).pack(pady=(0, 20))
         ctk.CTkButton(error_frame, text="🔄 Reintentar", command=self.load_project_areas, height=40, fg_color=ERROR_COLOR, hover_color="#DC2626").pack()
 
     def _show_add_area_info(self):
@@ -2,23 +2,39 @@
 
 import customtkinter as ctk
 import logging
+from datetime import datetime
 from config import (
     FONT_SIZE_TITLE, FONT_SIZE_NORMAL, FONT_SIZE_SMALL, 
-    get_main_colors, BACKGROUND_CARD, ACCENT_PRIMARY, 
+    BACKGROUND_CARD, ACCENT_PRIMARY, 
     ACCENT_HOVER, TEXT_PRIMARY, TEXT_SECONDARY, BORDER_PRIMARY, TRANSPARENT_BG 
 )
+from src.ui.styles import get_font, get_colors
+from src.database.pagination import (
+    PROJECTS_PAGE_SIZE, PROJECTS_KEYSET, cursor_from_row, fetch_projects_page
+)
+from src.ui.widgets.virtual_list import VirtualList
+
+# Alto fijo de cada tarjeta de proyecto (requisito de la lista virtual)
+PROJECT_CARD_HEIGHT = 130
 
 class ProyectosPage(ctk.CTkFrame):
     def __init__(self, master, master_app, on_create_new, on_view_details, **kwargs):
-        colors = get_main_colors()
+        colors = get_colors('main')
         
         super().__init__(master, fg_color=colors['bg_primary'], **kwargs)
         
         self.supabase_client = master_app.supabase_client
+        self.query_executor = master_app.query_executor
+        self.local_cache = master_app.local_cache
+        self.delta_sync = master_app.delta_sync
         self.on_create_new = on_create_new
         self.on_view_details = on_view_details
         self.colors = colors
         
+        # Estado de la paginación por keyset
+        self._page_token = 0
+        self._reset_pagination_state()
+        
         self._build_ui()
         self.load_proyectos_list()
 
@@ -36,7 +52,7 @@ class ProyectosPage(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             title_frame, 
             text="📁 Mis Proyectos de Construcción", 
-            font=ctk.CTkFont(size=FONT_SIZE_TITLE + 2, weight="bold"),
+            font=get_font(size=FONT_SIZE_TITLE + 2, weight="bold"),
             text_color=self.colors['text_primary']
         )
         title_label.pack(side="left", anchor="w")
@@ -45,7 +61,7 @@ class ProyectosPage(ctk.CTkFrame):
         subtitle_label = ctk.CTkLabel(
             title_frame, 
             text="Gestiona y administra todos tus proyectos de construcción", 
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1),
+            font=get_font(size=FONT_SIZE_SMALL + 1),
             text_color=self.colors['text_secondary']
         )
         subtitle_label.pack(side="left", anchor="w", padx=(20, 0))
@@ -58,7 +74,7 @@ class ProyectosPage(ctk.CTkFrame):
             height=45,
             width=200,
             corner_radius=10,
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             fg_color=ACCENT_PRIMARY,
             hover_color=ACCENT_HOVER,
             text_color="white"
@@ -87,18 +103,24 @@ class ProyectosPage(ctk.CTkFrame):
         content_label = ctk.CTkLabel(
             self,
             text="Lista de Proyectos",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 2, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 2, weight="bold"),
             text_color=self.colors['text_primary']
         )
         content_label.pack(anchor="w", padx=5, pady=(0, 10))
         
-        # Container principal para la lista con scroll
-        self.proyectos_list_frame = ctk.CTkScrollableFrame(
-            self, 
-            fg_color=TRANSPARENT_BG ,
+        # Lista virtualizada: sólo existen las tarjetas visibles; al acercarse
+        # al final pide la siguiente página (scroll infinito)
+        self.proyectos_list = VirtualList(
+            self,
+            row_height=PROJECT_CARD_HEIGHT,
+            row_spacing=12,
+            row_factory=self._create_project_card,
+            bind_row=self._bind_project_card,
+            on_near_end=self._load_next_page,
+            fg_color=self.colors['bg_primary'],
             corner_radius=0
         )
-        self.proyectos_list_frame.pack(fill="both", expand=True, padx=0, pady=0)
+        self.proyectos_list.pack(fill="both", expand=True, padx=0, pady=0)
 
     def _create_stats_section(self, total_proyectos):
         """Crea una sección de estadísticas rápidas"""
@@ -117,14 +139,14 @@ class ProyectosPage(ctk.CTkFrame):
         ctk.CTkLabel(
             total_frame,
             text=str(total_proyectos),
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=get_font(size=24, weight="bold"),
             text_color=ACCENT_PRIMARY
         ).pack()
         
         ctk.CTkLabel(
             total_frame,
             text="Proyectos Totales",
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL),
+            font=get_font(size=FONT_SIZE_SMALL),
             text_color=self.colors['text_secondary']
         ).pack()
         
@@ -135,45 +157,153 @@ class ProyectosPage(ctk.CTkFrame):
         ctk.CTkLabel(
             active_frame,
             text=str(total_proyectos),  # Por ahora, todos son "activos"
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=get_font(size=24, weight="bold"),
             text_color="#10B981"  # Verde para activos
         ).pack()
         
         ctk.CTkLabel(
             active_frame,
             text="Proyectos Activos",
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL),
+            font=get_font(size=FONT_SIZE_SMALL),
             text_color=self.colors['text_secondary']
         ).pack()
 
     def load_proyectos_list(self):
-        """Carga la lista de proyectos con diseño mejorado"""
-        
-        # Limpiar lista actual
-        for widget in self.proyectos_list_frame.winfo_children(): 
-            widget.destroy()
-            
-        try:
-            proyectos = self.supabase_client.table("proyectos").select("*").order("fecha_creacion", desc=True).execute().data
-            
-            # Actualizar stats
-            self._create_stats_section(len(proyectos))
-            
-            if not proyectos:
-                self._create_empty_state()
-            else:
-                for i, proyecto in enumerate(proyectos):
-                    self._create_project_card(proyecto, i)
-                    
-        except Exception as e:
-            logging.error(f"Error al cargar proyectos: {e}")
-            self._create_error_state(str(e))
+        """Reinicia el listado paginado y sincroniza los cambios en segundo plano"""
+
+        had_local = self.delta_sync.has_local("proyectos")
+        self._local_version = self.delta_sync.local_version("proyectos")
+        self._reset_pagination()
+        self._create_stats_section(self.delta_sync.local_count("proyectos") if had_local else "…")
+        self._load_next_page()
+
+        self.query_executor.submit(
+            lambda: self.delta_sync.sync("proyectos"),
+            on_success=lambda changed: self._on_synced(changed, had_local),
+            on_error=self._on_sync_error,
+            owner=self
+        )
+
+    def on_show(self):
+        """Al volver desde el cache de páginas: sólo sincroniza lo que cambió"""
+
+        if self._local_version != self.delta_sync.local_version("proyectos"):
+            # Hubo escrituras propias (por ejemplo, un proyecto nuevo)
+            self.load_proyectos_list()
+            return
+
+        had_local = self.delta_sync.has_local("proyectos")
+        self.query_executor.submit(
+            lambda: self.delta_sync.sync("proyectos"),
+            on_success=lambda changed: self._on_synced(changed, had_local),
+            on_error=self._on_sync_error,
+            owner=self
+        )
+
+    def _reset_pagination(self):
+        """Limpia la lista y vuelve el cursor al inicio"""
+
+        self.proyectos_list.hide_placeholder()
+        self.proyectos_list.set_items([])
+        self._reset_pagination_state()
+
+    def _reset_pagination_state(self):
+        self._cursor = None
+        self._has_more = True
+        self._loading_page = False
+        self._card_count = 0
+        # Descarta páginas en vuelo pedidas antes del reinicio
+        self._page_token += 1
+
+    def _load_next_page(self):
+        """Pide la siguiente página (keyset) si no hay otra en curso"""
+
+        if self._loading_page or not self._has_more:
+            return
+        self._loading_page = True
+
+        token = self._page_token
+        cursor = self._cursor
+        if self.delta_sync.has_local("proyectos"):
+            fetch = lambda: self.delta_sync.local_page("proyectos", PROJECTS_KEYSET, cursor, PROJECTS_PAGE_SIZE)
+        else:
+            self.local_cache.record_miss()
+            fetch = lambda: fetch_projects_page(self.supabase_client, cursor, PROJECTS_PAGE_SIZE, self.delta_sync)
+
+        if self._card_count == 0:
+            self._create_loading_state()
+
+        self.query_executor.submit(
+            fetch,
+            on_success=lambda rows: self._on_page_loaded(rows, token),
+            on_error=lambda error: self._on_page_error(error, token),
+            owner=self
+        )
+
+    def _on_page_loaded(self, proyectos, token):
+        """Agrega las tarjetas de una página al final de la lista"""
+
+        if token != self._page_token:
+            return
+        self._loading_page = False
+
+        if not proyectos and self._card_count == 0:
+            self._has_more = False
+            self._create_empty_state()
+            return
+
+        self.proyectos_list.hide_placeholder()
+        if proyectos:
+            self._cursor = cursor_from_row(proyectos[-1])
+        self._has_more = len(proyectos) == PROJECTS_PAGE_SIZE
+        self._card_count += len(proyectos)
+        # Puede volver a llamar a _load_next_page si la vista sigue sin llenarse
+        self.proyectos_list.append_items(proyectos)
+
+    def _on_page_error(self, error, token):
+        if token != self._page_token:
+            return
+        self._loading_page = False
+        if self._card_count == 0:
+            self._on_load_error(error)
+        else:
+            logging.error(f"Error al cargar la siguiente página de proyectos: {error}")
+
+    def _on_synced(self, changed, had_local):
+        """Tras la sincronización actualiza stats y, si cambió algo ya mostrado, recarga"""
+
+        self._create_stats_section(self.delta_sync.local_count("proyectos"))
+        # En la primera sincronización la lista ya se está armando desde la red
+        # con el mismo cursor; las páginas siguientes salen del conjunto local.
+        if had_local and changed:
+            self._reset_pagination()
+            self._load_next_page()
+
+    def _on_load_error(self, error):
+        """Muestra el estado de error si la consulta falla"""
+        logging.error(f"Error al cargar proyectos: {error}")
+        self._has_more = False
+        self._create_error_state(str(error))
+
+    def _on_sync_error(self, error):
+        """La lista se sigue paginando; un fallo de sincronización sólo se registra"""
+        logging.warning(f"No se pudo sincronizar proyectos: {error}")
+
+    def _create_loading_state(self):
+        """Crea el indicador de carga mientras llega la consulta"""
+
+        ctk.CTkLabel(
+            self.proyectos_list.show_placeholder(),
+            text="⏳ Cargando proyectos...",
+            font=get_font(size=FONT_SIZE_NORMAL),
+            text_color=self.colors['text_secondary']
+        ).pack(pady=40)
 
     def _create_empty_state(self):
         """Crea el estado vacío cuando no hay proyectos"""
         
         empty_frame = ctk.CTkFrame(
-            self.proyectos_list_frame,
+            self.proyectos_list.show_placeholder(),
             fg_color=BACKGROUND_CARD,
             corner_radius=15,
             border_width=1,
@@ -185,7 +315,7 @@ class ProyectosPage(ctk.CTkFrame):
         icon_label = ctk.CTkLabel(
             empty_frame,
             text="🏗️",
-            font=ctk.CTkFont(size=80)
+            font=get_font(size=80)
         )
         icon_label.pack(pady=(40, 10))
         
@@ -193,7 +323,7 @@ class ProyectosPage(ctk.CTkFrame):
         ctk.CTkLabel(
             empty_frame,
             text="¡Comienza tu primer proyecto!",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 4, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 4, weight="bold"),
             text_color=self.colors['text_primary']
         ).pack(pady=(0, 5))
         
@@ -201,7 +331,7 @@ class ProyectosPage(ctk.CTkFrame):
         ctk.CTkLabel(
             empty_frame,
             text="No tienes proyectos todavía. Crea tu primer proyecto de construcción\npara comenzar a gestionar materiales y áreas.",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL),
+            font=get_font(size=FONT_SIZE_NORMAL),
             text_color=self.colors['text_secondary'],
             justify="center"
         ).pack(pady=(0, 20))
@@ -213,7 +343,7 @@ class ProyectosPage(ctk.CTkFrame):
             command=self.on_create_new,
             height=45,
             width=250,
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             fg_color=ACCENT_PRIMARY,
             hover_color=ACCENT_HOVER,
             corner_radius=10
@@ -224,7 +354,7 @@ class ProyectosPage(ctk.CTkFrame):
         """Crea el estado de error"""
         
         error_frame = ctk.CTkFrame(
-            self.proyectos_list_frame,
+            self.proyectos_list.show_placeholder(),
             fg_color=BACKGROUND_CARD,
             corner_radius=15,
             border_width=2,
@@ -235,14 +365,14 @@ class ProyectosPage(ctk.CTkFrame):
         ctk.CTkLabel(
             error_frame,
             text="⚠️ Error al cargar proyectos",
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 2, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL + 2, weight="bold"),
             text_color="#EF4444"
         ).pack(pady=(20, 5))
         
         ctk.CTkLabel(
             error_frame,
             text=f"Error: {error_message}",
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL),
+            font=get_font(size=FONT_SIZE_SMALL),
             text_color=self.colors['text_secondary']
         ).pack(pady=(0, 10))
         
@@ -255,74 +385,102 @@ class ProyectosPage(ctk.CTkFrame):
             hover_color="#DC2626"
         ).pack(pady=(0, 20))
 
-    def _create_project_card(self, proyecto, index):
-        """Crea una tarjeta individual para cada proyecto"""
+    def _create_project_card(self, parent):
+        """Crea una tarjeta vacía; la lista virtual la reutiliza para distintos proyectos"""
+        
+        card_frame = _ProjectCard(
+            parent,
+            colors=self.colors,
+            on_view_details=self.on_view_details,
+            on_edit=self._edit_project
+        )
         
-        # Card container con efecto hover
-        card_frame = ctk.CTkFrame(
-            self.proyectos_list_frame,
+        # Hover effect (placeholder - puedes implementar con eventos)
+        self._add_hover_effect(card_frame)
+        return card_frame
+
+    def _bind_project_card(self, card_frame, proyecto, index):
+        """Vuelca los datos de un proyecto en una tarjeta reciclada"""
+        card_frame.set_proyecto(proyecto)
+
+    def _add_hover_effect(self, card_frame):
+        """Agrega efecto hover a las tarjetas (placeholder)"""
+        # Puedes implementar efectos de hover aquí
+        # Por ejemplo, cambiar el color del borde o agregar sombra
+        pass
+    
+    def _edit_project(self, proyecto):
+        """Maneja la edición de proyectos (placeholder)"""
+        # Aquí podrías abrir un diálogo de edición
+        logging.info(f"Editar proyecto: {proyecto['nombre_proyecto']}")
+        # Por ahora, solo mostrar un mensaje
+        from tkinter import messagebox
+        messagebox.showinfo("Info", f"Edición de '{proyecto['nombre_proyecto']}' próximamente disponible.")
+
+class _ProjectCard(ctk.CTkFrame):
+    """Tarjeta de proyecto reutilizable: los widgets se crean una sola vez
+    y `set_proyecto` sólo cambia textos y comandos."""
+
+    def __init__(self, master, colors, on_view_details, on_edit, **kwargs):
+        super().__init__(
+            master,
             fg_color=BACKGROUND_CARD,
             corner_radius=12,
             border_width=1,
-            border_color=BORDER_PRIMARY
+            border_color=BORDER_PRIMARY,
+            height=PROJECT_CARD_HEIGHT,
+            **kwargs
         )
-        card_frame.pack(fill="x", pady=8, padx=5)
-        
+        self.proyecto = None
+        self.on_view_details = on_view_details
+        self.on_edit = on_edit
+
         # Content container
-        content_frame = ctk.CTkFrame(card_frame, fg_color=TRANSPARENT_BG )
+        content_frame = ctk.CTkFrame(self, fg_color=TRANSPARENT_BG )
         content_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
+
         # Left side - Project info
         info_frame = ctk.CTkFrame(content_frame, fg_color=TRANSPARENT_BG )
         info_frame.pack(side="left", fill="both", expand=True)
-        
+
         # Project title
-        title_label = ctk.CTkLabel(
+        self.title_label = ctk.CTkLabel(
             info_frame,
-            text=proyecto['nombre_proyecto'],
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL + 2, weight="bold"),
-            text_color=self.colors['text_primary'],
+            text="",
+            font=get_font(size=FONT_SIZE_NORMAL + 2, weight="bold"),
+            text_color=colors['text_primary'],
             anchor="w"
         )
-        title_label.pack(anchor="w", pady=(0, 5))
-        
+        self.title_label.pack(anchor="w", pady=(0, 5))
+
         # Project address
-        if proyecto.get('direccion_proyecto'):
-            address_label = ctk.CTkLabel(
-                info_frame,
-                text=f"📍 {proyecto['direccion_proyecto']}",
-                font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1),
-                text_color=self.colors['text_secondary'],
-                anchor="w"
-            )
-            address_label.pack(anchor="w", pady=(0, 5))
-        
+        self.address_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=get_font(size=FONT_SIZE_SMALL + 1),
+            text_color=colors['text_secondary'],
+            anchor="w"
+        )
+        self.address_label.pack(anchor="w", pady=(0, 5))
+
         # Project metadata
         metadata_frame = ctk.CTkFrame(info_frame, fg_color=TRANSPARENT_BG )
         metadata_frame.pack(anchor="w", pady=(5, 0))
-        
+
         # Fecha de creación
-        if proyecto.get('fecha_creacion'):
-            try:
-                from datetime import datetime
-                fecha = datetime.fromisoformat(proyecto['fecha_creacion'].replace('Z', '+00:00'))
-                fecha_str = fecha.strftime("%d/%m/%Y")
-                
-                fecha_label = ctk.CTkLabel(
-                    metadata_frame,
-                    text=f"📅 Creado: {fecha_str}",
-                    font=ctk.CTkFont(size=FONT_SIZE_SMALL),
-                    text_color=self.colors['text_secondary']
-                )
-                fecha_label.pack(side="left", padx=(0, 20))
-            except:
-                pass
-        
+        self.fecha_label = ctk.CTkLabel(
+            metadata_frame,
+            text="",
+            font=get_font(size=FONT_SIZE_SMALL),
+            text_color=colors['text_secondary']
+        )
+        self.fecha_label.pack(side="left", padx=(0, 20))
+
         # Status badge (placeholder - puedes implementar estados)
         status_badge = ctk.CTkLabel(
             metadata_frame,
             text="🟢 Activo",
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL),
+            font=get_font(size=FONT_SIZE_SMALL),
             text_color="#10B981",
             fg_color="#F0FDF4",
             corner_radius=12,
@@ -330,55 +488,55 @@ class ProyectosPage(ctk.CTkFrame):
             pady=4
         )
         status_badge.pack(side="left")
-        
+
         # Right side - Actions
         actions_frame = ctk.CTkFrame(content_frame, fg_color=TRANSPARENT_BG )
         actions_frame.pack(side="right", padx=(20, 0))
-        
+
         # Primary action button
         btn_administrar = ctk.CTkButton(
             actions_frame,
             text="📋 Administrar",
-            command=lambda p=proyecto: self.on_view_details(p),
+            command=lambda: self.on_view_details(self.proyecto),
             height=40,
             width=140,
-            font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold"),
+            font=get_font(size=FONT_SIZE_NORMAL, weight="bold"),
             fg_color=ACCENT_PRIMARY,
             hover_color=ACCENT_HOVER,
             corner_radius=8
         )
         btn_administrar.pack(pady=(0, 8))
-        
+
         # Secondary action button
         btn_editar = ctk.CTkButton(
             actions_frame,
             text="✏️ Editar",
-            command=lambda p=proyecto: self._edit_project(p),
+            command=lambda: self.on_edit(self.proyecto),
             height=35,
             width=140,
-            font=ctk.CTkFont(size=FONT_SIZE_SMALL + 1),
+            font=get_font(size=FONT_SIZE_SMALL + 1),
             fg_color=TRANSPARENT_BG ,
             hover_color=BORDER_PRIMARY,
-            text_color=self.colors['text_secondary'],
+            text_color=colors['text_secondary'],
             border_width=1,
             border_color=BORDER_PRIMARY,
             corner_radius=8
         )
         btn_editar.pack()
-        
-        # Hover effect (placeholder - puedes implementar con eventos)
-        self._add_hover_effect(card_frame)
 
-    def _add_hover_effect(self, card_frame):
-        """Agrega efecto hover a las tarjetas (placeholder)"""
-        # Puedes implementar efectos de hover aquí
-        # Por ejemplo, cambiar el color del borde o agregar sombra
-        pass
-    
-    def _edit_project(self, proyecto):
-        """Maneja la edición de proyectos (placeholder)"""
-        # Aquí podrías abrir un diálogo de edición
-        logging.info(f"Editar proyecto: {proyecto['nombre_proyecto']}")
-        # Por ahora, solo mostrar un mensaje
-        from tkinter import messagebox
-        messagebox.showinfo("Info", f"Edición de '{proyecto['nombre_proyecto']}' próximamente disponible.")
\ No newline at end of file
+    def set_proyecto(self, proyecto):
+        """Enlaza la tarjeta con otro proyecto"""
+        self.proyecto = proyecto
+        self.title_label.configure(text=proyecto['nombre_proyecto'])
+
+        direccion = proyecto.get('direccion_proyecto')
+        self.address_label.configure(text=f"📍 {direccion}" if direccion else "")
+
+        fecha_text = ""
+        if proyecto.get('fecha_creacion'):
+            try:
+                fecha = datetime.fromisoformat(proyecto['fecha_creacion'].replace('Z', '+00:00'))
+                fecha_text = f"📅 Creado: {fecha.strftime('%d/%m/%Y')}"
+            except ValueError:
+                pass
+        self.fecha_label.configure(text=fecha_text)
@@ -0,0 +1,43 @@
+# src/ui/styles.py
+
+import customtkinter as ctk
+from config import FONT_SIZE_NORMAL, get_login_colors, get_main_colors, get_sidebar_colors
+
+# Paletas por grupo de la interfaz; cada grupo se arma una sola vez desde config.py
+_PALETTE_BUILDERS = {
+    'main': get_main_colors,
+    'sidebar': get_sidebar_colors,
+    'login': get_login_colors,
+}
+
+_palettes = {}
+_fonts = {}
+_font_requests = 0
+
+
+def get_font(size=FONT_SIZE_NORMAL, weight="normal", **options):
+    """
+    Devuelve una CTkFont compartida para la combinación pedida (CustomTkinter
+    admite que varios widgets usen el mismo objeto fuente). Requiere que la
+    ventana raíz ya exista.
+    """
+    global _font_requests
+    _font_requests += 1
+    key = (size, weight, tuple(sorted(options.items())))
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = ctk.CTkFont(size=size, weight=weight, **options)
+    return font
+
+
+def get_colors(group):
+    """Diccionario de colores compartido de un grupo ('main', 'sidebar', 'login')."""
+    palette = _palettes.get(group)
+    if palette is None:
+        palette = _palettes[group] = _PALETTE_BUILDERS[group]()
+    return palette
+
+
+def get_style_stats():
+    """Fuentes creadas frente a fuentes pedidas (el benchmark de UI las reporta por página)."""
+    return {'fonts_created': len(_fonts), 'font_requests': _font_requests}
@@ -0,0 +1,284 @@
+# src/ui/theme.py
+
+import json
+import logging
+import time
+import weakref
+from pathlib import Path
+
+import customtkinter as ctk
+from config import (
+    BACKGROUND_PRIMARY, BACKGROUND_SECONDARY, BACKGROUND_CARD, SIDEBAR_PRIMARY,
+    SIDEBAR_HOVER, SIDEBAR_SELECTED, ACCENT_PRIMARY, ACCENT_HOVER, ACCENT_LIGHT,
+    TEXT_PRIMARY, TEXT_SECONDARY, TEXT_ON_DARK, BORDER_PRIMARY, TRANSPARENT_HOVER
+)
+from src.ui import styles
+
+# Roles de color por tipo: los de texto y los de superficie se buscan por
+# separado porque un mismo valor (p. ej. #6B7280) cumple roles distintos.
+PALETTES = {
+    "light": {
+        "surface": {
+            "bg_primary": BACKGROUND_PRIMARY,
+            "bg_secondary": BACKGROUND_SECONDARY,
+            "card_bg": BACKGROUND_CARD,
+            "surface_muted": "#F8FAFC",
+            "table_header": "#F1F5F9",
+            "row_border": "#E2E8F0",
+            "border": BORDER_PRIMARY,
+            "transparent_hover": TRANSPARENT_HOVER,
+            "card_hover": "#FAFAFA",
+            "card_selected": "#FFF7ED",
+            "sidebar": SIDEBAR_PRIMARY,
+            "sidebar_hover": SIDEBAR_HOVER,
+            "sidebar_selected": SIDEBAR_SELECTED,
+            "accent": ACCENT_PRIMARY,
+            "accent_hover": ACCENT_HOVER,
+            "accent_light": ACCENT_LIGHT,
+        },
+        "text": {
+            "text_primary": TEXT_PRIMARY,
+            "text_secondary": TEXT_SECONDARY,
+            "text_muted": "#9CA3AF",
+            "text_on_dark": TEXT_ON_DARK,
+            "accent": ACCENT_PRIMARY,
+        },
+    },
+    # Cada valor es único dentro de su tipo para poder volver al rol desde el color
+    "dark": {
+        "surface": {
+            "bg_primary": "#0F172A",
+            "bg_secondary": "#1A2332",
+            "card_bg": "#1E293B",
+            "surface_muted": "#243247",
+            "table_header": "#2B3A52",
+            "row_border": "#334155",
+            "border": "#475569",
+            "transparent_hover": "#2F3C50",
+            "card_hover": "#26354B",
+            "card_selected": "#3A2C1E",
+            "sidebar": "#182130",
+            "sidebar_hover": "#223049",
+            "sidebar_selected": "#111A2A",
+            "accent": ACCENT_PRIMARY,
+            "accent_hover": ACCENT_HOVER,
+            "accent_light": "#7C2D12",
+        },
+        "text": {
+            "text_primary": "#F1F5F9",
+            "text_secondary": "#94A3B8",
+            "text_muted": "#64748B",
+            "text_on_dark": TEXT_ON_DARK,
+            "accent": ACCENT_PRIMARY,
+        },
+    },
+}
+
+# Nombres que muestra la configuración para cada modo
+THEME_LABELS = {"light": "Claro", "dark": "Oscuro", "system": "Sistema"}
+
+PREFERENCES_FILE = Path.home() / ".proyecto_manager" / "preferences.json"
+
+# Opciones de color de CustomTkinter que se re-tiñen, agrupadas por tipo de rol
+_TEXT_OPTIONS = ("text_color", "placeholder_text_color", "dropdown_text_color")
+_SURFACE_OPTIONS = (
+    "fg_color", "border_color", "hover_color", "button_color", "button_hover_color",
+    "progress_color", "scrollbar_button_color", "scrollbar_button_hover_color",
+    "dropdown_fg_color", "dropdown_hover_color", "checkmark_color",
+    "selected_color", "selected_hover_color", "unselected_color", "unselected_hover_color",
+    "segmented_button_fg_color", "segmented_button_selected_color",
+    "segmented_button_selected_hover_color", "segmented_button_unselected_color",
+    "segmented_button_unselected_hover_color",
+)
+_THEMED_TYPES = (ctk.CTk, ctk.CTkToplevel, ctk.CTkBaseClass)
+
+
+def _build_reverse_maps():
+    """Color (de cualquier paleta) -> rol, por tipo."""
+    reverse = {"surface": {"white": "card_bg"}, "text": {}}
+    for palette in PALETTES.values():
+        for kind, roles in palette.items():
+            for role, value in roles.items():
+                reverse[kind].setdefault(value.lower(), role)
+    return reverse
+
+
+_reverse = _build_reverse_maps()
+_mode = "light"          # preferencia elegida: light, dark o system
+_applied = "light"       # paleta efectiva
+# widget -> [{opción: (tipo, rol)}, paleta aplicada]; se descarta solo al destruir el widget
+_registry = weakref.WeakKeyDictionary()
+_supported_options = {}  # clase -> opciones de color que admite su cget
+
+
+def color(role, kind="surface"):
+    """Color actual de un rol, para los widgets que cambian de color en tiempo de ejecución."""
+    return PALETTES[_applied][kind][role]
+
+
+def configure(widget, **options):
+    """
+    `widget.configure` para cambios de color en tiempo de ejecución (selección,
+    hover, estado): vuelve a leer los roles del widget para que el próximo
+    cambio de tema no restaure el color anterior.
+    """
+    widget.configure(**options)
+    if widget in _registry:
+        _registry[widget] = [_discover_roles(widget), _applied]
+
+
+def current_mode():
+    return _mode
+
+
+def resolve_mode(mode):
+    if mode == "system":
+        try:
+            import darkdetect
+            return "dark" if (darkdetect.theme() or "").lower() == "dark" else "light"
+        except Exception:
+            return "light"
+    return mode
+
+
+def load_preference():
+    try:
+        with open(PREFERENCES_FILE) as f:
+            mode = json.load(f).get("theme", "light")
+        return mode if mode in THEME_LABELS else "light"
+    except (OSError, ValueError):
+        return "light"
+
+
+def save_preference(mode):
+    try:
+        data = {}
+        if PREFERENCES_FILE.exists():
+            with open(PREFERENCES_FILE) as f:
+                data = json.load(f)
+        data["theme"] = mode
+        PREFERENCES_FILE.parent.mkdir(exist_ok=True)
+        with open(PREFERENCES_FILE, "w") as f:
+            json.dump(data, f)
+    except (OSError, ValueError) as e:
+        logging.error(f"No se pudo guardar la preferencia de tema: {e}")
+
+
+def install(root):
+    """Engancha el tema a los widgets que se van mapeando (filas nuevas, estados, diálogos)."""
+    root.bind_all("<Map>", _on_map, add="+")
+
+
+def set_theme(mode, root=None, persist=True):
+    """
+    Cambia la paleta y re-tiñe en el lugar los widgets visibles bajo `root`.
+    Las páginas ocultas en cache se actualizan al volver a mostrarse
+    (`apply_to`) y los widgets nuevos al mapearse.
+    """
+    global _mode, _applied
+    start = time.perf_counter()
+    _mode = mode
+    _applied = resolve_mode(mode)
+    _retheme_palettes()
+    if persist:
+        save_preference(mode)
+    # Los widgets con colores (claro, oscuro) del tema por defecto de
+    # CustomTkinter siguen el modo de apariencia, no la paleta
+    if ctk.get_appearance_mode().lower() != _applied:
+        ctk.set_appearance_mode(_applied)
+
+    recolored = apply_to(root) if root is not None else 0
+    logging.info(
+        f"Tema '{mode}' aplicado: {recolored} widgets en {(time.perf_counter() - start) * 1000:.1f} ms"
+    )
+
+
+def apply_to(widget):
+    """Re-tiñe los widgets mapeados del subárbol que no tengan la paleta actual."""
+    recolored = 0
+    stack = [widget]
+    while stack:
+        current = stack.pop()
+        try:
+            if current is not widget and not current.winfo_ismapped():
+                continue   # subárbol oculto: se actualiza cuando se muestre
+            children = current.winfo_children()
+        except Exception:
+            continue
+        if isinstance(current, _THEMED_TYPES) and _recolor(current):
+            recolored += 1
+        stack.extend(children)
+    return recolored
+
+
+def _on_map(event):
+    widget = event.widget
+    if not isinstance(widget, _THEMED_TYPES):
+        return
+    entry = _registry.get(widget)
+    # Los widgets se construyen con los colores claros de config.py
+    if entry is None and _applied == "light":
+        return
+    if entry is None or entry[1] != _applied:
+        # Al volver a mostrarse (página en cache, fila reciclada) los hijos no
+        # reciben su propio <Map>, así que se recorre el subárbol completo
+        apply_to(widget)
+
+
+def _recolor(widget):
+    entry = _registry.get(widget)
+    if entry is None:
+        entry = _registry[widget] = [_discover_roles(widget), "light"]
+    roles, applied = entry
+    if applied == _applied:
+        return False
+
+    palette = PALETTES[_applied]
+    changes = {}
+    for option, (kind, role) in roles.items():
+        target = palette[kind][role]
+        if str(widget.cget(option)).lower() != target.lower():
+            changes[option] = target
+    entry[1] = _applied
+    if changes:
+        try:
+            widget.configure(**changes)
+        except Exception as e:
+            logging.debug(f"No se pudo re-teñir {widget}: {e}")
+    return bool(changes)
+
+
+def _discover_roles(widget):
+    """Averigua qué rol de la paleta cumple cada opción de color del widget."""
+    options = _supported_options.get(type(widget))
+    if options is None:
+        options = []
+        for option in _TEXT_OPTIONS + _SURFACE_OPTIONS:
+            try:
+                widget.cget(option)
+                options.append(option)
+            except Exception:
+                pass
+        _supported_options[type(widget)] = options
+
+    roles = {}
+    for option in options:
+        value = widget.cget(option)
+        if not isinstance(value, str):
+            continue   # tuplas (claro, oscuro) del tema por defecto de CustomTkinter
+        kind = "text" if option in _TEXT_OPTIONS else "surface"
+        role = _reverse[kind].get(value.lower())
+        if role:
+            roles[option] = (kind, role)
+    return roles
+
+
+def _retheme_palettes():
+    """Traduce en el lugar los diccionarios compartidos de styles.get_colors."""
+    for group in ("main", "sidebar", "login"):
+        palette = styles.get_colors(group)
+        for key, value in palette.items():
+            kind = "text" if "text" in key else "surface"
+            role = _reverse[kind].get(str(value).lower())
+            if role:
+                palette[key] = PALETTES[_applied][kind][role]
@@ -1,5 +1,6 @@
 import customtkinter as ctk
 from typing import List, Callable, Optional
+from src.ui.styles import get_font
 
 class CTkListbox(ctk.CTkScrollableFrame):
     """
@@ -90,7 +91,7 @@ class CTkListbox(ctk.CTkScrollableFrame):
             anchor="w",
             height=32,
             corner_radius=6,
-            font=ctk.CTkFont(size=12),
+            font=get_font(size=12),
             command=lambda: self._on_button_click(index)
         )
         button.pack(fill="x", pady=1, padx=5)
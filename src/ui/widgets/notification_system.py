@@ -1,6 +1,7 @@
 # notification_system.py (Refactored for CustomTkinter)
 
 import customtkinter as ctk
+from src.ui.styles import get_font
 
 # Colores predefinidos que puedes usar. Podrías moverlos a un archivo de configuración.
 SUCCESS_COLOR = "#2a9d8f"
@@ -38,13 +39,13 @@ class NotificationSystem:
         notif_frame.pack(pady=4, padx=10, fill='x', anchor='e')
         
         if icon:
-            icon_label = ctk.CTkLabel(notif_frame, text=icon, font=ctk.CTkFont(size=16, weight="bold"))
+            icon_label = ctk.CTkLabel(notif_frame, text=icon, font=get_font(size=16, weight="bold"))
             icon_label.pack(side="left", padx=(10, 5))
         
         message_label = ctk.CTkLabel(notif_frame, text=message, wraplength=350, justify="left")
         message_label.pack(side="left", fill='x', expand=True, padx=(0, 10), pady=10)
         
-        close_btn = ctk.CTkLabel(notif_frame, text="×", font=ctk.CTkFont(size=18, weight="bold"), cursor="hand2")
+        close_btn = ctk.CTkLabel(notif_frame, text="×", font=get_font(size=18, weight="bold"), cursor="hand2")
         close_btn.pack(side="right", padx=(0, 10))
         close_btn.bind("<Button-1>", lambda e: self.remove_notification(notification_id))
         
@@ -0,0 +1,263 @@
+# src/ui/widgets/virtual_list.py
+
+import math
+import sys
+import tkinter as tk
+import weakref
+import customtkinter as ctk
+from typing import Callable, List, Optional
+
+# Raíces de Tk donde ya se instaló el manejador de la rueda (uno por intérprete)
+_wheel_roots = weakref.WeakSet()
+
+
+def _install_mousewheel(root):
+    """
+    Agrega (sin reemplazar los de CTkScrollableFrame) un manejador global de
+    la rueda que desplaza la VirtualList que contiene al widget bajo el puntero.
+    """
+    if root in _wheel_roots:
+        return
+    for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+        root.bind_all(sequence, _dispatch_mousewheel, add="+")
+    _wheel_roots.add(root)
+
+
+def _dispatch_mousewheel(event):
+    widget = event.widget
+    # En algunos eventos (menús, popdowns de combobox) `widget` es sólo un nombre
+    while widget is not None and not isinstance(widget, str):
+        if isinstance(widget, VirtualList):
+            widget._on_mousewheel(event)
+            return
+        widget = getattr(widget, "master", None)
+
+
+class VirtualList(ctk.CTkFrame):
+    """
+    Lista virtualizada de filas de alto fijo. Sólo crea los widgets necesarios
+    para llenar el área visible (más un margen de `overscan` filas) y los
+    reutiliza al hacer scroll, volviendo a enlazarlos con otros datos. El costo
+    de scrollear 10.000 elementos es el mismo que el de scrollear 20.
+
+    - `row_factory(parent)` crea un widget de fila vacío.
+    - `bind_row(row, item, index)` vuelca los datos de `item` en la fila.
+    - `on_near_end()` (opcional) se llama al acercarse al final, para paginar.
+    - `inner_padding` separa el contenido del borde (útil con corner_radius).
+    """
+
+    def __init__(self, master, row_height: int, row_factory: Callable, bind_row: Callable,
+                 on_near_end: Optional[Callable] = None, overscan: int = 2, row_spacing: int = 0,
+                 inner_padding: int = 0, **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.row_height = row_height
+        self.row_spacing = row_spacing
+        self.row_factory = row_factory
+        self.bind_row = bind_row
+        self.on_near_end = on_near_end
+        self.overscan = overscan
+
+        self.items: List = []
+        self._offset = 0           # desplazamiento actual en píxeles reales
+        self._rows = []            # pool de filas: [widget, window_id, índice enlazado]
+        self._viewport_height = 0
+        self._viewport_width = 0
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self._canvas = tk.Canvas(self, highlightthickness=0, borderwidth=0, bg=self._canvas_bg())
+        self._canvas.grid(row=0, column=0, sticky="nsew", padx=(inner_padding, 0), pady=inner_padding)
+
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.grid(row=0, column=1, sticky="ns", padx=(0, inner_padding), pady=inner_padding)
+
+        # Frame superpuesto para estados de carga, vacío o error
+        self.placeholder = ctk.CTkFrame(self, fg_color="transparent")
+
+        self._canvas.bind("<Configure>", self._on_viewport_configure)
+        _install_mousewheel(self._root())
+
+    # --- API pública ---
+
+    def set_items(self, items):
+        """Reemplaza todos los elementos y vuelve al inicio."""
+        self.items = list(items)
+        self._offset = 0
+        self._render(force=True)
+
+    def append_items(self, items):
+        """Agrega elementos al final conservando la posición del scroll."""
+        self.items.extend(items)
+        self._render()
+
+    def update_item(self, index, item):
+        """Reemplaza un elemento y, si está visible, reenlaza sólo su fila."""
+        self.items[index] = item
+        for row in self._rows:
+            if row[2] == index:
+                self.bind_row(row[0], item, index)
+
+    def insert_item(self, index, item):
+        """Inserta un elemento; sólo se reenlazan las filas visibles desde `index`."""
+        self.items.insert(index, item)
+        self._invalidate_from(index)
+        self._render()
+
+    def remove_item(self, index):
+        """Quita un elemento; sólo se reenlazan las filas visibles desde `index`."""
+        del self.items[index]
+        self._invalidate_from(index)
+        self._render()
+
+    def refresh(self):
+        """Vuelve a enlazar las filas visibles (por ejemplo, tras cambiar la selección)."""
+        self._render(force=True)
+
+    def scroll_to_index(self, index):
+        """Desplaza la vista para que `index` quede visible."""
+        stride = self._stride()
+        top = index * stride
+        if top < self._offset:
+            self._offset = top
+        elif top + stride > self._offset + self._viewport_height:
+            self._offset = top + stride - self._viewport_height
+        self._render()
+
+    def show_placeholder(self):
+        """Limpia y muestra el frame superpuesto; el llamador lo rellena."""
+        for widget in self.placeholder.winfo_children():
+            widget.destroy()
+        self.placeholder.place(relx=0, rely=0, relwidth=1, relheight=1)
+        return self.placeholder
+
+    def hide_placeholder(self):
+        self.placeholder.place_forget()
+
+    # --- Geometría y render ---
+
+    def _invalidate_from(self, index):
+        """Marca como desenlazadas las filas cuyo elemento se corrió de posición."""
+        for row in self._rows:
+            if row[2] is not None and row[2] >= index:
+                row[2] = None
+
+    def _scaling(self):
+        return ctk.ScalingTracker.get_widget_scaling(self)
+
+    def _stride(self):
+        """Alto real (en píxeles) de una fila más su separación."""
+        return round((self.row_height + self.row_spacing) * self._scaling())
+
+    def _content_height(self):
+        return len(self.items) * self._stride()
+
+    def _max_offset(self):
+        return max(0, self._content_height() - self._viewport_height)
+
+    def _ensure_pool(self):
+        stride = self._stride()
+        needed = math.ceil(self._viewport_height / stride) + 1 + 2 * self.overscan if stride else 0
+        row_px = round(self.row_height * self._scaling())
+        while len(self._rows) < needed:
+            widget = self.row_factory(self._canvas)
+            window_id = self._canvas.create_window(
+                0, 0, window=widget, anchor="nw", width=self._viewport_width, height=row_px, state="hidden"
+            )
+            self._rows.append([widget, window_id, None])
+
+    def _render(self, force=False):
+        if self._viewport_height <= 1:
+            return
+        self._ensure_pool()
+
+        self._offset = min(max(0, self._offset), self._max_offset())
+        stride = self._stride()
+        pool_size = len(self._rows)
+        first = max(0, self._offset // stride - self.overscan)
+
+        for index in range(first, first + pool_size):
+            # Cada índice siempre cae en el mismo slot: al scrollear poco,
+            # las filas que siguen visibles no se vuelven a enlazar.
+            row = self._rows[index % pool_size]
+            widget, window_id, bound_index = row
+            if index >= len(self.items):
+                self._canvas.itemconfigure(window_id, state="hidden")
+                row[2] = None
+                continue
+            if force or bound_index != index:
+                self.bind_row(widget, self.items[index], index)
+                row[2] = index
+            self._canvas.coords(window_id, 0, index * stride - self._offset)
+            self._canvas.itemconfigure(window_id, state="normal")
+
+        self._update_scrollbar()
+        self._check_near_end()
+
+    def _update_scrollbar(self):
+        total = self._content_height()
+        if total <= self._viewport_height or total == 0:
+            self._scrollbar.set(0, 1)
+        else:
+            first = self._offset / total
+            self._scrollbar.set(first, first + self._viewport_height / total)
+
+    def _check_near_end(self):
+        if not self.on_near_end:
+            return
+        remaining = self._content_height() - (self._offset + self._viewport_height)
+        if remaining <= self._viewport_height * 0.5:
+            self.on_near_end()
+
+    def _on_viewport_configure(self, event):
+        self._viewport_height = event.height
+        if event.width != self._viewport_width:
+            self._viewport_width = event.width
+            for _, window_id, _ in self._rows:
+                self._canvas.itemconfigure(window_id, width=event.width)
+        self._render()
+
+    # --- Scroll ---
+
+    def _scroll_by(self, pixels):
+        new_offset = min(max(0, self._offset + pixels), self._max_offset())
+        if new_offset != self._offset:
+            self._offset = new_offset
+            self._render()
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self._offset = int(float(value) * self._content_height())
+            self._render()
+        elif action == "scroll":
+            step = self._viewport_height if unit == "pages" else self._stride()
+            self._scroll_by(int(value) * step)
+
+    def _on_mousewheel(self, event):
+        if event.num == 4:
+            direction = -1
+        elif event.num == 5:
+            direction = 1
+        elif sys.platform == "darwin":
+            direction = -event.delta
+        else:
+            direction = -event.delta / 120
+        self._scroll_by(int(direction * self._stride()))
+
+    # --- Apariencia ---
+
+    def _canvas_bg(self):
+        color = self._fg_color if self._fg_color != "transparent" else self._detect_color_of_master()
+        return self._apply_appearance_mode(color)
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self._canvas.configure(bg=self._canvas_bg())
+
+    def configure(self, require_redraw=False, **kwargs):
+        # El canvas es de tkinter puro: hay que seguir los cambios de color a mano (tema)
+        repaint = "fg_color" in kwargs or "bg_color" in kwargs
+        super().configure(require_redraw=require_redraw, **kwargs)
+        if repaint:
+            self._canvas.configure(bg=self._canvas_bg())
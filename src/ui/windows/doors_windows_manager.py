@@ -2,12 +2,16 @@
 
 import customtkinter as ctk
 from tkinter import messagebox
+from src.database.changeset import ChangeSet, apply_changeset
 from config import FONT_SIZE_NORMAL, FONT_SIZE_SMALL, ACCENT_PRIMARY, ACCENT_HOVER, BORDER_PRIMARY, ERROR_COLOR, SUCCESS_COLOR, TRANSPARENT_BG
+from src.ui.styles import get_font
 
 class DoorsWindowsManager(ctk.CTkToplevel):
-    def __init__(self, master, supabase_client, area_data):
+    def __init__(self, master, supabase_client, area_data, query_executor, on_saved=None):
         super().__init__(master)
         self.supabase_client = supabase_client
+        self.query_executor = query_executor
+        self.on_saved = on_saved
         self.area_data = area_data
         
         self.area_name = area_data['areas_maestro']['nombre_area']
@@ -37,7 +41,7 @@ class DoorsWindowsManager(ctk.CTkToplevel):
         self.grid_rowconfigure(1, weight=1)
 
         # --- TÍTULO ---
-        title_label = ctk.CTkLabel(self, text=f"Gestionar para: {self.area_name}", font=ctk.CTkFont(size=18, weight="bold"))
+        title_label = ctk.CTkLabel(self, text=f"Gestionar para: {self.area_name}", font=get_font(size=18, weight="bold"))
         title_label.grid(row=0, column=0, padx=20, pady=(20, 10))
 
         # --- CONTENEDOR PRINCIPAL ---
@@ -55,7 +59,7 @@ class DoorsWindowsManager(ctk.CTkToplevel):
 
         doors_header = ctk.CTkFrame(doors_container)
         doors_header.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
-        ctk.CTkLabel(doors_header, text="🚪 Puertas", font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold")).pack(side="left")
+        ctk.CTkLabel(doors_header, text="🚪 Puertas", font=get_font(size=FONT_SIZE_NORMAL, weight="bold")).pack(side="left")
         ctk.CTkButton(doors_header, text="+ Añadir", width=80, command=self._add_door_entry).pack(side="right")
 
         doors_content = ctk.CTkFrame(doors_container)
@@ -71,7 +75,7 @@ class DoorsWindowsManager(ctk.CTkToplevel):
 
         windows_header = ctk.CTkFrame(windows_container)
         windows_header.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
-        ctk.CTkLabel(windows_header, text="🪟 Ventanas", font=ctk.CTkFont(size=FONT_SIZE_NORMAL, weight="bold")).pack(side="left")
+        ctk.CTkLabel(windows_header, text="🪟 Ventanas", font=get_font(size=FONT_SIZE_NORMAL, weight="bold")).pack(side="left")
         ctk.CTkButton(windows_header, text="+ Añadir", width=80, command=self._add_window_entry).pack(side="right")
 
         windows_content = ctk.CTkFrame(windows_container)
@@ -83,21 +87,22 @@ class DoorsWindowsManager(ctk.CTkToplevel):
         button_frame = ctk.CTkFrame(self)
         button_frame.grid(row=2, column=0, padx=20, pady=20, sticky="e")
 
-        save_button = ctk.CTkButton(button_frame, text="Guardar y Cerrar", command=self._save_changes, fg_color=SUCCESS_COLOR, hover_color="#059669")
-        save_button.pack(side="right")
+        self.save_button = ctk.CTkButton(button_frame, text="Guardar y Cerrar", command=self._save_changes, fg_color=SUCCESS_COLOR, hover_color="#059669")
+        self.save_button.pack(side="right")
         
         cancel_button = ctk.CTkButton(button_frame, text="Cancelar", command=self.destroy, fg_color="gray", text_color="black", border_color=BORDER_PRIMARY, border_width=2)
         cancel_button.pack(side="right", padx=10)
 
     def _load_initial_data(self):
-        try:
-            self.initial_doors = self.supabase_client.table("puertas").select("*").eq("proyectos_areas_id", self.area_id).execute().data
-            for door in self.initial_doors: self._add_door_entry(door)
+        # Las aberturas llegan dentro de area_data (grafo del proyecto cargado por la página)
+        self.initial_doors = list(self.area_data.get('puertas', []))
+        self.initial_windows = list(self.area_data.get('ventanas', []))
+        for door in self.initial_doors: self._add_door_entry(door)
+        for window in self.initial_windows: self._add_window_entry(window)
 
-            self.initial_windows = self.supabase_client.table("ventanas").select("*").eq("proyectos_areas_id", self.area_id).execute().data
-            for window in self.initial_windows: self._add_window_entry(window)
-        except Exception as e:
-            messagebox.showerror("Error", f"No se pudieron cargar los datos existentes: {e}", parent=self)
+    def destroy(self):
+        self.query_executor.cancel_owner(self)
+        super().destroy()
 
     def _add_door_entry(self, data=None):
         self._add_item_entry(self.doors_scroll_frame, self.door_entries, "puertas", data)
@@ -113,17 +118,18 @@ class DoorsWindowsManager(ctk.CTkToplevel):
         row_frame = ctk.CTkFrame(parent, fg_color=("gray90", "gray20"))
         row_frame.pack(fill="x", pady=2, padx=2)
 
-        ctk.CTkLabel(row_frame, text="Ancho (m):", font=ctk.CTkFont(size=FONT_SIZE_SMALL)).pack(side="left", padx=10)
+        ctk.CTkLabel(row_frame, text="Ancho (m):", font=get_font(size=FONT_SIZE_SMALL)).pack(side="left", padx=10)
         ancho_entry = ctk.CTkEntry(row_frame, width=80)
         ancho_entry.insert(0, str(ancho))
         ancho_entry.pack(side="left")
 
-        ctk.CTkLabel(row_frame, text="Alto (m):", font=ctk.CTkFont(size=FONT_SIZE_SMALL)).pack(side="left", padx=10)
+        ctk.CTkLabel(row_frame, text="Alto (m):", font=get_font(size=FONT_SIZE_SMALL)).pack(side="left", padx=10)
         alto_entry = ctk.CTkEntry(row_frame, width=80)
         alto_entry.insert(0, str(alto))
         alto_entry.pack(side="left")
         
-        entry_data = {'id': item_id, 'ancho_var': ancho_entry, 'alto_var': alto_entry, 'frame': row_frame}
+        entry_data = {'id': item_id, 'ancho_var': ancho_entry, 'alto_var': alto_entry, 'frame': row_frame,
+                      'border_color': ancho_entry.cget("border_color")}
         entry_list.append(entry_data)
         
         delete_button = ctk.CTkButton(row_frame, text="🗑️", width=30, fg_color="transparent", text_color=ERROR_COLOR, hover_color="#FEE2E2", command=lambda e=entry_data: self._mark_for_deletion(e))
@@ -145,28 +151,117 @@ class DoorsWindowsManager(ctk.CTkToplevel):
         entry_data['delete_button'].configure(text="🗑️", fg_color="transparent", text_color=ERROR_COLOR, hover_color="#FEE2E2", command=lambda e=entry_data: self._mark_for_deletion(e))
     
     def _save_changes(self):
-        try:
-            self._process_items("puertas", self.door_entries, self.initial_doors)
-            self._process_items("ventanas", self.window_entries, self.initial_windows)
-            messagebox.showinfo("Éxito", "Los cambios se guardaron correctamente.", parent=self)
+        changesets = []
+        validation_errors = []
+        for table_name, entries, initial_data in (
+            ("puertas", self.door_entries, self.initial_doors),
+            ("ventanas", self.window_entries, self.initial_windows),
+        ):
+            changeset, errors = self._build_changeset(table_name, entries, initial_data)
+            validation_errors.extend(errors)
+            if not changeset.is_empty():
+                changesets.append(changeset)
+
+        if validation_errors:
+            self._report_row_errors(validation_errors)
+            return
+        if not changesets:
             self.destroy()
-        except Exception as e:
-            messagebox.showerror("Error", f"No se pudieron guardar los cambios: {e}", parent=self)
+            return
+
+        self.save_button.configure(state="disabled", text="Guardando...")
+        self.query_executor.submit(
+            lambda: [apply_changeset(self.supabase_client, changeset) for changeset in changesets],
+            on_success=self._on_changes_saved,
+            on_error=self._on_save_error,
+            owner=self
+        )
 
-    def _process_items(self, table_name, entries, initial_data):
+    def _build_changeset(self, table_name, entries, initial_data):
+        """Arma el ChangeSet de una tabla y valida cada fila antes de enviar nada."""
         pk_name = f'id_{"puertas" if "puerta" in table_name else "ventanas"}'
         initial_ids = {item.get(pk_name) for item in initial_data}
+        changeset = ChangeSet(table_name, pk_name)
+        errors = []
+
         for entry in entries:
             entry_id = entry.get('id')
             is_marked_for_deletion = entry.get('deleted', False)
-            ancho = float(entry['ancho_var'].get() or 0)
-            alto = float(entry['alto_var'].get() or 0)
-            
+
             if entry_id and is_marked_for_deletion:
-                self.supabase_client.table(table_name).delete().eq(pk_name, entry_id).execute()
+                changeset.add_delete(entry_id, ref=entry)
+                continue
             elif is_marked_for_deletion:
                 continue
-            elif entry_id in initial_ids:
-                self.supabase_client.table(table_name).update({"ancho": ancho, "alto": alto}).eq(pk_name, entry_id).execute()
+
+            entry['ancho_var'].configure(border_color=entry['border_color'])
+            entry['alto_var'].configure(border_color=entry['border_color'])
+            try:
+                ancho = float(entry['ancho_var'].get() or 0)
+                alto = float(entry['alto_var'].get() or 0)
+            except ValueError:
+                errors.append((entry, "las medidas deben ser números válidos"))
+                continue
+
+            if entry_id in initial_ids:
+                changeset.add_upsert({pk_name: entry_id, "ancho": ancho, "alto": alto, "proyectos_areas_id": self.area_id}, ref=entry)
             elif not entry_id:
-                self.supabase_client.table(table_name).insert({"ancho": ancho, "alto": alto, "proyectos_areas_id": self.area_id}).execute()
\ No newline at end of file
+                changeset.add_upsert({"ancho": ancho, "alto": alto, "proyectos_areas_id": self.area_id}, ref=entry)
+
+        return changeset, errors
+
+    def _on_changes_saved(self, results):
+        errors = []
+        for result in results:
+            pk_name = result.changeset.pk_name
+            # Las filas que sí se guardaron quedan marcadas para no repetirlas al reintentar
+            for entry, saved_row in result.saved:
+                entry['id'] = saved_row.get(pk_name, entry.get('id'))
+                if result.changeset.table_name == "puertas":
+                    self._remember_initial(self.initial_doors, pk_name, saved_row)
+                else:
+                    self._remember_initial(self.initial_windows, pk_name, saved_row)
+            for entry in result.deleted:
+                entry['id'] = None
+            errors.extend(result.errors)
+
+        if errors:
+            self.save_button.configure(state="normal", text="Guardar y Cerrar")
+            self._report_row_errors(errors)
+            return
+
+        if self.on_saved:
+            self.on_saved(self.area_id, self._current_rows("puertas", self.door_entries), self._current_rows("ventanas", self.window_entries))
+        messagebox.showinfo("Éxito", "Los cambios se guardaron correctamente.", parent=self)
+        self.destroy()
+
+    def _current_rows(self, table_name, entries):
+        """Estado guardado de las filas, para actualizar el modelo del proyecto."""
+        pk_name = f'id_{"puertas" if "puerta" in table_name else "ventanas"}'
+        return [
+            {pk_name: entry['id'], "ancho": float(entry['ancho_var'].get() or 0),
+             "alto": float(entry['alto_var'].get() or 0), "proyectos_areas_id": self.area_id}
+            for entry in entries if entry.get('id') and not entry.get('deleted', False)
+        ]
+
+    def _remember_initial(self, initial_data, pk_name, saved_row):
+        if saved_row.get(pk_name) is not None and all(item.get(pk_name) != saved_row[pk_name] for item in initial_data):
+            initial_data.append(saved_row)
+
+    def _on_save_error(self, error):
+        self.save_button.configure(state="normal", text="Guardar y Cerrar")
+        messagebox.showerror("Error", f"No se pudieron guardar los cambios: {error}", parent=self)
+
+    def _report_row_errors(self, errors):
+        """Resalta las filas con error y las lista en un único mensaje."""
+        lines = []
+        for entry, message in errors:
+            if entry in self.door_entries:
+                label = f"Puerta {self.door_entries.index(entry) + 1}"
+            else:
+                label = f"Ventana {self.window_entries.index(entry) + 1}"
+            lines.append(f"• {label}: {message}")
+            entry['ancho_var'].configure(border_color=ERROR_COLOR)
+            entry['alto_var'].configure(border_color=ERROR_COLOR)
+
+        messagebox.showerror("Error", "No se pudieron guardar algunas filas:\n\n" + "\n".join(lines), parent=self)
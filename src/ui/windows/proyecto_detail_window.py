@@ -2,6 +2,7 @@
 
 import customtkinter as ctk
 from tkinter import messagebox
+from src.ui.styles import get_font
 # Ya no necesitamos la configuración de colores manual
 # from config import *
 
@@ -25,9 +26,9 @@ class ProyectoDetailWindow(ctk.CTkToplevel):
         info_frame.grid(row=0, column=0, sticky="ew", padx=20, pady=(20, 0))
 
         ctk.CTkLabel(info_frame, text=f"Proyecto: {proyecto['nombre_proyecto']}", 
-                     font=ctk.CTkFont(size=20, weight="bold")).pack(anchor='w', padx=10, pady=(5,0))
+                     font=get_font(size=20, weight="bold")).pack(anchor='w', padx=10, pady=(5,0))
         ctk.CTkLabel(info_frame, text=f"Dirección: {proyecto['direccion_proyecto']}",
-                     font=ctk.CTkFont(size=14)).pack(anchor='w', padx=10, pady=(0,5))
+                     font=get_font(size=14)).pack(anchor='w', padx=10, pady=(0,5))
 
         # --- Reemplazo de ttk.Notebook con ctk.CTkTabview ---
         self.tab_view = ctk.CTkTabview(self, corner_radius=8)
@@ -1,12 +1,14 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from config import * # Solo para los tamaños
+from src.ui.styles import get_font
 
 class ProyectoFormWindow(ctk.CTkToplevel):
     def __init__(self, master, callback, **kwargs):
         super().__init__(master, **kwargs)
         
         self.supabase_client = master.supabase_client
+        self.delta_sync = master.delta_sync
         self.callback = callback
         self.areas_data = []
         self.area_checkboxes = []
@@ -19,7 +21,7 @@ class ProyectoFormWindow(ctk.CTkToplevel):
         self.transient(master)
 
         # --- CORRECCIÓN DE FUENTE ---
-        title_label = ctk.CTkLabel(self, text="Detalles del Nuevo Proyecto", font=ctk.CTkFont(size=FONT_SIZE_LARGE, weight="bold"))
+        title_label = ctk.CTkLabel(self, text="Detalles del Nuevo Proyecto", font=get_font(size=FONT_SIZE_LARGE, weight="bold"))
         title_label.pack(pady=20, padx=30)
 
         form_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -81,6 +83,8 @@ class ProyectoFormWindow(ctk.CTkToplevel):
             if areas_to_link:
                 self.supabase_client.table("proyectos_areas").insert(areas_to_link).execute()
 
+            self.delta_sync.apply_local_write("proyectos", proyecto_response.data)
+
             messagebox.showinfo("Éxito", "Proyecto creado correctamente.", parent=self)
             self.callback()
             self.destroy()
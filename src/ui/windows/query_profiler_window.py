@@ -0,0 +1,90 @@
+# src/ui/windows/query_profiler_window.py
+
+import customtkinter as ctk
+from tkinter import filedialog, messagebox
+from config import FONT_SIZE_NORMAL, FONT_SIZE_SMALL, ACCENT_PRIMARY, ACCENT_HOVER, TRANSPARENT_BG
+from src.database.query_profiler import profiler
+from src.ui.styles import get_font
+
+# Cada cuánto se redibuja el panel mientras está abierto
+REFRESH_INTERVAL_MS = 1000
+
+
+class QueryProfilerWindow(ctk.CTkToplevel):
+    """Panel de depuración: consultas por acción de la interfaz y últimas consultas."""
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.title("Perfil de consultas")
+        self.geometry("900x600")
+        self._after_id = None
+
+        self._build_ui()
+        self.refresh()
+
+    def _build_ui(self):
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        toolbar = ctk.CTkFrame(self, fg_color=TRANSPARENT_BG)
+        toolbar.grid(row=0, column=0, sticky="ew", padx=15, pady=(15, 5))
+        ctk.CTkLabel(
+            toolbar, text="🔍 Consultas por acción", font=get_font(size=FONT_SIZE_NORMAL, weight="bold")
+        ).pack(side="left")
+        for text, command in (("💾 Exportar", self._export), ("🧹 Limpiar", self._clear)):
+            ctk.CTkButton(
+                toolbar, text=text, width=110, command=command,
+                fg_color=ACCENT_PRIMARY, hover_color=ACCENT_HOVER
+            ).pack(side="right", padx=(5, 0))
+
+        self.textbox = ctk.CTkTextbox(self, font=get_font(size=FONT_SIZE_SMALL, family="Consolas"), wrap="none")
+        self.textbox.grid(row=1, column=0, sticky="nsew", padx=15, pady=(5, 15))
+
+    def refresh(self):
+        lines = [f"{'Acción':<40}{'Llamadas':>9}{'Espera (ms)':>13}{'Filas':>8}{'KB':>9}  Tablas"]
+        for item in profiler.summary():
+            lines.append(
+                f"{item['action'][:39]:<40}{item['calls']:>9}{item['wait_ms']:>13.1f}"
+                f"{item['rows']:>8}{item['bytes'] / 1024:>9.1f}  {', '.join(item['tables'])}"
+            )
+
+        lines += ["", f"{'Hora':<14}{'Acción':<28}{'Operación':<22}{'Filas':>7}{'ms':>9}  Filtros"]
+        for entry in reversed(profiler.recent(limit=50)):
+            operation = f"{entry['operation']} {entry['table']}"
+            lines.append(
+                f"{entry['at'][11:23]:<14}{entry['action'][:27]:<28}{operation[:21]:<22}"
+                f"{entry['rows']:>7}{entry['latency_ms']:>9.1f}  "
+                f"{entry['error'] or ' '.join(entry['filters'])}"
+            )
+
+        # Se conserva la posición del scroll entre refrescos
+        position = self.textbox.yview()[0]
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self.textbox.insert("1.0", "\n".join(lines))
+        self.textbox.configure(state="disabled")
+        self.textbox.yview_moveto(position)
+
+        self._after_id = self.after(REFRESH_INTERVAL_MS, self.refresh)
+
+    def _clear(self):
+        profiler.clear()
+
+    def _export(self):
+        path = filedialog.asksaveasfilename(
+            parent=self, defaultextension=".json", initialfile="perfil_consultas.json",
+            filetypes=[("JSON", "*.json")]
+        )
+        if not path:
+            return
+        try:
+            profiler.dump(path)
+            messagebox.showinfo("Perfil exportado", f"Se guardó el perfil en:\n{path}", parent=self)
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo guardar el perfil: {e}", parent=self)
+
+    def destroy(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        super().destroy()
@@ -0,0 +1,45 @@
+-- Columnas que necesita la sincronización incremental de proyectos
+-- (src/database/delta_sync.py) y el listado paginado (src/database/pagination.py).
+--
+--   updated_at: momento de la última escritura, mantenido por trigger. La app
+--               pide sólo las filas con updated_at >= la marca de agua local.
+--   deleted_at: tombstone. Las bajas se marcan en vez de borrar la fila para
+--               que viajen en el delta; el listado filtra deleted_at IS NULL.
+--
+-- Mientras esta migración no se aplique, la app sigue funcionando: detecta que
+-- faltan las columnas y vuelve a traer la tabla completa en cada sincronización.
+
+alter table public.proyectos
+    add column if not exists updated_at timestamptz not null default clock_timestamp(),
+    add column if not exists deleted_at timestamptz;
+
+-- updated_at marca el momento de la escritura, no el del commit: una fila
+-- puede hacerse visible después de que la app ya movió su marca de agua más
+-- allá de ese instante. La app lo cubre volviendo a pedir una ventana hacia
+-- atrás en cada sincronización (SYNC_OVERLAP_SECONDS en delta_sync.py), que
+-- debe ser mayor que la transacción más larga sobre proyectos.
+-- clock_timestamp() en vez de now() (inicio de la transacción) sólo achica
+-- ese desfase en transacciones largas; no lo elimina.
+create or replace function public.set_updated_at()
+returns trigger
+language plpgsql
+as $$
+begin
+    new.updated_at := clock_timestamp();
+    return new;
+end;
+$$;
+
+drop trigger if exists proyectos_set_updated_at on public.proyectos;
+create trigger proyectos_set_updated_at
+    before insert or update on public.proyectos
+    for each row execute function public.set_updated_at();
+
+-- Consulta del delta: updated_at >= :marca order by updated_at
+create index if not exists proyectos_updated_at_idx
+    on public.proyectos (updated_at);
+
+-- Listado por keyset (fecha_creacion, id_proyecto) descendente sin los dados de baja
+create index if not exists proyectos_listado_idx
+    on public.proyectos (fecha_creacion desc, id_proyecto desc)
+    where deleted_at is null;
@@ -0,0 +1,29 @@
+# tests/conftest.py
+
+import pytest
+
+
+class FakeTkRoot:
+    """Lo mínimo de Tk que usa QueryExecutor: `after` se ejecuta a mano con `run_pending`."""
+
+    def __init__(self):
+        self._callbacks = {}
+        self._next_id = 0
+
+    def after(self, ms, callback):
+        self._next_id += 1
+        self._callbacks[self._next_id] = callback
+        return self._next_id
+
+    def after_cancel(self, after_id):
+        self._callbacks.pop(after_id, None)
+
+    def run_pending(self):
+        callbacks, self._callbacks = self._callbacks, {}
+        for callback in callbacks.values():
+            callback()
+
+
+@pytest.fixture
+def fake_tk_root():
+    return FakeTkRoot()
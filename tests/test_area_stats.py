@@ -0,0 +1,66 @@
+# tests/test_area_stats.py
+
+import math
+import random
+
+from src.services.area_stats import AreaAggregator, parse_dimension
+
+
+def _recompute(rows):
+    """Totales desde cero, como se calculaban antes de los acumulados."""
+    totals = {'count': len(rows), 'floor_m2': 0.0, 'wall_m2': 0.0, 'volume_m3': 0.0}
+    for ancho, largo, alto in rows.values():
+        ancho, largo, alto = parse_dimension(ancho), parse_dimension(largo), parse_dimension(alto)
+        totals['floor_m2'] += ancho * largo
+        totals['wall_m2'] += 2 * (ancho + largo) * alto
+        totals['volume_m3'] += ancho * largo * alto
+    return totals
+
+
+def _assert_totals_match(aggregator, rows):
+    expected = _recompute(rows)
+    totals = aggregator.totals()
+    assert totals['count'] == expected['count']
+    for key in ('floor_m2', 'wall_m2', 'volume_m3'):
+        assert math.isclose(totals[key], expected[key], rel_tol=1e-9, abs_tol=1e-9), key
+
+
+def test_incremental_totals_match_a_full_recompute():
+    rng = random.Random(0)
+    aggregator, rows = AreaAggregator(), {}
+    for step in range(2000):
+        row_id = rng.randrange(50)
+        if rng.random() < 0.2:
+            aggregator.remove_row(row_id)
+            rows.pop(row_id, None)
+        else:
+            dims = tuple(
+                rng.choice(["", "abc", None, f"{rng.uniform(0, 12):.2f}"]) if rng.random() < 0.1
+                else f"{rng.uniform(0, 12):.2f}"
+                for _ in range(3)
+            )
+            aggregator.set_row(row_id, *dims)
+            rows[row_id] = dims
+        if step % 100 == 0:
+            _assert_totals_match(aggregator, rows)
+    _assert_totals_match(aggregator, rows)
+
+
+def test_update_applies_only_the_difference():
+    aggregator = AreaAggregator()
+    aggregator.set_row(1, "4", "5", "2.5")
+    aggregator.set_row(2, "3", "3", "2.5")
+    aggregator.set_row(1, "4", "6", "2.5")
+
+    assert aggregator.totals() == {'count': 2, 'floor_m2': 33.0, 'wall_m2': 80.0, 'volume_m3': 82.5}
+
+
+def test_removing_every_row_leaves_no_negative_residue():
+    aggregator = AreaAggregator()
+    for row_id in range(10):
+        aggregator.set_row(row_id, "0.1", "0.7", "2.3")
+    aggregator.remove_row(99)
+    for row_id in range(10):
+        aggregator.remove_row(row_id)
+
+    assert aggregator.totals() == {'count': 0, 'floor_m2': 0.0, 'wall_m2': 0.0, 'volume_m3': 0.0}
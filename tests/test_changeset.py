@@ -0,0 +1,47 @@
+# tests/test_changeset.py
+
+from src.database.changeset import ChangeSet, _match_saved_rows, apply_changeset
+from src.database.fake_supabase import FakeSupabaseClient
+
+
+def _client_with_doors():
+    client = FakeSupabaseClient()
+    client.database.load({
+        'proyectos': [{'id_proyecto': 1, 'nombre_proyecto': "Casa"}],
+        'proyectos_areas': [{'id_proyectos_areas': 1, 'proyecto_id': 1}],
+        'puertas': [
+            {'id_puertas': 1, 'proyectos_areas_id': 1, 'ancho': 0.8, 'alto': 2.05},
+            {'id_puertas': 2, 'proyectos_areas_id': 1, 'ancho': 0.9, 'alto': 2.05},
+        ],
+    })
+    return client
+
+
+def test_updates_and_inserts_are_matched_to_their_refs():
+    changeset = ChangeSet("puertas", "id_puertas")
+    changeset.add_upsert({'proyectos_areas_id': 1, 'ancho': 0.7, 'alto': 2.0}, ref="nueva")
+    changeset.add_upsert({'id_puertas': 2, 'proyectos_areas_id': 1, 'ancho': 1.0, 'alto': 2.1}, ref="fila 2")
+    changeset.add_delete(1, ref="fila 1")
+
+    result = apply_changeset(_client_with_doors(), changeset)
+
+    assert result.ok
+    assert result.deleted == ["fila 1"]
+    saved = dict(result.saved)
+    assert saved["fila 2"]['id_puertas'] == 2 and saved["fila 2"]['ancho'] == 1.0
+    assert saved["nueva"]['id_puertas'] not in (1, 2) and saved["nueva"]['ancho'] == 0.7
+
+
+def test_matching_does_not_depend_on_response_order():
+    upserts = [
+        ({'id_puertas': 1, 'ancho': 0.8}, "a"),
+        ({'ancho': 0.7}, "nueva"),
+        ({'id_puertas': 2, 'ancho': 0.9}, "b"),
+    ]
+    saved_rows = [{'id_puertas': 2, 'ancho': 0.9}, {'id_puertas': 7, 'ancho': 0.7}, {'id_puertas': 1, 'ancho': 0.8}]
+
+    assert _match_saved_rows("id_puertas", upserts, saved_rows) == [
+        ("a", {'id_puertas': 1, 'ancho': 0.8}),
+        ("nueva", {'id_puertas': 7, 'ancho': 0.7}),
+        ("b", {'id_puertas': 2, 'ancho': 0.9}),
+    ]
@@ -0,0 +1,136 @@
+# tests/test_delta_sync.py
+
+from postgrest.exceptions import APIError
+
+from src.database.delta_sync import DeltaSync
+from src.database.fake_supabase import FakeSupabaseClient
+from src.database.local_cache import LocalCache
+from src.database import pagination
+from src.database.pagination import fetch_projects_page
+
+
+def _proyecto(id_proyecto, **extra):
+    return dict({
+        'id_proyecto': id_proyecto,
+        'nombre_proyecto': f"Proyecto {id_proyecto}",
+        'fecha_creacion': f"2025-01-{id_proyecto:02d}T00:00:00+00:00",
+    }, **extra)
+
+
+class _LegacySchemaClient:
+    """Cliente falso cuya tabla `proyectos` no tiene las columnas de la migración."""
+
+    MISSING = ("updated_at", "deleted_at")
+
+    def __init__(self, client):
+        self._client = client
+
+    def table(self, name):
+        return _LegacySchemaQuery(self._client.table(name))
+
+
+class _LegacySchemaQuery:
+    def __init__(self, builder):
+        self._builder = builder
+
+    def __getattr__(self, name):
+        attr = getattr(self._builder, name)
+
+        def call(*args, **kwargs):
+            column = next((c for c in _LegacySchemaClient.MISSING if name != "select" and c in map(str, args)), None)
+            if column:
+                raise APIError({'code': "42703", 'message': f"column proyectos.{column} does not exist"})
+            result = attr(*args, **kwargs)
+            return _LegacySchemaQuery(result) if hasattr(result, "execute") else result
+        return call
+
+
+def _legacy_client(rows):
+    client = FakeSupabaseClient()
+    client.database.load({'proyectos': rows})
+    return _LegacySchemaClient(client)
+
+
+def test_sync_falls_back_to_full_fetch_without_delta_columns(tmp_path):
+    cache = LocalCache(db_path=tmp_path / "cache.db")
+    sync = DeltaSync(_legacy_client([_proyecto(1), _proyecto(2)]), cache)
+
+    assert sync.sync("proyectos") == 2
+    assert sync.has_local("proyectos")
+    assert sync.local_count("proyectos") == 2
+    cache.close()
+
+
+def test_full_fetch_drops_rows_deleted_on_the_server(tmp_path):
+    cache = LocalCache(db_path=tmp_path / "cache.db")
+    client = FakeSupabaseClient()
+    client.database.load({'proyectos': [_proyecto(1), _proyecto(2)]})
+    sync = DeltaSync(_LegacySchemaClient(client), cache)
+    sync.sync("proyectos")
+
+    client.table("proyectos").delete().eq("id_proyecto", 2).execute()
+
+    assert sync.sync("proyectos") == 1
+    assert [row['id_proyecto'] for row in cache.get_synced_rows("proyectos")] == [1]
+    cache.close()
+
+
+def test_projects_page_without_tombstone_column(tmp_path):
+    cache = LocalCache(db_path=tmp_path / "cache.db")
+    client = _legacy_client([_proyecto(1), _proyecto(2), _proyecto(3)])
+    sync = DeltaSync(client, cache)
+
+    rows = fetch_projects_page(client, limit=2, delta_sync=sync)
+    assert [row['id_proyecto'] for row in rows] == [3, 2]
+    assert sync.column_missing("proyectos", "deleted_at")
+
+    # Lo recordado es de esta instancia: otra sincronización vuelve a probar
+    assert not DeltaSync(client, cache).column_missing("proyectos", "deleted_at")
+    rows = fetch_projects_page(client, cursor=pagination.cursor_from_row(rows[-1]), delta_sync=sync)
+    assert [row['id_proyecto'] for row in rows] == [1]
+    cache.close()
+
+
+def test_first_sync_without_rows_marks_the_table_as_synced(tmp_path):
+    cache = LocalCache(db_path=tmp_path / "cache.db")
+    client = FakeSupabaseClient()
+    sync = DeltaSync(client, cache)
+
+    assert sync.sync("proyectos") == 0
+    assert sync.has_local("proyectos")
+
+    client.table("proyectos").insert(_proyecto(1)).execute()
+    assert sync.sync("proyectos") == 1
+    assert sync.local_count("proyectos") == 1
+    cache.close()
+
+
+def test_local_pages_count_as_cache_hits(tmp_path):
+    cache = LocalCache(db_path=tmp_path / "cache.db")
+    client = FakeSupabaseClient()
+    client.database.load({'proyectos': [_proyecto(1), _proyecto(2)]})
+    sync = DeltaSync(client, cache)
+    sync.sync("proyectos")
+
+    rows = sync.local_page("proyectos", pagination.PROJECTS_KEYSET, limit=1)
+    assert [row['id_proyecto'] for row in rows] == [2]
+    assert (cache.hits, cache.misses) == (1, 0)
+    cache.close()
+
+
+def test_rows_committed_after_the_watermark_moved_are_still_fetched(tmp_path):
+    cache = LocalCache(db_path=tmp_path / "cache.db")
+    client = FakeSupabaseClient()
+    client.database.load({'proyectos': [_proyecto(1, updated_at="2025-03-01T12:00:10+00:00")]})
+    sync = DeltaSync(client, cache)
+    sync.sync("proyectos")
+    assert cache.get_watermark("proyectos") == "2025-03-01T12:00:10+00:00"
+
+    # Escrita a las 12:00:05 por una transacción que confirmó recién ahora
+    client.database.load({'proyectos': [_proyecto(2, updated_at="2025-03-01T12:00:05+00:00")]})
+
+    assert sync.sync("proyectos") == 1
+    assert sync.local_count("proyectos") == 2
+    # La fila de la ventana de solapamiento no hace retroceder la marca
+    assert cache.get_watermark("proyectos") == "2025-03-01T12:00:10+00:00"
+    cache.close()
@@ -0,0 +1,37 @@
+# tests/test_local_cache.py
+
+import time
+
+from src.database.local_cache import LocalCache
+from src.database.query_executor import QueryExecutor
+
+
+def _read(root, cache, fetched_rows):
+    """read_through de una entrada vencida; devuelve las entregas a `on_data`."""
+    executor = QueryExecutor(root)
+    delivered = []
+    handle = cache.read_through(executor, "proyectos_areas", "1", lambda: fetched_rows, delivered.append)
+
+    deadline = time.monotonic() + 2
+    while not handle.future.done() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    root.run_pending()
+    executor.shutdown()
+    return delivered
+
+
+def test_stale_rows_equal_to_the_server_are_delivered_once(tmp_path, fake_tk_root):
+    cache = LocalCache(db_path=tmp_path / "cache.db", ttls={'proyectos_areas': 0})
+    cache.put("proyectos_areas", "1", [{'id_proyectos_areas': 1, 'ancho': 2.5}])
+
+    assert _read(fake_tk_root, cache, [{'id_proyectos_areas': 1, 'ancho': 2.5}]) == [[{'id_proyectos_areas': 1, 'ancho': 2.5}]]
+    cache.close()
+
+
+def test_stale_rows_are_replaced_when_the_server_changed(tmp_path, fake_tk_root):
+    cache = LocalCache(db_path=tmp_path / "cache.db", ttls={'proyectos_areas': 0})
+    cache.put("proyectos_areas", "1", [{'id_proyectos_areas': 1, 'ancho': 2.5}])
+
+    delivered = _read(fake_tk_root, cache, [{'id_proyectos_areas': 1, 'ancho': 3.0}])
+    assert delivered == [[{'id_proyectos_areas': 1, 'ancho': 2.5}], [{'id_proyectos_areas': 1, 'ancho': 3.0}]]
+    cache.close()
@@ -0,0 +1,97 @@
+# tests/test_materials_engine.py
+
+import math
+import random
+
+from src.services.materials_engine import (
+    MATERIAL_RATES, areas_to_arrays, compute_materials, compute_portfolio, summarize
+)
+
+
+def _scalar_materials(area, rates=MATERIAL_RATES):
+    """Las fórmulas área por área, sin NumPy."""
+    def num(value):
+        try:
+            return float(value or 0)
+        except (TypeError, ValueError):
+            return 0.0
+
+    ancho, largo, alto = num(area.get('ancho')), num(area.get('largo')), num(area.get('alto'))
+    aberturas = sum(
+        num(o.get('ancho')) * num(o.get('alto'))
+        for o in (area.get('puertas') or []) + (area.get('ventanas') or [])
+    )
+    piso = ancho * largo
+    muros_brutos = 2 * (ancho + largo) * alto
+    muros_netos = max(0.0, muros_brutos - aberturas)
+    litros_por_m2 = rates['pintura_manos'] / rates['pintura_rendimiento_m2_l']
+    bocas = math.ceil(piso / rates['m2_por_boca_electrica'])
+    return {
+        'piso_m2_neto': piso,
+        'muros_brutos_m2': muros_brutos,
+        'muros_netos_m2': muros_netos,
+        'volumen_m3': piso * alto,
+        'pintura_muros_l': muros_netos * litros_por_m2,
+        'pintura_cielorraso_l': piso * litros_por_m2,
+        'techo_m2': piso * (1 + rates['techo_solape']),
+        'piso_m2': piso * (1 + rates['piso_desperdicio']),
+        'ladrillos_u': math.ceil(muros_netos * rates['ladrillos_por_m2'] * (1 + rates['ladrillos_desperdicio'])),
+        'mortero_m3': muros_netos * rates['mortero_m3_por_m2'],
+        'bocas_u': bocas,
+        'cable_m': bocas * rates['cable_m_por_boca'],
+    }
+
+
+def _random_areas(rng, count):
+    def opening():
+        return {'ancho': round(rng.uniform(0.5, 2.0), 2), 'alto': round(rng.uniform(0.5, 2.2), 2)}
+
+    areas = []
+    for _ in range(count):
+        areas.append({
+            'ancho': round(rng.uniform(1, 8), 2),
+            'largo': str(round(rng.uniform(1, 10), 2)),
+            'alto': rng.choice([round(rng.uniform(2.4, 3.2), 2), None, "x"]) if rng.random() < 0.1 else 2.6,
+            'puertas': [opening() for _ in range(rng.randrange(3))],
+            'ventanas': [opening() for _ in range(rng.randrange(4))] if rng.random() < 0.9 else None,
+        })
+    # Aberturas mayores que el muro: la superficie neta no puede ser negativa
+    areas.append({'ancho': 1, 'largo': 1, 'alto': 1, 'puertas': [{'ancho': 5, 'alto': 5}], 'ventanas': []})
+    areas.append({'ancho': 0, 'largo': 0, 'alto': 0})
+    return areas
+
+
+def _assert_close(actual, expected):
+    assert actual.keys() == expected.keys()
+    for key in expected:
+        assert math.isclose(actual[key], expected[key], rel_tol=1e-9, abs_tol=1e-9), key
+
+
+def test_vectorized_results_match_the_scalar_formulas():
+    areas = _random_areas(random.Random(0), 300)
+    results = compute_materials(areas_to_arrays(areas))
+
+    for index, area in enumerate(areas):
+        _assert_close({key: float(values[index]) for key, values in results.items()}, _scalar_materials(area))
+
+
+def test_summary_is_the_sum_of_the_areas():
+    areas = _random_areas(random.Random(1), 50)
+    expected = {}
+    for area in areas:
+        for key, value in _scalar_materials(area).items():
+            expected[key] = expected.get(key, 0.0) + value
+
+    _assert_close(summarize(compute_materials(areas_to_arrays(areas))), expected)
+
+
+def test_portfolio_matches_each_project_computed_alone():
+    rng = random.Random(2)
+    areas_by_project = {project_id: _random_areas(rng, rng.randrange(0, 20)) for project_id in (7, 3, 11)}
+    areas_by_project[5] = []
+
+    portfolio = compute_portfolio(areas_by_project)
+
+    assert list(portfolio) == [7, 3, 11, 5]
+    for project_id, areas in areas_by_project.items():
+        _assert_close(portfolio[project_id], summarize(compute_materials(areas_to_arrays(areas))))
@@ -0,0 +1,30 @@
+# tests/test_query_executor.py
+
+import time
+
+from src.database import query_profiler
+from src.database.query_executor import QueryExecutor
+
+
+def _wait_for(executor, root, condition, timeout_s=2):
+    deadline = time.monotonic() + timeout_s
+    while not condition() and time.monotonic() < deadline:
+        root.run_pending()
+        time.sleep(0.005)
+    executor.shutdown()
+
+
+def test_callbacks_keep_the_action_of_the_click_that_submitted_them(fake_tk_root):
+    root = fake_tk_root
+    executor = QueryExecutor(root)
+    seen = {}
+
+    with query_profiler.action("clic: Guardar"):
+        executor.submit(
+            lambda: seen.setdefault('worker', query_profiler.current_action()),
+            on_success=lambda _: seen.setdefault('callback', query_profiler.current_action()),
+        )
+    query_profiler.set_action("fondo")
+
+    _wait_for(executor, root, lambda: 'callback' in seen)
+    assert seen == {'worker': "clic: Guardar", 'callback': "clic: Guardar"}
@@ -0,0 +1,35 @@
+# tests/test_query_profiler.py
+
+import json
+
+from src.database.query_profiler import QueryProfiler, action, current_action
+
+
+def test_dump_writes_summary_and_all_queries(tmp_path):
+    profiler = QueryProfiler()
+    with action("clic: Guardar"):
+        profiler.record("proyectos", "select", ["eq(id_proyecto, 1)"], 1, 120, 12.5)
+        profiler.record("proyectos_areas", "upsert", [], 3, 480, 30.0)
+
+    path = tmp_path / "perfil.json"
+    profiler.dump(path)
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert [q['table'] for q in data['queries']] == ["proyectos", "proyectos_areas"]
+    assert data['summary'][0]['action'] == "clic: Guardar"
+    assert data['summary'][0]['calls'] == 2
+
+
+def test_recent_limits_and_none_returns_everything():
+    profiler = QueryProfiler()
+    for i in range(5):
+        profiler.record(f"t{i}", "select", [], 0, 0, 1.0)
+    assert [q['table'] for q in profiler.recent(limit=2)] == ["t3", "t4"]
+    assert len(profiler.recent(limit=None)) == 5
+
+
+def test_action_restores_previous_value():
+    before = current_action()
+    with action("clic: Otro"):
+        assert current_action() == "clic: Otro"
+    assert current_action() == before
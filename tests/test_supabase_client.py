@@ -0,0 +1,59 @@
+# tests/test_supabase_client.py
+
+from types import SimpleNamespace
+
+from src.database import supabase_client
+from src.services.auth_service import AuthService
+
+
+class _RecordingClient:
+    """Cliente ya creado que registra los tokens aplicados a postgrest."""
+
+    def __init__(self):
+        self.applied = []
+        self.supabase_key = "anon-key"
+        self.postgrest = SimpleNamespace(auth=self.applied.append)
+
+    def table(self, name):
+        return name
+
+
+def test_queries_take_the_token_from_auth_service(monkeypatch, tmp_path):
+    client = _RecordingClient()
+    monkeypatch.setattr(supabase_client, "_client", client)
+    monkeypatch.setattr(supabase_client, "_access_token_source", None)
+    monkeypatch.setattr(supabase_client, "_applied_access_token", None)
+    monkeypatch.setattr(AuthService, "_schedule_refresh", lambda self, delay=None: None)
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+
+    lazy = supabase_client.LazySupabaseClient()
+    auth = AuthService(lazy)
+    lazy.table("proyectos")
+    assert client.applied == []
+
+    auth._set_current_session("token-1", "refresh-1")
+    lazy.table("proyectos")
+    lazy.table("proyectos_areas")
+    auth._set_current_session("token-2", "refresh-2")
+    lazy.from_("proyectos")
+
+    assert client.applied == ["token-1", "token-2"]
+
+
+def test_logout_restores_the_anon_key(monkeypatch, tmp_path):
+    client = _RecordingClient()
+    monkeypatch.setattr(supabase_client, "_client", client)
+    monkeypatch.setattr(supabase_client, "_access_token_source", None)
+    monkeypatch.setattr(supabase_client, "_applied_access_token", None)
+    monkeypatch.setattr(AuthService, "_schedule_refresh", lambda self, delay=None: None)
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+
+    lazy = supabase_client.LazySupabaseClient()
+    auth = AuthService(lazy)
+    auth._set_current_session("token-1", "refresh-1")
+    lazy.table("proyectos")
+    auth.clear_session()
+    lazy.table("proyectos")
+    lazy.table("proyectos")
+
+    assert client.applied == ["token-1", "anon-key"]